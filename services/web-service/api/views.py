@@ -178,11 +178,18 @@ class StandingViewSet(viewsets.ModelViewSet):
     serializer_class = StandingSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['competition', 'season', 'team', 'type', 'stage']
+    filterset_fields = ['competition', 'season', 'team', 'type', 'stage', 'snapshot_date']
     search_fields = ['team__name', 'competition__name']
     ordering_fields = ['position', 'points', 'goal_difference', 'snapshot_date']
     ordering = ['position']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Standings are stored as daily snapshots; list the latest unless a date is asked for
+        if self.action == 'list' and 'snapshot_date' not in self.request.query_params:
+            queryset = queryset.latest_snapshot()
+        return queryset
+
     @extend_schema(summary="Get current standings for a competition")
     @action(detail=False, methods=['get'])
     def current(self, request):
@@ -195,10 +202,14 @@ class StandingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        latest_standings = self.queryset.filter(
+        standings = self.queryset.filter(
             competition_id=competition_id,
             type='TOTAL'
-        ).order_by('position')
+        )
+        
+        # Latest snapshot of the most recent season
+        latest_season = standings.order_by('-season__start_date').values_list('season_id', flat=True).first()
+        latest_standings = standings.filter(season_id=latest_season).latest_snapshot().order_by('position')
         
         serializer = self.get_serializer(latest_standings, many=True)
         return Response(serializer.data)
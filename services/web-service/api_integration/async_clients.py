@@ -0,0 +1,319 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+from django.conf import settings
+
+from api_integration.football_data_client import sync_rate_limit_from_headers, MAX_THROTTLED_RETRIES
+from api_integration.health import get_health_monitor
+from api_integration.http_cache import get_response_cache
+from api_integration.rate_limiter import get_rate_limiter
+from api_integration.thesportsdb_client import get_thesportsdb_rate_limiter
+
+logger = logging.getLogger('mark_foot')
+
+
+class AsyncFootballDataAPIClient:
+    """
+    Async client for Football-Data.org API
+
+    Requests share one pooled connection and the same rate limiter and
+    response cache as FootballDataAPIClient, so bulk methods run concurrently
+    and their wall time is bounded by the API quota rather than latency.
+    Limiter and cache calls (Redis or disk I/O) run in worker threads so they
+    never block the event loop.
+
+    Usage:
+        async with AsyncFootballDataAPIClient() as client:
+            results = await client.get_standings_for_competitions(['PL', 'PD'])
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, max_wait: Optional[float] = None,
+                 use_cache: bool = True):
+        self.base_url = settings.FOOTBALL_DATA_BASE_URL
+        self.api_key = settings.FOOTBALL_DATA_API_KEY
+        self.rate_limiter = get_rate_limiter(
+            'football_data',
+            max_calls=settings.FOOTBALL_DATA_RATE_LIMIT,
+            time_window=60
+        )
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency or settings.API_ASYNC_MAX_CONCURRENCY
+        self.cache = get_response_cache('football_data') if use_cache else None
+        self.health = get_health_monitor('football_data')
+        self.client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            headers={
+                'X-Auth-Token': self.api_key,
+                'User-Agent': 'Mark-Foot/1.0'
+            },
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make a request to the API with rate limiting and response caching"""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        cache_key, cached, fresh = None, None, False
+        if self.cache is not None:
+            cache_key, cached, fresh = await asyncio.to_thread(self.cache.lookup, endpoint, params)
+            if fresh:
+                return {'data': cached['data'], 'status_code': 200, 'execution_time': 0, 'cached': True}
+
+        headers = self.cache.conditional_headers(cached) if cached else {}
+
+        async with self._semaphore:
+            for attempt in range(MAX_THROTTLED_RETRIES + 1):
+                await self.rate_limiter.acquire_async(max_wait=self.max_wait)
+
+                start_time = time.time()
+                try:
+                    response = await self.client.get(url, params=params, headers=headers)
+                    execution_time = int((time.time() - start_time) * 1000)
+
+                    logger.info(f"Async API Request: {endpoint} - Status: {response.status_code} - Time: {execution_time}ms")
+
+                    await asyncio.to_thread(
+                        sync_rate_limit_from_headers, self.rate_limiter, response.status_code, response.headers
+                    )
+                    await asyncio.to_thread(self.health.record, response.status_code)
+                    if response.status_code == 429 and attempt < MAX_THROTTLED_RETRIES:
+                        continue
+
+                    if response.status_code == 304 and cached is not None:
+                        await asyncio.to_thread(self.cache.revalidated, cache_key, cached, endpoint)
+                        return {
+                            'data': cached['data'],
+                            'status_code': response.status_code,
+                            'execution_time': execution_time,
+                            'cached': True
+                        }
+
+                    response.raise_for_status()
+                    data = response.json()
+
+                    if self.cache is not None:
+                        await asyncio.to_thread(self.cache.store, cache_key, endpoint, data, response.headers)
+
+                    return {
+                        'data': data,
+                        'status_code': response.status_code,
+                        'execution_time': execution_time
+                    }
+
+                except httpx.HTTPError as e:
+                    execution_time = int((time.time() - start_time) * 1000)
+                    logger.error(f"Async API Request failed: {endpoint} - Error: {str(e)} - Time: {execution_time}ms")
+
+                    status_code = None
+                    if isinstance(e, httpx.HTTPStatusError):
+                        status_code = e.response.status_code
+                    else:
+                        await asyncio.to_thread(self.health.record, None, str(e))
+
+                    return {
+                        'data': None,
+                        'status_code': status_code,
+                        'execution_time': execution_time,
+                        'error': str(e)
+                    }
+
+    async def gather(self, requests: Iterable[Tuple[str, Optional[Dict]]],
+                     return_exceptions: bool = False) -> List[Dict[str, Any]]:
+        """
+        Run several requests concurrently under the shared rate limiter
+
+        Args:
+            requests: (endpoint, params) pairs
+            return_exceptions: Return a request's exception (e.g. RateLimitExceeded)
+                               in its place instead of cancelling the others
+
+        Returns:
+            Responses in the same order as the requests
+        """
+        return await asyncio.gather(*(
+            self._make_request(endpoint, params) for endpoint, params in requests
+        ), return_exceptions=return_exceptions)
+
+    async def get_competition_standings(self, competition_id: str, **kwargs) -> Dict[str, Any]:
+        """Get standings for a specific competition"""
+        params = {key: kwargs[key] for key in ['matchday', 'season', 'date'] if key in kwargs}
+        return await self._make_request(f'competitions/{competition_id}/standings', params)
+
+    async def get_competition_teams(self, competition_id: str, season: Optional[str] = None) -> Dict[str, Any]:
+        """Get teams for a specific competition"""
+        params = {'season': season} if season else {}
+        return await self._make_request(f'competitions/{competition_id}/teams', params)
+
+    async def get_competition_matches(self, competition_id: str, **kwargs) -> Dict[str, Any]:
+        """Get matches for a specific competition"""
+        supported_params = ['dateFrom', 'dateTo', 'stage', 'status', 'matchday', 'group', 'season']
+        params = {key: kwargs[key] for key in supported_params if key in kwargs}
+        return await self._make_request(f'competitions/{competition_id}/matches', params)
+
+    async def get_standings_for_competitions(self, competitions: Dict[str, Optional[str]],
+                                             return_exceptions: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get standings for several competitions concurrently
+
+        Args:
+            competitions: Mapping of competition code to season year (None = current)
+            return_exceptions: Map a failed competition to its exception instead of raising
+
+        Returns:
+            Mapping of competition code to response
+        """
+        codes = list(competitions)
+        responses = await self.gather(
+            ((f'competitions/{code}/standings', {'season': competitions[code]} if competitions[code] else {})
+             for code in codes),
+            return_exceptions=return_exceptions
+        )
+        return dict(zip(codes, responses))
+
+    async def get_teams_for_competitions(self, competitions: Dict[str, Optional[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get teams for several competitions concurrently
+
+        Args:
+            competitions: Mapping of competition code to season year (None = current)
+
+        Returns:
+            Mapping of competition code to response
+        """
+        codes = list(competitions)
+        responses = await self.gather(
+            (f'competitions/{code}/teams', {'season': competitions[code]} if competitions[code] else {})
+            for code in codes
+        )
+        return dict(zip(codes, responses))
+
+
+class AsyncTheSportsDBClient:
+    """
+    Async client for TheSportsDB API
+
+    Usage:
+        async with AsyncTheSportsDBClient() as client:
+            players = await client.get_players_for_teams(['Arsenal', 'Chelsea'])
+    """
+
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: Optional[int] = None,
+                 use_cache: bool = True):
+        self.base_url = "https://www.thesportsdb.com/api/v1/json"
+        self.api_key = api_key or settings.THESPORTSDB_API_KEY or None
+        self.rate_limiter = get_thesportsdb_rate_limiter(self.api_key)
+        self.max_concurrency = max_concurrency or settings.API_ASYNC_MAX_CONCURRENCY
+        self.cache = get_response_cache('thesportsdb') if use_cache else None
+        self.health = get_health_monitor('thesportsdb')
+        self.client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            headers={
+                'User-Agent': 'MarkFoot-FootballDataCollector/1.0',
+                'Accept': 'application/json',
+            },
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
+
+    async def _make_request(self, endpoint: str) -> Optional[Dict]:
+        """Make HTTP request to TheSportsDB API"""
+        cache_key, cached, fresh = None, None, False
+        if self.cache is not None:
+            cache_key, cached, fresh = await asyncio.to_thread(self.cache.lookup, endpoint)
+            if fresh:
+                return cached['data']
+
+        url = f"{self.base_url}/{self.api_key or '3'}/{endpoint}"
+        headers = self.cache.conditional_headers(cached) if cached else {}
+
+        async with self._semaphore:
+            await self.rate_limiter.acquire_async()
+
+            try:
+                start_time = time.time()
+                response = await self.client.get(url, headers=headers)
+                execution_time = int((time.time() - start_time) * 1000)
+                logger.info(f"📊 Async TheSportsDB Response: {endpoint} - {response.status_code} - Time: {execution_time}ms")
+                await asyncio.to_thread(self.health.record, response.status_code)
+
+                if response.status_code == 304 and cached is not None:
+                    entry = await asyncio.to_thread(self.cache.revalidated, cache_key, cached, endpoint)
+                    return entry['data']
+
+                response.raise_for_status()
+                data = response.json()
+
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.store, cache_key, endpoint, data, response.headers)
+
+                return data
+
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"❌ Async TheSportsDB API Error: {endpoint} - {str(e)}")
+                if isinstance(e, httpx.TransportError):
+                    await asyncio.to_thread(self.health.record, None, str(e))
+                return None
+
+    async def search_players(self, player_name: str) -> List[Dict]:
+        """Search for players by name"""
+        if not player_name or len(player_name.strip()) < 2:
+            return []
+        data = await self._make_request(f"searchplayers.php?p={quote(player_name.strip())}")
+        return (data or {}).get('player') or []
+
+    async def get_team_players(self, team_name: str) -> List[Dict]:
+        """Get all players for a specific team"""
+        if not team_name or len(team_name.strip()) < 2:
+            return []
+        data = await self._make_request(f"searchplayers.php?t={quote(team_name.strip())}")
+        return (data or {}).get('player') or []
+
+    async def get_player_by_id(self, player_id: str) -> Optional[Dict]:
+        """Get detailed player information by ID"""
+        data = await self._make_request(f"lookupplayer.php?id={player_id}")
+        players = (data or {}).get('players') or []
+        return players[0] if players else None
+
+    async def get_players_for_teams(self, team_names: List[str]) -> Dict[str, List[Dict]]:
+        """Get the players of several teams concurrently, keyed by team name"""
+        results = await asyncio.gather(*(self.get_team_players(name) for name in team_names))
+        return dict(zip(team_names, results))
+
+    async def get_players_by_ids(self, player_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Get several players by ID concurrently, keyed by player ID"""
+        results = await asyncio.gather(*(self.get_player_by_id(player_id) for player_id in player_ids))
+        return dict(zip(player_ids, results))
+
+
+def run_async(coroutine):
+    """Run a coroutine from synchronous code such as a Celery task"""
+    return asyncio.run(coroutine)
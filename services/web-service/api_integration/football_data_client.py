@@ -6,48 +6,66 @@ from datetime import datetime, timedelta
 from django.conf import settings
 from django.utils import timezone
 
+from api_integration.rate_limiter import get_rate_limiter
+from api_integration.http_cache import build_request_key, get_response_cache
+from api_integration.single_flight import get_single_flight
+from api_integration.health import get_health_monitor
+
 logger = logging.getLogger('mark_foot')
 
+# Quota headers sent by football-data.org on every response
+QUOTA_AVAILABLE_HEADER = 'X-Requests-Available-Minute'
+QUOTA_RESET_HEADER = 'X-RequestCounter-Reset'
+
+# Times a request answered with 429 is retried after the quota resets
+MAX_THROTTLED_RETRIES = 1
+
 
-class RateLimiter:
-    """Rate limiter for API calls"""
-    
-    def __init__(self, max_calls: int = 10, time_window: int = 60):
-        self.max_calls = max_calls
-        self.time_window = time_window
-        self.calls = []
-    
-    def wait_if_needed(self):
-        """Wait if we've exceeded the rate limit"""
-        now = time.time()
-        
-        # Remove calls outside the time window
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
-        
-        # If we've reached the limit, wait
-        if len(self.calls) >= self.max_calls:
-            wait_time = self.time_window - (now - self.calls[0]) + 1
-            if wait_time > 0:
-                logger.info(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-                # Clean up calls again after waiting
-                now = time.time()
-                self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
-        
-        # Record this call
-        self.calls.append(now)
+def _parse_header_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer header value, ignoring missing or malformed ones"""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def sync_rate_limit_from_headers(rate_limiter, status_code: int, headers) -> None:
+    """Align the shared limiter with the quota headers of a response"""
+    available = _parse_header_int(headers.get(QUOTA_AVAILABLE_HEADER))
+    reset_after = _parse_header_int(headers.get(QUOTA_RESET_HEADER))
+    
+    if status_code == 429:
+        # Over quota: hand out no slots until the server's counter resets
+        reset_after = reset_after or _parse_header_int(headers.get('Retry-After')) or 60
+        logger.warning(f"API quota exhausted. Backing off for {reset_after} seconds")
+        rate_limiter.block_for(reset_after)
+    elif available is not None:
+        rate_limiter.sync(available, reset_after if reset_after is not None else 60)
 
 
 class FootballDataAPIClient:
     """Client for Football-Data.org API"""
     
-    def __init__(self):
+    def __init__(self, max_wait: Optional[float] = None, use_cache: bool = True):
+        """
+        Args:
+            max_wait: Longest time to sleep for a rate limit slot. When the next
+                      slot is further away, RateLimitExceeded is raised so the
+                      caller can reschedule instead of blocking (None = always wait)
+            use_cache: Serve and revalidate responses through the response cache
+        """
         self.base_url = settings.FOOTBALL_DATA_BASE_URL
         self.api_key = settings.FOOTBALL_DATA_API_KEY
-        self.rate_limiter = RateLimiter(
+        # Shared by every client instance and worker using this API key
+        self.rate_limiter = get_rate_limiter(
+            'football_data',
             max_calls=settings.FOOTBALL_DATA_RATE_LIMIT,
             time_window=60
         )
+        self.max_wait = max_wait
+        self.cache = get_response_cache('football_data') if use_cache else None
+        self.single_flight = get_single_flight('football_data')
+        self.health = get_health_monitor('football_data')
         self.session = requests.Session()
         self.session.headers.update({
             'X-Auth-Token': self.api_key,
@@ -55,35 +73,88 @@ class FootballDataAPIClient:
         })
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make a request to the API with rate limiting"""
-        self.rate_limiter.wait_if_needed()
+        """Make a request to the API with rate limiting, response caching and coalescing"""
+        request_key = build_request_key('football_data', endpoint, params)
         
+        cached = None
+        if self.cache is not None:
+            _, cached, fresh = self.cache.lookup(endpoint, params)
+            if fresh:
+                # Within TTL: costs neither quota nor a round trip
+                logger.debug(f"API Cache hit: {endpoint}")
+                return {
+                    'data': cached['data'],
+                    'status_code': 200,
+                    'execution_time': 0,
+                    'cached': True
+                }
+        
+        # Identical concurrent requests share one upstream call and one quota unit
+        return self.single_flight.do(
+            request_key,
+            lambda: self._fetch(endpoint, params, request_key, cached),
+            should_share=lambda result: result.get('data') is not None
+        )
+    
+    def _fetch(self, endpoint: str, params: Optional[Dict], cache_key: str,
+               cached: Optional[Dict]) -> Dict[str, Any]:
+        """Perform the upstream request, revalidating a stale cache entry if any"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        headers = self.cache.conditional_headers(cached) if cached else {}
         
-        start_time = time.time()
-        try:
-            response = self.session.get(url, params=params)
-            execution_time = int((time.time() - start_time) * 1000)
+        for attempt in range(MAX_THROTTLED_RETRIES + 1):
+            self.rate_limiter.acquire(max_wait=self.max_wait)
             
-            logger.info(f"API Request: {endpoint} - Status: {response.status_code} - Time: {execution_time}ms")
+            start_time = time.time()
+            try:
+                response = self.session.get(url, params=params, headers=headers)
+                execution_time = int((time.time() - start_time) * 1000)
+                
+                logger.info(f"API Request: {endpoint} - Status: {response.status_code} - Time: {execution_time}ms")
+                
+                sync_rate_limit_from_headers(self.rate_limiter, response.status_code, response.headers)
+                self.health.record(response.status_code)
+                if response.status_code == 429 and attempt < MAX_THROTTLED_RETRIES:
+                    continue
+                
+                if response.status_code == 304 and cached is not None:
+                    # Unchanged upstream: reuse the stored payload without parsing
+                    self.cache.revalidated(cache_key, cached, endpoint)
+                    return {
+                        'data': cached['data'],
+                        'status_code': response.status_code,
+                        'execution_time': execution_time,
+                        'cached': True
+                    }
+                
+                response.raise_for_status()
+                data = response.json()
+                
+                if self.cache is not None:
+                    self.cache.store(cache_key, endpoint, data, response.headers)
+                
+                return {
+                    'data': data,
+                    'status_code': response.status_code,
+                    'execution_time': execution_time
+                }
             
-            response.raise_for_status()
-            return {
-                'data': response.json(),
-                'status_code': response.status_code,
-                'execution_time': execution_time
-            }
-        
-        except requests.exceptions.RequestException as e:
-            execution_time = int((time.time() - start_time) * 1000)
-            logger.error(f"API Request failed: {endpoint} - Error: {str(e)} - Time: {execution_time}ms")
-            
-            return {
-                'data': None,
-                'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None,
-                'execution_time': execution_time,
-                'error': str(e)
-            }
+            except requests.exceptions.RequestException as e:
+                execution_time = int((time.time() - start_time) * 1000)
+                logger.error(f"API Request failed: {endpoint} - Error: {str(e)} - Time: {execution_time}ms")
+                if getattr(e, 'response', None) is None:
+                    self.health.record(None, str(e))
+                
+                return {
+                    'data': None,
+                    'status_code': getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None,
+                    'execution_time': execution_time,
+                    'error': str(e)
+                }
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache hit metrics for this process"""
+        return self.cache.get_stats() if self.cache is not None else {'backend': 'none'}
     
     def get_competitions(self, areas: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get all available competitions"""
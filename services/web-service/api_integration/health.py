@@ -0,0 +1,197 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+
+from api_integration.redis_backend import get_redis_client
+
+logger = logging.getLogger('mark_foot')
+
+# A success already recorded this recently is not written again, so busy
+# clients do not add a Redis round trip to every request
+SUCCESS_WRITE_INTERVAL = 10
+
+
+def is_failure_status(status_code: Optional[int]) -> bool:
+    """Whether a response means the API is unusable (no response, server or auth error)"""
+    return status_code is None or status_code >= 500 or status_code in (401, 403)
+
+
+class ApiHealthMonitor:
+    """
+    Health state of an upstream API, fed by the outcome of real requests
+
+    Clients record every response, so the status is known without extra
+    requests. A success within the TTL (and fewer than the threshold of
+    failures since) means healthy; recent failures without a success since
+    mean unhealthy. Only when nothing was recorded within the TTL does
+    is_available() spend a request on an active probe.
+
+    With a Redis backend the state is shared by every worker; otherwise it
+    is kept in-process.
+    """
+
+    def __init__(self, namespace: str, ttl: Optional[float] = None,
+                 failure_threshold: Optional[int] = None):
+        self.namespace = namespace
+        self.ttl = ttl if ttl is not None else settings.API_HEALTH_TTL
+        self.failure_threshold = failure_threshold or settings.API_HEALTH_FAILURE_THRESHOLD
+        self.key = f"mark_foot:api_health:{namespace}"
+        self._state: Dict[str, Any] = {
+            'last_success_at': None,
+            'last_failure_at': None,
+            'last_error': '',
+            'consecutive_failures': 0,
+        }
+        self._lock = threading.Lock()
+
+    def record(self, status_code: Optional[int], error: Optional[str] = None):
+        """
+        Record the outcome of a request
+
+        Args:
+            status_code: HTTP status of the response, None if no response arrived
+            error: Error message when the request failed
+        """
+        if status_code == 429:
+            # Over quota, which says nothing about the API being up
+            return
+
+        if is_failure_status(status_code):
+            self.record_failure(error or f"HTTP {status_code}")
+        else:
+            self.record_success()
+
+    def record_success(self):
+        now = time.time()
+        with self._lock:
+            unchanged = (
+                self._state['consecutive_failures'] == 0
+                and self._state['last_success_at'] is not None
+                and now - self._state['last_success_at'] < SUCCESS_WRITE_INTERVAL
+            )
+            self._state['last_success_at'] = now
+            self._state['consecutive_failures'] = 0
+
+        if not unchanged:
+            self._write({'last_success_at': now, 'consecutive_failures': 0})
+
+    def record_failure(self, error: str):
+        now = time.time()
+        with self._lock:
+            self._state['last_failure_at'] = now
+            self._state['last_error'] = error[:500]
+            self._state['consecutive_failures'] += 1
+            failures = self._state['consecutive_failures']
+
+        logger.warning(f"🩺 {self.namespace} request failed ({failures} in a row): {error}")
+        self._write({'last_failure_at': now, 'last_error': error[:500]}, increment_failures=True)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the cached health status, without any request to the API
+
+        Returns:
+            Dictionary with the state ('healthy', 'unhealthy' or 'unknown')
+            and the outcomes it is based on
+        """
+        state = self._read()
+        now = time.time()
+
+        last_success = state['last_success_at']
+        last_failure = state['last_failure_at']
+        recent_success = last_success is not None and now - last_success < self.ttl
+        recent_failure = last_failure is not None and now - last_failure < self.ttl
+
+        if recent_success and state['consecutive_failures'] < self.failure_threshold:
+            health = 'healthy'
+        elif recent_failure:
+            health = 'unhealthy'
+        else:
+            health = 'unknown'
+
+        return {
+            'api': self.namespace,
+            'state': health,
+            'last_success_at': last_success,
+            'last_failure_at': last_failure,
+            'last_error': state['last_error'],
+            'consecutive_failures': state['consecutive_failures'],
+        }
+
+    def is_available(self, probe: Optional[Callable[[], Any]] = None) -> bool:
+        """
+        Whether the API can be used, probing it only when its state is unknown
+
+        Args:
+            probe: Makes one cheap request through the client, which records its outcome
+        """
+        status = self.get_status()
+
+        if status['state'] == 'unknown' and probe is not None:
+            logger.info(f"🩺 No recent {self.namespace} requests, probing the API")
+            probe()
+            status = self.get_status()
+
+        if status['state'] == 'unhealthy':
+            logger.warning(f"🩺 {self.namespace} API unhealthy: {status['last_error']}")
+
+        return status['state'] == 'healthy'
+
+    def _write(self, fields: Dict[str, Any], increment_failures: bool = False):
+        """Share an outcome with other workers"""
+        client = get_redis_client()
+        if client is None:
+            return
+
+        try:
+            pipe = client.pipeline()
+            pipe.hset(self.key, mapping=fields)
+            if increment_failures:
+                pipe.hincrby(self.key, 'consecutive_failures', 1)
+            pipe.expire(self.key, int(self.ttl * 10))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not share {self.namespace} health state: {str(e)}")
+
+    def _read(self) -> Dict[str, Any]:
+        """Get the shared state, falling back to this process' own"""
+        with self._lock:
+            state = dict(self._state)
+
+        client = get_redis_client()
+        if client is None:
+            return state
+
+        try:
+            shared = client.hgetall(self.key)
+        except Exception as e:
+            logger.warning(f"Could not read {self.namespace} health state: {str(e)}")
+            return state
+
+        if shared:
+            shared = {key.decode(): value.decode() for key, value in shared.items()}
+            state = {
+                'last_success_at': float(shared['last_success_at']) if 'last_success_at' in shared else None,
+                'last_failure_at': float(shared['last_failure_at']) if 'last_failure_at' in shared else None,
+                'last_error': shared.get('last_error', ''),
+                'consecutive_failures': int(shared.get('consecutive_failures', 0)),
+            }
+
+        return state
+
+
+_monitors: Dict[str, ApiHealthMonitor] = {}
+_monitors_lock = threading.Lock()
+
+
+def get_health_monitor(namespace: str) -> ApiHealthMonitor:
+    """Get the process-wide health monitor of an upstream API"""
+    with _monitors_lock:
+        monitor = _monitors.get(namespace)
+        if monitor is None:
+            monitor = ApiHealthMonitor(namespace)
+            _monitors[namespace] = monitor
+        return monitor
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from fnmatch import fnmatch
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from api_integration.redis_backend import get_redis_client
+
+logger = logging.getLogger('mark_foot')
+
+
+def build_request_key(namespace: str, endpoint: str, params: Optional[Dict] = None) -> str:
+    """Build a stable key identifying a GET request to an upstream API"""
+    raw = json.dumps(
+        [namespace, endpoint.lstrip('/'), sorted((params or {}).items())],
+        default=str
+    )
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ResponseCache(ABC):
+    """
+    Cache for upstream API responses, keyed by endpoint and params
+
+    Entries keep the ETag/Last-Modified validators so that, once their TTL
+    has expired, they can be revalidated with a conditional request instead
+    of downloading and parsing the payload again.
+    """
+
+    backend = 'none'
+
+    def __init__(self, namespace: str, ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = 0, max_age: int = 7 * 24 * 3600):
+        self.namespace = namespace
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.max_age = max_age
+        self.stats = {'hits': 0, 'stale': 0, 'revalidated': 0, 'misses': 0, 'stores': 0}
+        self._stats_lock = threading.Lock()
+
+    def build_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
+        """Build a stable cache key from the endpoint and its params"""
+        return build_request_key(self.namespace, endpoint, params)
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Get the TTL for an endpoint from the first matching pattern"""
+        path = endpoint.lstrip('/').split('?', 1)[0]
+        for pattern, ttl in self.ttls.items():
+            if fnmatch(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, endpoint: str, params: Optional[Dict] = None):
+        """
+        Look up a cached response
+
+        Returns:
+            Tuple of (cache key, entry or None, is_fresh)
+        """
+        key = self.build_key(endpoint, params)
+        entry = self.get(key)
+
+        if entry is None:
+            self._count('misses')
+            return key, None, False
+
+        if time.time() < entry['expires_at']:
+            self._count('hits')
+            return key, entry, True
+
+        self._count('stale')
+        return key, entry, False
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Get the validator headers to revalidate a stale entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key: str, endpoint: str, data: Any, headers) -> None:
+        """Store a fresh response body along with its validators"""
+        now = time.time()
+        entry = {
+            'data': data,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored_at': now,
+            'expires_at': now + self.ttl_for(endpoint),
+        }
+        try:
+            self.set(key, entry)
+            self._count('stores')
+        except Exception as e:
+            logger.warning(f"Could not cache response for {endpoint}: {str(e)}")
+
+    def revalidated(self, key: str, entry: Dict, endpoint: str) -> Dict:
+        """Extend a stale entry after the server answered 304 Not Modified"""
+        entry['expires_at'] = time.time() + self.ttl_for(endpoint)
+        try:
+            self.set(key, entry)
+        except Exception as e:
+            logger.warning(f"Could not refresh cached response for {endpoint}: {str(e)}")
+        self._count('revalidated')
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit metrics for this process"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['stale'] + stats['misses']
+        stats['hit_rate'] = round((stats['hits'] + stats['revalidated']) / lookups * 100, 1) if lookups else 0.0
+        stats['backend'] = self.backend
+        return stats
+
+    def _count(self, metric: str):
+        with self._stats_lock:
+            self.stats[metric] += 1
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        """Get a stored entry, or None if there is none"""
+
+    @abstractmethod
+    def set(self, key: str, entry: Dict) -> None:
+        """Store an entry"""
+
+
+class FileResponseCache(ResponseCache):
+    """Response cache stored as JSON files on local disk"""
+
+    backend = 'file'
+
+    def __init__(self, namespace: str, directory: str, **kwargs):
+        super().__init__(namespace, **kwargs)
+        self.directory = os.path.join(directory, namespace)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                os.remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, entry: Dict) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(tmp_path, path)
+
+
+class RedisResponseCache(ResponseCache):
+    """Response cache shared by all workers through Redis"""
+
+    backend = 'redis'
+
+    def __init__(self, namespace: str, client, **kwargs):
+        super().__init__(namespace, **kwargs)
+        self.client = client
+
+    def _key(self, key: str) -> str:
+        return f"mark_foot:api_cache:{self.namespace}:{key}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            raw = self.client.get(self._key(key))
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"Redis response cache read failed: {str(e)}")
+            return None
+
+    def set(self, key: str, entry: Dict) -> None:
+        self.client.set(self._key(key), json.dumps(entry), ex=self.max_age)
+
+    def _count(self, metric: str):
+        super()._count(metric)
+        try:
+            self.client.hincrby(f"mark_foot:api_cache_stats:{self.namespace}", metric, 1)
+        except Exception:
+            pass
+
+    def get_cluster_stats(self) -> Dict[str, int]:
+        """Get hit metrics summed over every worker"""
+        raw = self.client.hgetall(f"mark_foot:api_cache_stats:{self.namespace}")
+        return {k.decode(): int(v) for k, v in raw.items()}
+
+
+def get_response_cache(namespace: str) -> Optional[ResponseCache]:
+    """
+    Build the response cache configured for an upstream API
+
+    Returns:
+        ResponseCache instance, or None when caching is disabled
+    """
+    backend = settings.API_CACHE_BACKEND
+    options = {
+        'ttls': settings.API_CACHE_TTLS.get(namespace, {}),
+        'default_ttl': settings.API_CACHE_DEFAULT_TTL,
+        'max_age': settings.API_CACHE_MAX_AGE,
+    }
+
+    try:
+        if backend == 'redis':
+            client = get_redis_client()
+            if client is not None:
+                return RedisResponseCache(namespace, client, **options)
+            logger.warning("Redis response cache unavailable, falling back to file cache")
+            backend = 'file'
+
+        if backend == 'file':
+            return FileResponseCache(namespace, settings.API_CACHE_DIR, **options)
+
+    except Exception as e:
+        logger.warning(f"Response cache disabled for {namespace}: {str(e)}")
+
+    return None
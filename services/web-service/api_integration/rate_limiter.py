@@ -0,0 +1,309 @@
+import asyncio
+import bisect
+import logging
+import math
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+from api_integration.redis_backend import get_redis_client, report_redis_failure
+
+logger = logging.getLogger('mark_foot')
+
+
+# Atomic sliding window: drop the calls that left the window, then record the
+# requested ones if the limit allows. Returns the number of seconds until
+# enough calls leave the window to free the slots (0 if they were taken).
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4])
+local member = ARGV[5]
+local ttl = tonumber(ARGV[6])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+
+if count + requested <= limit then
+    for i = 1, requested do
+        redis.call('ZADD', key, now, member .. ':' .. i)
+    end
+    if redis.call('TTL', key) < ttl then
+        redis.call('EXPIRE', key, ttl)
+    end
+    return '0'
+end
+
+local index = count - limit + requested - 1
+local entry = redis.call('ZRANGE', key, index, index, 'WITHSCORES')
+return tostring(tonumber(entry[2]) + window - now)
+"""
+
+# Align the window with the quota reported by the server. At least
+# limit - available calls must be recorded, so the missing ones (made by other
+# users of the same quota) are added as calls that leave the window at the
+# reset. Calls are never removed, so a late response carrying an older, higher
+# count cannot give back spent slots.
+SYNC_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local available = math.min(limit, math.max(0, tonumber(ARGV[3])))
+local now = tonumber(ARGV[4])
+local reset_after = tonumber(ARGV[5])
+local ttl = tonumber(ARGV[6])
+
+local reset_from = now + reset_after - window
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+
+for i = count + 1, limit - available do
+    redis.call('ZADD', key, reset_from, 'server:' .. now .. ':' .. i)
+end
+
+ttl = math.max(ttl, math.ceil(reset_after) + 1)
+if redis.call('TTL', key) < ttl then
+    redis.call('EXPIRE', key, ttl)
+end
+return 1
+"""
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call slot is not available within the allowed wait"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Rate limit reached for {name}, next slot in {retry_after:.2f} seconds")
+
+    @property
+    def countdown(self) -> int:
+        """Whole seconds to delay a rescheduled task by"""
+        return max(1, math.ceil(self.retry_after))
+
+
+class LocalSlidingWindow:
+    """In-process sliding window, used for tests and when Redis is unavailable"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        # Sorted times of the calls still inside the window
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float):
+        expired = bisect.bisect_right(self.calls, now - self.window)
+        del self.calls[:expired]
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        """Take call slots if available, otherwise return seconds until they are"""
+        with self._lock:
+            now = time.time()
+            self._prune(now)
+
+            if len(self.calls) + tokens <= self.limit:
+                self.calls.extend([now] * tokens)
+                self.calls.sort()
+                return 0.0
+
+            return self.calls[len(self.calls) - self.limit + tokens - 1] + self.window - now
+
+    def sync(self, available: int, reset_after: float):
+        """
+        Align the window with the quota reported by the server
+
+        Calls are only ever added, so a late response carrying an older,
+        higher count cannot give back spent slots.
+        """
+        with self._lock:
+            now = time.time()
+            available = min(self.limit, max(0, available))
+            reset_from = now + reset_after - self.window
+
+            self._prune(now)
+            missing = self.limit - available - len(self.calls)
+            if missing > 0:
+                self.calls.extend([reset_from] * missing)
+                self.calls.sort()
+
+
+class RedisSlidingWindow:
+    """Sliding window stored in Redis, shared by every worker using the same key"""
+
+    def __init__(self, client, key: str, limit: int, window: float):
+        self.client = client
+        self.key = key
+        self.limit = limit
+        self.window = window
+        self.ttl = int(math.ceil(window)) + 1
+        self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+        self._sync_script = client.register_script(SYNC_WINDOW_SCRIPT)
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        """Take call slots if available, otherwise return seconds until they are"""
+        wait = self._script(
+            keys=[self.key],
+            args=[self.limit, self.window, time.time(), tokens, uuid.uuid4().hex, self.ttl]
+        )
+        return float(wait)
+
+    def sync(self, available: int, reset_after: float):
+        """Align the window with the quota reported by the server (see SYNC_WINDOW_SCRIPT)"""
+        self._sync_script(
+            keys=[self.key],
+            args=[self.limit, self.window, available, time.time(), reset_after, self.ttl]
+        )
+
+
+class SlidingWindowRateLimiter:
+    """
+    Rate limiter shared by every client of an upstream API
+
+    Allows at most max_calls in any time_window seconds, so a full burst is
+    available when idle but the server's quota is never exceeded. Uses a Redis
+    sliding window so the whole cluster shares one budget, and falls back to
+    an in-process window when Redis is not configured, or while it is
+    unreachable (reconnecting after the redis_backend backoff).
+    """
+
+    def __init__(self, name: str, max_calls: int = 10, time_window: float = 60):
+        self.name = name
+        self.max_calls = max_calls
+        self.time_window = time_window
+        self.local_window = LocalSlidingWindow(max_calls, time_window)
+        self.redis_window = None
+        self._get_redis_window()
+
+    @property
+    def backend(self) -> str:
+        return 'redis' if self.redis_window is not None else 'local'
+
+    def _get_redis_window(self) -> Optional[RedisSlidingWindow]:
+        """Get the shared window, reconnecting once the Redis backoff has passed"""
+        if self.redis_window is None:
+            client = get_redis_client()
+            if client is not None:
+                self.redis_window = RedisSlidingWindow(
+                    client, f"mark_foot:ratewindow:{self.name}", self.max_calls, self.time_window
+                )
+        return self.redis_window
+
+    def _redis_failed(self, error: Exception):
+        """Use the in-process window until Redis can be reached again"""
+        logger.warning(f"Redis rate limiter '{self.name}' failed, using in-process fallback: {str(error)}")
+        self.redis_window = None
+        report_redis_failure()
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        """
+        Try to take a call slot without blocking
+
+        Returns:
+            0.0 if the slot was taken, otherwise seconds until one is free
+        """
+        redis_window = self._get_redis_window()
+        if redis_window is not None:
+            try:
+                return redis_window.try_acquire(tokens)
+            except Exception as e:
+                self._redis_failed(e)
+
+        return self.local_window.try_acquire(tokens)
+
+    def sync(self, available: int, reset_after: float):
+        """
+        Align the shared budget with the quota reported by the upstream API
+
+        Args:
+            available: Calls the server still allows in the current window
+            reset_after: Seconds until the server resets its counter
+        """
+        redis_window = self._get_redis_window()
+        if redis_window is not None:
+            try:
+                redis_window.sync(available, reset_after)
+                return
+            except Exception as e:
+                self._redis_failed(e)
+
+        self.local_window.sync(available, reset_after)
+
+    def block_for(self, seconds: float):
+        """Hand out no call slots for the given number of seconds"""
+        self.sync(0, seconds)
+
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """
+        Take a call slot, sleeping for it only while the wait stays short
+
+        Args:
+            max_wait: Longest total sleep allowed; None blocks until a slot is
+                      free, 0 never sleeps
+
+        Returns:
+            Total seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: if the next slot is further away than max_wait
+        """
+        waited = 0.0
+
+        while True:
+            wait_time = self.try_acquire()
+            if wait_time <= 0:
+                return waited
+
+            if max_wait is not None and waited + wait_time > max_wait:
+                raise RateLimitExceeded(self.name, wait_time)
+
+            logger.info(f"Rate limit reached for {self.name}. Waiting {wait_time:.2f} seconds...")
+            time.sleep(wait_time)
+            waited += wait_time
+
+    async def acquire_async(self, max_wait: Optional[float] = None) -> float:
+        """
+        Async version of acquire() that yields to the event loop while waiting
+
+        The window is checked in a worker thread, so a Redis round trip does
+        not block the other coroutines.
+        """
+        waited = 0.0
+
+        while True:
+            wait_time = await asyncio.to_thread(self.try_acquire)
+            if wait_time <= 0:
+                return waited
+
+            if max_wait is not None and waited + wait_time > max_wait:
+                raise RateLimitExceeded(self.name, wait_time)
+
+            await asyncio.sleep(wait_time)
+            waited += wait_time
+
+    def wait_if_needed(self) -> float:
+        """
+        Block until a call slot is taken
+
+        Returns:
+            Total seconds spent waiting
+        """
+        return self.acquire()
+
+
+_limiters: Dict[str, SlidingWindowRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, max_calls: int, time_window: float = 60) -> SlidingWindowRateLimiter:
+    """Get the process-wide limiter for an upstream API, creating it on first use"""
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None or (limiter.max_calls, limiter.time_window) != (max_calls, time_window):
+            limiter = SlidingWindowRateLimiter(name, max_calls=max_calls, time_window=time_window)
+            _limiters[name] = limiter
+        return limiter
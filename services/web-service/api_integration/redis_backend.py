@@ -0,0 +1,82 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger('mark_foot')
+
+# Seconds to wait before trying to reconnect after Redis was unreachable
+RECONNECT_INTERVAL = 60
+
+_client = None
+_last_failure = 0.0
+_client_lock = threading.Lock()
+
+
+def get_redis_client():
+    """
+    Get the shared Redis connection used for cross-process API state
+
+    Returns:
+        Redis client, or None when the 'local' backend is configured or
+        Redis cannot be reached
+
+    Raises:
+        ImproperlyConfigured: if API_STATE_BACKEND is neither 'redis' nor 'local'
+    """
+    global _client, _last_failure
+
+    if settings.API_STATE_BACKEND == 'local':
+        return None
+
+    if settings.API_STATE_BACKEND != 'redis':
+        raise ImproperlyConfigured(
+            f"API_STATE_BACKEND must be 'redis' or 'local', got {settings.API_STATE_BACKEND!r}"
+        )
+
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is not None:
+            return _client
+
+        if time.time() - _last_failure < RECONNECT_INTERVAL:
+            return None
+
+        try:
+            import redis
+
+            client = redis.Redis.from_url(
+                settings.API_STATE_REDIS_URL,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+            client.ping()
+            _client = client
+        except Exception as e:
+            _last_failure = time.time()
+            logger.warning(f"Redis unavailable for shared API state, using in-process fallback: {str(e)}")
+            return None
+
+    return _client
+
+
+def reset_redis_client():
+    """Drop the cached connection so the next call reconnects"""
+    global _client
+
+    with _client_lock:
+        _client = None
+
+
+def report_redis_failure():
+    """Drop the connection after an error and wait RECONNECT_INTERVAL before the next attempt"""
+    global _client, _last_failure
+
+    with _client_lock:
+        _client = None
+        _last_failure = time.time()
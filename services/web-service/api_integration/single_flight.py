@@ -0,0 +1,175 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+
+from api_integration.rate_limiter import RateLimitExceeded
+from api_integration.redis_backend import get_redis_client
+
+logger = logging.getLogger('mark_foot')
+
+
+# Delete the lock only if it is still held by the caller
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class _Call:
+    """An in-flight call that other threads can wait on"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical API calls into one upstream request
+
+    Threads in the same process wait on the first caller's result. With a
+    Redis backend, other processes see a short lock and poll a result slot
+    instead of issuing the same request.
+    """
+
+    def __init__(self, namespace: str, lock_ttl: float = 30, result_ttl: float = 5,
+                 poll_interval: float = 0.1):
+        self.namespace = namespace
+        self.lock_ttl = lock_ttl
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self.stats = {'leaders': 0, 'coalesced': 0, 'coalesced_remote': 0}
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._release_script = None
+
+    def do(self, key: str, fn: Callable[[], Any],
+           should_share: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Run fn once for all concurrent callers using the same key
+
+        Args:
+            key: Identity of the request
+            fn: Function performing the upstream request
+            should_share: Decides whether a result may be handed to other
+                          processes (e.g. not error responses)
+
+        Returns:
+            The result of fn, possibly produced by another caller
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                is_leader = call is None
+                if is_leader:
+                    call = _Call()
+                    self._calls[key] = call
+
+            if is_leader:
+                break
+
+            call.event.wait()
+            if isinstance(call.error, RateLimitExceeded):
+                # The leader gave up under its own max_wait; this caller may
+                # be willing to wait longer, so it fetches for itself
+                continue
+
+            self._count('coalesced')
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._do_shared(key, fn, should_share)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def _do_shared(self, key: str, fn: Callable[[], Any],
+                   should_share: Optional[Callable[[Any], bool]]) -> Any:
+        """Run fn unless another process is already fetching the same key"""
+        client = get_redis_client() if settings.API_SINGLE_FLIGHT_CROSS_PROCESS else None
+        if client is None:
+            self._count('leaders')
+            return fn()
+
+        lock_key = f"mark_foot:single_flight:{self.namespace}:{key}:lock"
+        result_key = f"mark_foot:single_flight:{self.namespace}:{key}:result"
+        token = uuid.uuid4().hex
+
+        try:
+            acquired = client.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000))
+        except Exception as e:
+            logger.warning(f"Single-flight lock unavailable, calling upstream directly: {str(e)}")
+            self._count('leaders')
+            return fn()
+
+        if acquired:
+            self._count('leaders')
+            try:
+                client.delete(result_key)
+                result = fn()
+                if should_share is None or should_share(result):
+                    client.set(result_key, json.dumps(result), px=int(self.result_ttl * 1000))
+                return result
+            finally:
+                try:
+                    if self._release_script is None:
+                        self._release_script = client.register_script(RELEASE_LOCK_SCRIPT)
+                    self._release_script(keys=[lock_key], args=[token])
+                except Exception as e:
+                    logger.warning(f"Could not release single-flight lock: {str(e)}")
+
+        # Another process is fetching: wait for its result slot
+        deadline = time.time() + self.lock_ttl
+        while time.time() < deadline:
+            try:
+                raw = client.get(result_key)
+                if raw is not None:
+                    self._count('coalesced_remote')
+                    return json.loads(raw)
+                if not client.exists(lock_key):
+                    break
+            except Exception:
+                break
+            time.sleep(self.poll_interval)
+
+        # The other process failed or did not share its result
+        self._count('leaders')
+        return fn()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get coalescing metrics for this process"""
+        with self._lock:
+            return dict(self.stats)
+
+    def _count(self, metric: str):
+        with self._lock:
+            self.stats[metric] += 1
+
+
+_single_flights: Dict[str, SingleFlight] = {}
+_single_flights_lock = threading.Lock()
+
+
+def get_single_flight(namespace: str) -> SingleFlight:
+    """Get the process-wide single-flight group for an upstream API"""
+    with _single_flights_lock:
+        group = _single_flights.get(namespace)
+        if group is None:
+            group = SingleFlight(namespace)
+            _single_flights[namespace] = group
+        return group
@@ -1,3 +1,91 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from api_integration.rate_limiter import SlidingWindowRateLimiter
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@override_settings(API_STATE_BACKEND='local')
+class SlidingWindowRateLimiterTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('api_integration.rate_limiter.time.time', self.clock.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_calls(self, limiter, duration, step):
+        """Call try_acquire every step seconds and return the times of the granted calls"""
+        grants = []
+        end = self.clock.now + duration
+        while self.clock.now < end:
+            if limiter.try_acquire() <= 0:
+                grants.append(self.clock.now)
+            self.clock.now += step
+        return grants
+
+    def assert_within_limit(self, grants, max_calls, time_window):
+        for start in grants:
+            in_window = [t for t in grants if start <= t < start + time_window]
+            self.assertLessEqual(len(in_window), max_calls, f"window starting at {start}")
+
+    def test_no_more_than_max_calls_in_any_window(self):
+        limiter = SlidingWindowRateLimiter('test', max_calls=10, time_window=60)
+
+        grants = self.run_calls(limiter, duration=600, step=0.5)
+
+        self.assert_within_limit(grants, 10, 60)
+        self.assertEqual(len(grants), 100)
+
+    def test_full_burst_when_idle(self):
+        limiter = SlidingWindowRateLimiter('test', max_calls=10, time_window=60)
+
+        waits = [limiter.try_acquire() for _ in range(11)]
+
+        self.assertEqual(waits[:10], [0.0] * 10)
+        self.assertAlmostEqual(waits[10], 60)
+
+    def test_waiting_for_the_reported_wait_gets_a_slot(self):
+        limiter = SlidingWindowRateLimiter('test', max_calls=10, time_window=60)
+        grants = []
+
+        for _ in range(35):
+            wait = limiter.try_acquire()
+            while wait > 0:
+                self.clock.now += wait
+                wait = limiter.try_acquire()
+            grants.append(self.clock.now)
+            self.clock.now += 1
+
+        self.assert_within_limit(grants, 10, 60)
+
+    def test_server_quota_limits_calls_until_reset(self):
+        limiter = SlidingWindowRateLimiter('test', max_calls=10, time_window=60)
+        limiter.try_acquire()
+
+        limiter.sync(available=2, reset_after=30)
+        # A late response with an older, higher count gives nothing back
+        limiter.sync(available=6, reset_after=32)
+
+        waits = [limiter.try_acquire() for _ in range(3)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 30)
+
+        self.clock.now += 30
+        self.assertEqual(limiter.try_acquire(), 0.0)
+
+    def test_block_for_hands_out_nothing(self):
+        limiter = SlidingWindowRateLimiter('test', max_calls=10, time_window=60)
+
+        limiter.block_for(90)
+
+        self.assertAlmostEqual(limiter.try_acquire(), 90)
+        self.clock.now += 90
+        self.assertEqual(limiter.try_acquire(), 0.0)
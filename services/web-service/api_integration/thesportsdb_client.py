@@ -1,27 +1,65 @@
 import requests
 import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from urllib.parse import quote
 
+from django.conf import settings
+
+from api_integration.rate_limiter import RateLimitExceeded, SlidingWindowRateLimiter, get_rate_limiter
+from api_integration.http_cache import build_request_key, get_response_cache
+from api_integration.single_flight import get_single_flight
+from api_integration.health import get_health_monitor
+
 logger = logging.getLogger('mark_foot')
 
 
+def get_thesportsdb_rate_limiter(api_key: Optional[str] = None) -> SlidingWindowRateLimiter:
+    """
+    Get the pacing shared by every TheSportsDB client of a tier
+    
+    Requests are spaced evenly rather than allowed in bursts, and every
+    client, thread and (with the Redis backend) worker of the same tier
+    draws from the one limiter.
+    
+    Args:
+        api_key: Premium API key, None for the free tier
+    """
+    if api_key:
+        return get_rate_limiter('thesportsdb_premium', max_calls=1,
+                                time_window=60 / settings.THESPORTSDB_PREMIUM_RATE_LIMIT)
+    return get_rate_limiter('thesportsdb', max_calls=1, time_window=60 / settings.THESPORTSDB_FREE_RATE_LIMIT)
+
+
 class TheSportsDBClient:
     """
     Client for TheSportsDB API
     Documentation: https://www.thesportsdb.com/api.php
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_wait: Optional[float] = None,
+                 use_cache: bool = True):
+        """
+        Args:
+            api_key: Optional API key for premium features
+            max_wait: Longest time to sleep for a rate limit slot before raising
+                      RateLimitExceeded (None = always wait)
+            use_cache: Serve and revalidate responses through the response cache
+        """
         self.base_url = "https://www.thesportsdb.com/api/v1/json"
-        self.api_key = api_key
+        self.api_key = api_key or settings.THESPORTSDB_API_KEY or None
         self.session = requests.Session()
         
-        # Rate limiting - Be respectful to free API
-        self.last_request_time = 0
-        self.min_request_interval = 0.5  # 0.5 seconds between requests
+        # Rate limiting - Be respectful to the API. The limiter is shared by
+        # every client and thread, so concurrent collection keeps the same pace
+        self.rate_limiter = get_thesportsdb_rate_limiter(self.api_key)
+        self.min_request_interval = self.rate_limiter.time_window
+        self.max_wait = max_wait
+        self.cache = get_response_cache('thesportsdb') if use_cache else None
+        self.single_flight = get_single_flight('thesportsdb')
+        self.health = get_health_monitor('thesportsdb')
         
         # Configure session headers
         self.session.headers.update({
@@ -31,15 +69,7 @@ class TheSportsDBClient:
     
     def _wait_for_rate_limit(self):
         """Ensure we don't exceed rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_request_interval:
-            wait_time = self.min_request_interval - time_since_last
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
-            time.sleep(wait_time)
-        
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire(max_wait=self.max_wait)
     
     def get_player_transfers(self, player_id: str) -> Optional[List[Dict]]:
         """
@@ -64,6 +94,8 @@ class TheSportsDBClient:
             logger.warning(f"⚠️ No transfers found for player {player_id}")
             return []
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error fetching transfers for player {player_id}: {str(e)}")
             return None
@@ -91,6 +123,8 @@ class TheSportsDBClient:
             logger.warning(f"⚠️ No career data found for player {player_id}")
             return []
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error fetching career for player {player_id}: {str(e)}")
             return None
@@ -121,6 +155,8 @@ class TheSportsDBClient:
             logger.warning(f"⚠️ No stats found for player {player_id}")
             return []
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error fetching stats for player {player_id}: {str(e)}")
             return None
@@ -148,6 +184,8 @@ class TheSportsDBClient:
             logger.warning(f"⚠️ No milestones found for player {player_id}")
             return []
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error fetching milestones for player {player_id}: {str(e)}")
             return None
@@ -191,6 +229,25 @@ class TheSportsDBClient:
 
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make HTTP request to TheSportsDB API"""
+        request_key = build_request_key('thesportsdb', endpoint, params)
+        
+        cached = None
+        if self.cache is not None:
+            _, cached, fresh = self.cache.lookup(endpoint, params)
+            if fresh:
+                logger.debug(f"📦 TheSportsDB Cache hit: {endpoint}")
+                return cached['data']
+        
+        # Identical concurrent requests share one upstream call
+        return self.single_flight.do(
+            request_key,
+            lambda: self._fetch(endpoint, params, request_key, cached),
+            should_share=lambda data: data is not None
+        )
+    
+    def _fetch(self, endpoint: str, params: Optional[Dict], cache_key: str,
+               cached: Optional[Dict]) -> Optional[Dict]:
+        """Perform the upstream request, revalidating a stale cache entry if any"""
         self._wait_for_rate_limit()
         
         try:
@@ -203,18 +260,29 @@ class TheSportsDBClient:
             logger.info(f"🔗 TheSportsDB Request: {endpoint}")
             start_time = time.time()
             
-            response = self.session.get(url, params=params, timeout=30)
+            headers = self.cache.conditional_headers(cached) if cached else {}
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
             
             execution_time = int((time.time() - start_time) * 1000)
             logger.info(f"📊 TheSportsDB Response: {response.status_code} - Time: {execution_time}ms")
+            self.health.record(response.status_code)
+            
+            if response.status_code == 304 and cached is not None:
+                return self.cache.revalidated(cache_key, cached, endpoint)['data']
             
             response.raise_for_status()
             data = response.json()
             
+            if self.cache is not None:
+                self.cache.store(cache_key, endpoint, data, response.headers)
+            
             return data
             
         except requests.exceptions.RequestException as e:
             logger.error(f"❌ TheSportsDB API Error: {str(e)}")
+            if getattr(e, 'response', None) is None:
+                # Connection errors and timeouts; responses were recorded above
+                self.health.record(None, str(e))
             return None
         except Exception as e:
             logger.error(f"❌ Unexpected error in TheSportsDB request: {str(e)}")
@@ -249,6 +317,8 @@ class TheSportsDBClient:
                 logger.info(f"🔍 No players found for '{player_name}'")
                 return []
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error searching players for '{player_name}': {str(e)}")
             return []
@@ -276,6 +346,8 @@ class TheSportsDBClient:
                 logger.warning(f"🔍 No player found for ID: {player_id}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error getting player by ID {player_id}: {str(e)}")
             return None
@@ -309,6 +381,8 @@ class TheSportsDBClient:
                 logger.info(f"🔍 No players found for team '{team_name}'")
                 return []
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error getting team players for '{team_name}': {str(e)}")
             return []
@@ -341,30 +415,123 @@ class TheSportsDBClient:
                 logger.info(f"🔍 No teams found for '{team_name}'")
                 return []
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error searching teams for '{team_name}': {str(e)}")
             return []
     
-    def get_league_players(self, league_name: str) -> List[Dict]:
+    def get_league_teams(self, league_name: str) -> List[Dict]:
+        """
+        Get every team of a league
+        
+        Args:
+            league_name: Name of the league as TheSportsDB knows it (e.g. "English Premier League")
+            
+        Returns:
+            List of team dictionaries
+        """
+        if not league_name or len(league_name.strip()) < 2:
+            logger.warning("League name too short for search")
+            return []
+        
+        endpoint = f"search_all_teams.php?l={quote(league_name.strip())}"
+        
+        try:
+            data = self._make_request(endpoint)
+            teams = (data or {}).get('teams') or []
+            logger.info(f"✅ Found {len(teams)} teams in league '{league_name}'")
+            return teams
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Error getting teams for league '{league_name}': {str(e)}")
+            return []
+    
+    def iter_team_rosters(self, teams: List[Dict],
+                          max_workers: Optional[int] = None) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """
+        Crawl the rosters of several teams, yielding each one as soon as it is fetched
+        
+        Rosters are fetched by a pool of worker threads, paced by the shared
+        rate limiter; the next ones keep downloading while the caller handles
+        a roster. At most two rosters per worker are in flight, so a slow or
+        abandoned consumer does not let the crawl run ahead.
+        
+        Args:
+            teams: Team dictionaries with a 'strTeam' name
+            max_workers: Concurrent roster fetches (defaults to PLAYER_COLLECTION_CONCURRENCY)
+            
+        Yields:
+            Tuples of (team dictionary, list of player dictionaries), in completion order
+            
+        Raises:
+            RateLimitExceeded: if a fetch gives up waiting for a rate limit slot
+        """
+        if not teams:
+            return
+        
+        max_workers = max_workers or settings.PLAYER_COLLECTION_CONCURRENCY
+        pending_teams = iter(teams)
+        in_flight = {}
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='league-crawl')
+        
+        def submit_next():
+            team = next(pending_teams, None)
+            if team is not None:
+                in_flight[executor.submit(self.get_team_players, team['strTeam'])] = team
+        
+        try:
+            for _ in range(max_workers * 2):
+                submit_next()
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    team = in_flight.pop(future)
+                    submit_next()
+                    yield team, future.result()
+        finally:
+            # Stop fetching rosters nobody will read
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def iter_league_players(self, league_name: str, max_teams: Optional[int] = None,
+                            max_workers: Optional[int] = None) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """
+        Crawl the rosters of a league, yielding each one as soon as it is fetched
+        
+        Args:
+            league_name: Name of the league
+            max_teams: Crawl only the first teams of the league (None = every team)
+            max_workers: Concurrent roster fetches (defaults to PLAYER_COLLECTION_CONCURRENCY)
+            
+        Yields:
+            Tuples of (team dictionary, list of player dictionaries), in completion order
+        """
+        teams = [team for team in self.get_league_teams(league_name) if team.get('strTeam')]
+        if max_teams is not None:
+            teams = teams[:max_teams]
+        
+        yield from self.iter_team_rosters(teams, max_workers=max_workers)
+    
+    def get_league_players(self, league_name: str, max_teams: Optional[int] = 10,
+                           max_workers: Optional[int] = None) -> List[Dict]:
         """
         Get players from a specific league
         
         Args:
             league_name: Name of the league
+            max_teams: Crawl only the first teams of the league (None = full league)
+            max_workers: Concurrent roster fetches (defaults to PLAYER_COLLECTION_CONCURRENCY)
             
         Returns:
             List of player dictionaries
         """
-        # First search for teams in the league, then get players from those teams
-        teams = self.search_teams(league_name)
         all_players = []
         
-        for team in teams[:10]:  # Limit to first 10 teams to avoid too many requests
-            team_name = team.get('strTeam', '')
-            if team_name:
-                players = self.get_team_players(team_name)
-                all_players.extend(players)
-                time.sleep(0.5)  # Be extra careful with rate limiting
+        for _, players in self.iter_league_players(league_name, max_teams=max_teams, max_workers=max_workers):
+            all_players.extend(players)
         
         logger.info(f"✅ Found {len(all_players)} total players for league '{league_name}'")
         return all_players
@@ -387,10 +554,31 @@ class TheSportsDBClient:
                 logger.warning("⚠️ TheSportsDB API connected but no test data returned")
                 return False
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ TheSportsDB API connection failed: {str(e)}")
             return False
     
+    def ping(self) -> bool:
+        """
+        Make one cheap uncached request, recording its outcome in the health state
+        
+        Returns:
+            True if the API answered
+        """
+        endpoint = 'all_sports.php'
+        return self._fetch(endpoint, None, build_request_key('thesportsdb', endpoint, None), None) is not None
+    
+    def is_available(self) -> bool:
+        """
+        Check the API health from recent requests, probing it only if there were none
+        
+        Returns:
+            True if the API is usable
+        """
+        return self.health.is_available(probe=self.ping)
+    
     def get_api_info(self) -> Dict[str, Any]:
         """
         Get information about current API usage and limits
@@ -402,7 +590,9 @@ class TheSportsDBClient:
             'base_url': self.base_url,
             'has_api_key': self.api_key is not None,
             'tier': 'Premium' if self.api_key else 'Free',
-            'rate_limit': f"1 request per {self.min_request_interval} seconds",
+            'rate_limit': f"1 request per {self.min_request_interval:g} seconds ({self.rate_limiter.backend})",
+            'cache': self.cache.get_stats() if self.cache is not None else {'backend': 'none'},
+            'health': self.health.get_status(),
             'features': {
                 'player_search': True,
                 'team_search': True,
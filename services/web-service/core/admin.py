@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Area, Competition, Team, Season, Match, Standing, ApiSyncLog
+from .models import Area, Competition, Team, Season, Match, Standing, ApiSyncLog, PlayerWatchlistEntry
 
 
 @admin.register(Area)
@@ -70,3 +70,11 @@ class ApiSyncLogAdmin(admin.ModelAdmin):
     
     def has_change_permission(self, request, obj=None):
         return False  # Prevent editing
+
+
+@admin.register(PlayerWatchlistEntry)
+class PlayerWatchlistEntryAdmin(admin.ModelAdmin):
+    list_display = ['name', 'external_id', 'is_active', 'resolved_at', 'last_refreshed']
+    list_filter = ['is_active']
+    search_fields = ['name', 'external_id']
+    readonly_fields = ['resolved_at', 'last_refreshed', 'created_at', 'updated_at']
@@ -0,0 +1,37 @@
+from typing import List, Sequence
+
+from django.db import connections
+
+
+def bulk_upsert(model, objs: List, unique_fields: Sequence[str], update_fields: Sequence[str],
+                batch_size: int = 500) -> int:
+    """
+    Insert or update rows with one multi-row statement per batch
+
+    Args:
+        model: Model class of the rows
+        objs: Unsaved model instances
+        unique_fields: Fields of the unique key a conflict is detected on
+        update_fields: Fields overwritten when the row already exists
+        batch_size: Rows per statement
+
+    Returns:
+        Number of rows written
+    """
+    if not objs:
+        return 0
+
+    options = {
+        'update_conflicts': True,
+        'update_fields': list(update_fields),
+        'batch_size': batch_size,
+    }
+
+    # MySQL's ON DUPLICATE KEY UPDATE picks the unique key itself and
+    # rejects an explicit conflict target
+    features = connections[model.objects.db].features
+    if features.supports_update_conflicts_with_target:
+        options['unique_fields'] = list(unique_fields)
+
+    model.objects.bulk_create(objs, **options)
+    return len(objs)
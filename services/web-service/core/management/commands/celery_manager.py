@@ -3,6 +3,7 @@ from data_management.tasks import (
     sync_live_matches, sync_all_standings, sync_all_teams,
     sync_full_data, health_check, sync_competition_data
 )
+from data_management.live_scheduler import LiveMatchScheduler
 from django_celery_beat.models import PeriodicTask, IntervalSchedule, CrontabSchedule
 import json
 
@@ -13,7 +14,7 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
             'action',
-            choices=['run', 'schedule', 'status', 'health'],
+            choices=['run', 'schedule', 'status', 'health', 'live_plan'],
             help='Action to perform'
         )
         parser.add_argument(
@@ -44,6 +45,8 @@ class Command(BaseCommand):
             self.show_status()
         elif action == 'health':
             self.run_health_check()
+        elif action == 'live_plan':
+            self.show_live_plan()
 
     def run_task(self, options):
         """Run a specific task manually"""
@@ -93,9 +96,9 @@ class Command(BaseCommand):
         try:
             # Create schedules
             
-            # Every 30 minutes for live matches
-            schedule_30min, _ = IntervalSchedule.objects.get_or_create(
-                every=30,
+            # Every minute for the live matches planner
+            schedule_1min, _ = IntervalSchedule.objects.get_or_create(
+                every=1,
                 period=IntervalSchedule.MINUTES,
             )
             
@@ -135,10 +138,10 @@ class Command(BaseCommand):
             # Create periodic tasks
             tasks = [
                 {
-                    'name': 'Sync Live Matches',
-                    'task': 'data_management.tasks.sync_live_matches',
-                    'schedule': schedule_30min,
-                    'description': 'Sync live and today\'s matches every 30 minutes'
+                    'name': 'Schedule Live Matches',
+                    'task': 'data_management.tasks.schedule_live_matches',
+                    'schedule': schedule_1min,
+                    'description': 'Sync live matches when the fixture calendar calls for it'
                 },
                 {
                     'name': 'Daily Standings Sync',
@@ -166,6 +169,13 @@ class Command(BaseCommand):
                 }
             ]
             
+            # Live matches are no longer polled on a fixed interval
+            disabled = PeriodicTask.objects.filter(
+                task='data_management.tasks.sync_live_matches', enabled=True
+            ).update(enabled=False)
+            if disabled:
+                self.stdout.write(f'  ⏸️  Disabled {disabled} fixed-interval live matches task(s)')
+            
             created_count = 0
             updated_count = 0
             
@@ -233,6 +243,40 @@ class Command(BaseCommand):
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'❌ Error getting task status: {str(e)}'))
 
+    def show_live_plan(self):
+        """Show the live matches polling plan computed from the fixture calendar"""
+        self.stdout.write('⚽ Live Matches Polling Plan')
+        self.stdout.write('=' * 50)
+        
+        try:
+            plan = LiveMatchScheduler().get_plan()
+            
+            self.stdout.write(f'Mode: {plan["mode"]}')
+            self.stdout.write(f'Poll due: {"yes" if plan["due"] else "no"}')
+            if plan['poll_interval']:
+                self.stdout.write(f'Poll interval: {plan["poll_interval"]}s')
+            self.stdout.write(f'Last poll: {plan["last_poll_at"] or "never"}')
+            self.stdout.write(f'Next poll: {plan["next_poll_at"] or "none planned"}')
+            self.stdout.write(
+                f'Matches: {len(plan["live_matches"])} live, '
+                f'{len(plan["pre_match_matches"])} about to start, '
+                f'{plan["upcoming_matches"]} upcoming'
+            )
+            
+            if not plan['windows']:
+                self.stdout.write('\n📭 No polling windows in the next hours')
+                return
+            
+            self.stdout.write('\n🕐 Polling windows:')
+            for window in plan['windows']:
+                self.stdout.write(
+                    f'   {window["start"]} → {window["end"]}: '
+                    f'{window["matches"]} matches ({", ".join(window["competitions"])})'
+                )
+            
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'❌ Error computing live plan: {str(e)}'))
+
     def run_health_check(self):
         """Run immediate health check"""
         self.stdout.write('🏥 Running health check...')
@@ -64,7 +64,7 @@ class Command(BaseCommand):
         for comp in competitions:
             seasons = Season.objects.filter(competition=comp).count()
             matches = Match.objects.filter(competition=comp).count()
-            standings = Standing.objects.filter(competition=comp).count()
+            standings = Standing.objects.filter(competition=comp).latest_snapshot().count()
             
             # Get unique teams from matches
             home_teams = Match.objects.filter(competition=comp).values_list('home_team_id', flat=True)
@@ -110,7 +110,7 @@ class Command(BaseCommand):
         self.stdout.write(f'\n📅 Seasons ({seasons.count()}):')
         for season in seasons:
             matches_count = Match.objects.filter(competition=competition, season=season).count()
-            standings_count = Standing.objects.filter(competition=competition, season=season).count()
+            standings_count = Standing.objects.filter(competition=competition, season=season).latest_snapshot().count()
             self.stdout.write(
                 f'  - {season.start_date.year}: {matches_count} matches, {standings_count} standings'
             )
@@ -138,7 +138,7 @@ class Command(BaseCommand):
                 competition=competition,
                 season=latest_season,
                 type='TOTAL'
-            ).order_by('position')[:5]
+            ).latest_snapshot().order_by('position')[:5]
             
             if top_standings:
                 self.stdout.write(f'\n📊 Current Standings (Top 5):')
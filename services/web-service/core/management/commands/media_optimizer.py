@@ -1,11 +1,12 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from core.models import Player
+from api_integration.rate_limiter import get_rate_limiter
 import requests
 import os
 import hashlib
 from urllib.parse import urlparse
-import time
 
 
 class Command(BaseCommand):
@@ -110,9 +111,6 @@ class Command(BaseCommand):
                     self.stdout.write(f'  ✂️ Cutout: ❌ Invalid or unreachable')
             
             total_checked += 1
-            
-            # Rate limiting for external requests
-            time.sleep(0.5)
         
         self.stdout.write(f'\n📊 Validation Results:')
         self.stdout.write(f'  • Players Checked: {total_checked}')
@@ -170,9 +168,6 @@ class Command(BaseCommand):
                 else:
                     self.stdout.write(f'  ✂️ Cutout: ❌ Failed')
                     failed += 1
-            
-            # Rate limiting
-            time.sleep(1)
         
         self.stdout.write(f'\n📊 Download Results:')
         self.stdout.write(f'  • Downloaded: {downloaded}')
@@ -212,9 +207,14 @@ class Command(BaseCommand):
         self.stdout.write(f'  • Files Removed: {removed_count}')
         self.stdout.write(f'  • Cache Directory: {cache_dir}')
 
+    def _media_rate_limiter(self):
+        """Pacing shared by every image request to TheSportsDB's media server"""
+        return get_rate_limiter('thesportsdb_media', max_calls=1, time_window=60 / settings.THESPORTSDB_MEDIA_RATE_LIMIT)
+
     def _validate_url(self, url: str) -> bool:
         """Validate that a URL is accessible"""
         try:
+            self._media_rate_limiter().acquire()
             response = requests.head(url, timeout=10, allow_redirects=True)
             return response.status_code == 200
         except Exception:
@@ -241,6 +241,7 @@ class Command(BaseCommand):
                 return 'exists'
             
             # Download image
+            self._media_rate_limiter().acquire()
             response = requests.get(url, timeout=30, stream=True)
             response.raise_for_status()
             
@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
 from data_management.collectors.player_collector import PlayerDataCollector
-from core.models import Player, Team
+from data_management.collectors.squad_ingestion import SQUAD_EXTERNAL_ID_PREFIX
+from django.db.models import Q
+from core.models import Player, PlayerWatchlistEntry, Team
 from django.utils import timezone
 
 
@@ -10,7 +12,10 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
             '--action',
-            choices=['test', 'search', 'team', 'all-teams', 'stats', 'transfers', 'detailed', 'comprehensive'],
+            choices=[
+                'test', 'search', 'team', 'all-teams', 'stats', 'transfers', 'detailed', 'comprehensive',
+                'watchlist', 'popular', 'league'
+            ],
             default='test',
             help='Action to perform'
         )
@@ -27,6 +32,12 @@ class Command(BaseCommand):
             help='Team name to collect players for'
         )
         
+        parser.add_argument(
+            '--league',
+            type=str,
+            help='League name to collect every team\'s players for (e.g. "English Premier League")'
+        )
+        
         parser.add_argument(
             '--player-id',
             type=str,
@@ -38,6 +49,36 @@ class Command(BaseCommand):
             type=str,
             help='Specific season for statistics (e.g., "2023-2024")'
         )
+        
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Concurrent API fetches for all-teams, league and comprehensive (default: PLAYER_COLLECTION_CONCURRENCY)'
+        )
+        
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Process rosters and players even when unchanged since the last sync'
+        )
+        
+        parser.add_argument(
+            '--watch',
+            type=str,
+            help='Player name to add to the watchlist (pin its ID with --player-id)'
+        )
+        
+        parser.add_argument(
+            '--unwatch',
+            type=str,
+            help='Player name or ID to remove from the watchlist'
+        )
+        
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue the last interrupted all-teams or comprehensive run from its checkpoint'
+        )
 
     def handle(self, *args, **options):
         action = options['action']
@@ -58,7 +99,7 @@ class Command(BaseCommand):
         elif action == 'team':
             self.collect_team_players(collector, options)
         elif action == 'all-teams':
-            self.collect_all_teams_players(collector)
+            self.collect_all_teams_players(collector, options)
         elif action == 'stats':
             self.show_player_stats()
         elif action == 'transfers':
@@ -67,6 +108,12 @@ class Command(BaseCommand):
             self.collect_detailed_statistics(collector, options)
         elif action == 'comprehensive':
             self.collect_comprehensive_data(collector, options)
+        elif action == 'watchlist':
+            self.manage_watchlist(options)
+        elif action == 'popular':
+            self.sync_watchlist_players(collector, options)
+        elif action == 'league':
+            self.collect_league_players(collector, options)
 
     def test_connection(self, collector):
         """Test API connection"""
@@ -85,6 +132,14 @@ class Command(BaseCommand):
             self.stdout.write(f'  • Tier: {api_info["tier"]}')
             self.stdout.write(f'  • Rate Limit: {api_info["rate_limit"]}')
             self.stdout.write(f'  • Has API Key: {api_info["has_api_key"]}')
+            self.stdout.write(
+                f'  • Response Cache: {api_info["cache"]["backend"]}'
+                f' (hit rate: {api_info["cache"].get("hit_rate", 0.0)}%)'
+            )
+            self.stdout.write(
+                f'  • Health: {api_info["health"]["state"]}'
+                f' ({api_info["health"]["consecutive_failures"]} failures in a row)'
+            )
             
         else:
             self.stdout.write(
@@ -135,7 +190,7 @@ class Command(BaseCommand):
                 self.style.ERROR(f'❌ Error collecting team players: {str(e)}')
             )
 
-    def collect_all_teams_players(self, collector):
+    def collect_all_teams_players(self, collector, options):
         """Collect players for all teams in database"""
         teams_count = Team.objects.count()
         
@@ -158,19 +213,125 @@ class Command(BaseCommand):
         
         try:
             start_time = timezone.now()
-            stats = collector.collect_players_for_existing_teams()
+            stats = collector.collect_players_for_existing_teams(
+                max_workers=options.get('workers'),
+                force=options.get('force', False),
+                resume=options.get('resume', False)
+            )
             end_time = timezone.now()
             
             duration = (end_time - start_time).total_seconds()
             
             self.stdout.write(f'\n⏱️ Collection completed in {duration:.1f} seconds')
             self.show_collection_results(stats)
+            self.stdout.write(f'  💤 Unchanged teams: {stats.get("unchanged_teams", 0)}')
+            self.stdout.write(f'  🧑 Teams covered by football-data squads: {stats.get("covered_teams", 0)}')
+            self.show_team_timings(stats.get('teams', []))
+            self.show_run_checkpoint(stats.get('run'))
             
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'❌ Error collecting all team players: {str(e)}')
             )
 
+    def manage_watchlist(self, options):
+        """Add or remove watchlist entries, then list the watchlist"""
+        watch = options.get('watch')
+        unwatch = options.get('unwatch')
+        player_id = options.get('player_id') or ''
+        
+        if watch:
+            entry, created = PlayerWatchlistEntry.objects.get_or_create(name=watch.strip())
+            entry.is_active = True
+            if player_id:
+                entry.external_id = player_id
+                entry.resolved_at = timezone.now()
+            entry.save()
+            self.stdout.write(
+                self.style.SUCCESS(f'✅ {"Added" if created else "Re-activated"} watchlist entry: {entry}')
+            )
+        
+        if unwatch:
+            count = PlayerWatchlistEntry.objects.filter(
+                Q(name__iexact=unwatch.strip()) | Q(external_id=unwatch.strip())
+            ).update(is_active=False)
+            if count:
+                self.stdout.write(self.style.SUCCESS(f'✅ Removed {count} watchlist entries'))
+            else:
+                self.stdout.write(self.style.WARNING(f'⚠️ No watchlist entry matches "{unwatch}"'))
+        
+        entries = PlayerWatchlistEntry.objects.filter(is_active=True)
+        self.stdout.write(f'\n⭐ Watchlist ({entries.count()} players):')
+        for entry in entries:
+            refreshed = entry.last_refreshed.strftime('%Y-%m-%d %H:%M') if entry.last_refreshed else 'never'
+            self.stdout.write(f'  • {entry.name:<30} {entry.external_id or "unresolved":<12} refreshed: {refreshed}')
+
+    def collect_league_players(self, collector, options):
+        """Collect players for every team of a league"""
+        league_name = options.get('league')
+        if not league_name:
+            self.stdout.write(self.style.ERROR('❌ Please provide a league name with --league'))
+            return
+        
+        self.stdout.write(f'\n🏆 Collecting players for league: "{league_name}"')
+        self.stdout.write('-' * 40)
+        
+        try:
+            start_time = timezone.now()
+            stats = collector.collect_league_players(
+                league_name,
+                max_workers=options.get('workers'),
+                force=options.get('force', False)
+            )
+            duration = (timezone.now() - start_time).total_seconds()
+            
+            self.stdout.write(f'\n⏱️ Collection completed in {duration:.1f} seconds')
+            self.show_collection_results(stats)
+            self.stdout.write(f'  🏟️ Teams: {stats["teams_processed"]} ({stats["unchanged_teams"]} unchanged)')
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'❌ Error collecting league players: {str(e)}'))
+
+    def sync_watchlist_players(self, collector, options):
+        """Refresh the players on the watchlist now"""
+        self.stdout.write('\n⭐ Refreshing watchlist players...')
+        self.stdout.write('-' * 40)
+        
+        try:
+            stats = collector.collect_watchlist_players(force=options.get('force', False))
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'❌ Error refreshing watchlist: {str(e)}'))
+            return
+        
+        self.show_collection_results(stats)
+        if stats['resolved']:
+            self.stdout.write(f'  🔗 Newly resolved: {", ".join(stats["resolved"])}')
+        if stats['unresolved']:
+            self.stdout.write(self.style.WARNING(f'  ⚠️ Not found: {", ".join(stats["unresolved"])}'))
+
+    def show_run_checkpoint(self, run):
+        """Show the cumulative progress of a checkpointed run"""
+        if not run:
+            return
+        
+        self.stdout.write(
+            f'\n📌 Run #{run["id"]} {run["status"]}: '
+            f'{run["processed_items"]}/{run["total_items"]} items, cumulative stats: {run["stats"]}'
+        )
+
+    def show_team_timings(self, team_timings, limit=5):
+        """Show the slowest teams of an all-teams collection"""
+        if not team_timings:
+            return
+        
+        slowest = sorted(team_timings, key=lambda t: t['fetch_ms'] + t['write_ms'], reverse=True)[:limit]
+        
+        self.stdout.write(f'\n🐢 Slowest teams:')
+        for timing in slowest:
+            self.stdout.write(
+                f'  {timing["team"]}: {timing["players"]} players, '
+                f'fetch {timing["fetch_ms"]}ms, write {timing["write_ms"]}ms'
+            )
+
     def show_collection_results(self, stats, indent=''):
         """Show collection results with optional indentation"""
         self.stdout.write(f'{indent}📊 Collection Results:')
@@ -315,7 +476,7 @@ class Command(BaseCommand):
                 self.stdout.write('Operation cancelled.')
                 return
             
-            self.collect_comprehensive_all_players(collector)
+            self.collect_comprehensive_all_players(collector, options)
             return
         
         self.stdout.write(f'\n🔍 Collecting comprehensive data for player ID: "{player_id}"')
@@ -335,55 +496,53 @@ class Command(BaseCommand):
                 self.style.ERROR(f'❌ Error collecting comprehensive data: {str(e)}')
             )
 
-    def collect_comprehensive_all_players(self, collector):
+    def collect_comprehensive_all_players(self, collector, options):
         """Collect comprehensive data for all existing players"""
         from core.models import Player
         
-        players = Player.objects.all()
+        # Squad-only players have no TheSportsDB ID to look up yet
+        players = Player.objects.exclude(external_id__startswith=SQUAD_EXTERNAL_ID_PREFIX).order_by('id')
         total_players = players.count()
         
         if total_players == 0:
             self.stdout.write(
-                self.style.WARNING('⚠️ No players found in database.')
+                self.style.WARNING('⚠️ No TheSportsDB players found in database.')
             )
             return
         
         self.stdout.write(f'\n🔍 Collecting comprehensive data for {total_players} players...')
         self.stdout.write('-' * 60)
         
-        overall_stats = {
-            'transfers': {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0},
-            'statistics': {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0},
-            'career': {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
-        }
+        def show_progress(written, results):
+            total_created = sum(stats['created'] for stats in results.values())
+            total_updated = sum(stats['updated'] for stats in results.values())
+            self.stdout.write(
+                f'  📊 [{written}/{total_players}] players written this run: '
+                f'{total_created} created, {total_updated} updated'
+            )
         
-        for i, player in enumerate(players, 1):
-            self.stdout.write(f'\n📊 [{i}/{total_players}] Processing: {player.name}')
-            
-            try:
-                results = collector.collect_comprehensive_player_data(player.external_id)
-                
-                # Aggregate stats
-                for data_type, stats in results.items():
-                    for key in overall_stats[data_type]:
-                        overall_stats[data_type][key] += stats.get(key, 0)
-                
-                # Show brief results
-                total_created = sum(stats.get('created', 0) for stats in results.values())
-                total_updated = sum(stats.get('updated', 0) for stats in results.values())
-                
-                self.stdout.write(f'  ✅ {total_created} created, {total_updated} updated')
-                
-            except Exception as e:
-                self.stdout.write(f'  ❌ Error: {str(e)}')
-                for data_type in overall_stats:
-                    overall_stats[data_type]['failed'] += 1
+        start_time = timezone.now()
+        try:
+            overall_stats = collector.collect_comprehensive_data_for_players(
+                list(players.values_list('external_id', flat=True)),
+                fetch_workers=options.get('workers'),
+                on_batch=show_progress,
+                resume=options.get('resume', False)
+            )
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'❌ Error collecting comprehensive data: {str(e)}'))
+            return
+        
+        duration = (timezone.now() - start_time).total_seconds()
+        self.stdout.write(f'\n⏱️ Collection completed in {duration:.1f} seconds')
         
         # Show final results
+        run = overall_stats.pop('run', None)
         self.stdout.write(f'\n🎯 Final Comprehensive Results:')
         for data_type, stats in overall_stats.items():
             self.stdout.write(f'\n🔹 {data_type.title()}:')
             self.show_collection_results(stats, indent='  ')
+        self.show_run_checkpoint(run)
 
     def show_collection_results(self, stats, indent=''):
         """Show collection results with optional indentation"""
@@ -1,7 +1,10 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 from api_integration.football_data_client import FootballDataAPIClient
-from core.models import Competition, Team, Season, Match, Standing, ApiSyncLog
+from core.models import Competition, Team, Season, Match, ApiSyncLog
+from data_management.collectors.squad_ingestion import ingest_team_squads
+from data_management.standings import build_standings, save_standings, standings_team_ids
 import json
 from datetime import datetime
 
@@ -148,6 +151,13 @@ class Command(BaseCommand):
                 )
             )
             
+            # Players come from the squads in the same payload
+            squad_stats = ingest_team_squads(teams_data.get('teams', []))
+            self.stdout.write(
+                f'  🧑 Squad players: Created {squad_stats["created"]}, Updated {squad_stats["updated"]}, '
+                f'Unchanged {squad_stats["skipped"]}, Failed {squad_stats["failed"]}'
+            )
+            
             # Log sync
             from django.utils import timezone
             ApiSyncLog.objects.create(
@@ -183,95 +193,136 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING('⚠️ No matches data available'))
                 return
             
-            matches_created = 0
-            matches_updated = 0
             matches_list = matches_data.get('matches', [])
             
             if limit:
                 matches_list = matches_list[:limit]
                 self.stdout.write(f'📝 Limited to {limit} matches for testing')
             
+            # One query for both teams of every match, one for the matches already stored
+            team_ids = set()
+            for match_data in matches_list:
+                team_ids.add(match_data['homeTeam']['id'])
+                team_ids.add(match_data['awayTeam']['id'])
+            teams = Team.objects.in_bulk(list(team_ids))
+            existing_matches = Match.objects.in_bulk([match_data['id'] for match_data in matches_list])
+            
+            new_matches = []
+            changed_matches = []
+            changed_fields = set()
+            skipped_matches = []
+            unchanged_count = 0
+            now = timezone.now()
+            
             for match_data in matches_list:
-                # Get teams
-                home_team_id = match_data['homeTeam']['id']
-                away_team_id = match_data['awayTeam']['id']
+                home_team = teams.get(match_data['homeTeam']['id'])
+                away_team = teams.get(match_data['awayTeam']['id'])
+                if home_team is None or away_team is None:
+                    skipped_matches.append(match_data['id'])
+                    continue
+                
+                score = match_data.get('score') or {}
+                full_time = score.get('fullTime') or {}
+                match = existing_matches.get(match_data['id'])
                 
-                try:
-                    home_team = Team.objects.get(id=home_team_id)
-                    away_team = Team.objects.get(id=away_team_id)
-                except Team.DoesNotExist:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'⚠️ Teams not found for match {match_data["id"]}, skipping...'
+                if match is None:
+                    # Parse match date
+                    match_date = None
+                    if match_data.get('utcDate'):
+                        match_date = datetime.fromisoformat(
+                            match_data['utcDate'].replace('Z', '+00:00')
+                        )
+                    
+                    new_matches.append(Match(
+                        id=match_data['id'],
+                        competition=competition,
+                        season=season,
+                        home_team=home_team,
+                        away_team=away_team,
+                        utc_date=match_date,
+                        status=match_data.get('status', 'SCHEDULED'),
+                        matchday=match_data.get('matchday'),
+                        stage=match_data.get('stage', ''),
+                        group_name=match_data.get('group'),
+                        home_team_score=full_time.get('home'),
+                        away_team_score=full_time.get('away'),
+                        winner=score.get('winner'),
+                        duration=score.get('duration', 'REGULAR'),
+                        venue=match_data.get('venue'),
+                        referee_name=match_data.get('referees', [{}])[0].get('name') if match_data.get('referees') else None
+                    ))
+                    if len(new_matches) <= 5:  # Show first 5 matches
+                        self.stdout.write(
+                            f'  ⚽ Created match: {home_team.name} vs {away_team.name}'
                         )
-                    )
                     continue
                 
-                # Parse match date
-                match_date = None
-                if match_data.get('utcDate'):
-                    match_date = datetime.fromisoformat(
-                        match_data['utcDate'].replace('Z', '+00:00')
-                    )
-                
-                match, created = Match.objects.get_or_create(
-                    id=match_data['id'],
-                    defaults={
-                        'competition': competition,
-                        'season': season,
-                        'home_team': home_team,
-                        'away_team': away_team,
-                        'utc_date': match_date,
+                # Update the result once the match has one
+                fields = []
+                if full_time.get('home') is not None:
+                    values = {
+                        'home_team_score': full_time['home'],
+                        'away_team_score': full_time.get('away'),
+                        'winner': score.get('winner'),
                         'status': match_data.get('status', 'SCHEDULED'),
-                        'matchday': match_data.get('matchday'),
-                        'stage': match_data.get('stage', ''),
-                        'group_name': match_data.get('group'),
-                        'home_team_score': match_data.get('score', {}).get('fullTime', {}).get('home'),
-                        'away_team_score': match_data.get('score', {}).get('fullTime', {}).get('away'),
-                        'winner': match_data.get('score', {}).get('winner'),
-                        'duration': match_data.get('score', {}).get('duration', 'REGULAR'),
-                        'venue': match_data.get('venue'),
-                        'referee_name': match_data.get('referees', [{}])[0].get('name') if match_data.get('referees') else None
                     }
-                )
+                    for field, value in values.items():
+                        if getattr(match, field) != value:
+                            setattr(match, field, value)
+                            fields.append(field)
                 
-                if created:
-                    matches_created += 1
-                    if matches_created <= 5:  # Show first 5 matches
-                        self.stdout.write(
-                            f'  ⚽ Created match: {home_team.name} vs {away_team.name}'
-                        )
+                if fields:
+                    match.updated_at = now
+                    changed_matches.append(match)
+                    changed_fields.update(fields)
                 else:
-                    matches_updated += 1
-                    # Update match if needed
-                    if match_data.get('score', {}).get('fullTime', {}).get('home') is not None:
-                        match.home_team_score = match_data['score']['fullTime']['home']
-                        match.away_team_score = match_data['score']['fullTime']['away']
-                        match.winner = match_data['score'].get('winner')
-                        match.status = match_data.get('status', 'SCHEDULED')
-                        match.save()
+                    unchanged_count += 1
+            
+            with transaction.atomic():
+                if new_matches:
+                    Match.objects.bulk_create(new_matches, batch_size=500)
+                if changed_matches:
+                    Match.objects.bulk_update(
+                        changed_matches, sorted(changed_fields) + ['updated_at'], batch_size=500
+                    )
+            
+            matches_created = len(new_matches)
+            matches_updated = len(changed_matches)
+            
+            if skipped_matches:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f'⚠️ Skipped {len(skipped_matches)} matches with teams not found '
+                        f'(e.g. {", ".join(str(match_id) for match_id in skipped_matches[:5])})'
+                    )
+                )
             
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'✅ Matches sync completed! Created: {matches_created}, Updated: {matches_updated}'
+                    f'✅ Matches sync completed! Created: {matches_created}, Updated: {matches_updated}, '
+                    f'Unchanged: {unchanged_count}, Skipped: {len(skipped_matches)}'
                 )
             )
             
             # Log sync
-            from django.utils import timezone
             ApiSyncLog.objects.create(
                 endpoint=f'competitions/{competition.code}/matches',
                 http_status=200,
                 records_processed=len(matches_list),
                 records_inserted=matches_created,
                 records_updated=matches_updated,
+                records_failed=len(skipped_matches),
                 sync_date=timezone.now(),
-                response_data={'matches_created': matches_created, 'matches_updated': matches_updated}
+                response_data={
+                    'matches_created': matches_created,
+                    'matches_updated': matches_updated,
+                    'matches_unchanged': unchanged_count,
+                    'matches_skipped': skipped_matches,
+                }
             )
             
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'❌ Error syncing matches: {str(e)}'))
-            from django.utils import timezone
             ApiSyncLog.objects.create(
                 endpoint=f'competitions/{competition.code}/matches',
                 http_status=500,
@@ -292,88 +343,35 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING('⚠️ No standings data available'))
                 return
             
-            standings_created = 0
-            standings_updated = 0
+            # Same path as the standings task: one team query, one upsert into today's snapshot
+            today = timezone.now().date()
+            teams = Team.objects.in_bulk(standings_team_ids(standings_data))
+            standings, errors = build_standings(competition, season, standings_data, teams, today)
             
-            for standing_group in standings_data.get('standings', []):
-                standing_type = standing_group.get('type', 'TOTAL')
-                group = standing_group.get('group')
-                
-                for table_entry in standing_group.get('table', []):
-                    team_id = table_entry['team']['id']
-                    
-                    try:
-                        team = Team.objects.get(id=team_id)
-                    except Team.DoesNotExist:
-                        self.stdout.write(
-                            self.style.WARNING(f'⚠️ Team not found for standings, skipping...')
-                        )
-                        continue
-                    
-                    standing, created = Standing.objects.get_or_create(
-                        competition=competition,
-                        season=season,
-                        team=team,
-                        type=standing_type,
-                        group_name=group,
-                        defaults={
-                            'position': table_entry.get('position'),
-                            'played_games': table_entry.get('playedGames', 0),
-                            'form': table_entry.get('form'),
-                            'won': table_entry.get('won', 0),
-                            'draw': table_entry.get('draw', 0),
-                            'lost': table_entry.get('lost', 0),
-                            'points': table_entry.get('points', 0),
-                            'goals_for': table_entry.get('goalsFor', 0),
-                            'goals_against': table_entry.get('goalsAgainst', 0),
-                            'goal_difference': table_entry.get('goalDifference', 0),
-                            'snapshot_date': datetime.now().date()
-                        }
-                    )
-                    
-                    if created:
-                        standings_created += 1
-                        if standings_created <= 3:  # Show first 3 standings
-                            self.stdout.write(
-                                f'  📊 Created standing: {team.name} - Position {standing.position}'
-                            )
-                    else:
-                        standings_updated += 1
-                        # Update standing data
-                        standing.position = table_entry.get('position')
-                        standing.played_games = table_entry.get('playedGames', 0)
-                        standing.form = table_entry.get('form')
-                        standing.won = table_entry.get('won', 0)
-                        standing.draw = table_entry.get('draw', 0)
-                        standing.lost = table_entry.get('lost', 0)
-                        standing.points = table_entry.get('points', 0)
-                        standing.goals_for = table_entry.get('goalsFor', 0)
-                        standing.goals_against = table_entry.get('goalsAgainst', 0)
-                        standing.goal_difference = table_entry.get('goalDifference', 0)
-                        standing.snapshot_date = datetime.now().date()
-                        standing.save()
+            with transaction.atomic():
+                standings_created, standings_updated = save_standings(competition, season, standings, today)
             
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'✅ Standings sync completed! Created: {standings_created}, Updated: {standings_updated}'
+                    f'✅ Standings sync completed! Created: {standings_created}, Updated: {standings_updated}, '
+                    f'Invalid: {errors}'
                 )
             )
             
             # Log sync
-            from django.utils import timezone
             ApiSyncLog.objects.create(
                 endpoint=f'competitions/{competition.code}/standings',
                 http_status=200,
                 records_processed=len([table for standing_group in standings_data.get('standings', []) for table in standing_group.get('table', [])]),
                 records_inserted=standings_created,
                 records_updated=standings_updated,
+                records_failed=errors,
                 sync_date=timezone.now(),
                 response_data={'standings_created': standings_created, 'standings_updated': standings_updated}
             )
             
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'❌ Error syncing standings: {str(e)}'))
-            from django.utils import timezone
             ApiSyncLog.objects.create(
                 endpoint=f'competitions/{competition.code}/standings',
                 http_status=500,
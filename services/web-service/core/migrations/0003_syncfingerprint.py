@@ -0,0 +1,30 @@
+# Generated by Django 4.2 on 2026-10-17 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_player_playertransfer_playerstatistics_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='API the payload came from', max_length=30)),
+                ('entity_type', models.CharField(help_text='Kind of payload, e.g. team_roster or player', max_length=30)),
+                ('entity_key', models.CharField(help_text='Identifier of the entity at the source', max_length=200)),
+                ('payload_hash', models.CharField(help_text='SHA-256 of the normalized payload', max_length=64)),
+                ('last_seen', models.DateTimeField(help_text='When this payload was last processed')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'sync_fingerprints',
+                'indexes': [models.Index(fields=['last_seen'], name='sync_finger_last_se_fcb776_idx')],
+                'unique_together': {('source', 'entity_type', 'entity_key')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2 on 2026-10-17 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_syncfingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollectionRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(help_text='Collection performed, e.g. team_players or comprehensive', max_length=30)),
+                ('status', models.CharField(choices=[('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='running', max_length=20)),
+                ('cursor', models.CharField(blank=True, help_text='Last item of the completed prefix', max_length=100)),
+                ('completed_ahead', models.JSONField(blank=True, default=list, help_text='Items completed past the cursor')),
+                ('processed_items', models.IntegerField(default=0)),
+                ('total_items', models.IntegerField(default=0)),
+                ('stats', models.JSONField(blank=True, default=dict, help_text='Cumulative collection statistics')),
+                ('error_message', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'collection_runs',
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['kind', 'status'], name='collection__kind_a5a66b_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-17 15:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_collectionrun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='player',
+            name='football_data_id',
+            field=models.BigIntegerField(blank=True, help_text='football-data.org person ID, set for players known from team squads', null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2 on 2026-10-17 17:05
+
+from django.db import migrations, models
+
+
+# Players previously hard-coded in sync_popular_players
+INITIAL_WATCHLIST = [
+    "Lionel Messi",
+    "Cristiano Ronaldo",
+    "Kylian Mbappe",
+    "Neymar",
+    "Erling Haaland",
+    "Kevin De Bruyne",
+    "Mohamed Salah",
+    "Robert Lewandowski",
+    "Luka Modric",
+    "Virgil van Dijk",
+    "Sadio Mane",
+    "Harry Kane",
+    "Sergio Ramos",
+    "Karim Benzema",
+    "N'Golo Kante",
+]
+
+
+def seed_watchlist(apps, schema_editor):
+    PlayerWatchlistEntry = apps.get_model('core', 'PlayerWatchlistEntry')
+    PlayerWatchlistEntry.objects.bulk_create(
+        [PlayerWatchlistEntry(name=name) for name in INITIAL_WATCHLIST],
+        ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_player_football_data_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerWatchlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Player name searched to resolve the ID', max_length=200, unique=True)),
+                ('external_id', models.CharField(blank=True, help_text='Resolved TheSportsDB Player ID', max_length=50)),
+                ('is_active', models.BooleanField(default=True, help_text='Refreshed by the daily sync')),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('last_refreshed', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'player_watchlist',
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['is_active'], name='player_watc_is_acti_e6c33a_idx')],
+            },
+        ),
+        migrations.RunPython(seed_watchlist, migrations.RunPython.noop),
+    ]
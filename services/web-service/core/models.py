@@ -184,6 +184,18 @@ class Match(models.Model):
         return f"{self.home_team.name} vs {self.away_team.name} - {self.utc_date.strftime('%Y-%m-%d')}"
 
 
+class StandingQuerySet(models.QuerySet):
+    """Standings are stored as one snapshot per day"""
+
+    def latest_snapshot(self):
+        """Keep only the latest snapshot of each competition season"""
+        latest_date = Standing.objects.filter(
+            competition=models.OuterRef('competition'),
+            season=models.OuterRef('season')
+        ).order_by('-snapshot_date').values('snapshot_date')[:1]
+        return self.filter(snapshot_date=models.Subquery(latest_date))
+
+
 class Standing(models.Model):
     """Model for league standings"""
     
@@ -216,6 +228,8 @@ class Standing(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StandingQuerySet.as_manager()
+
     class Meta:
         db_table = 'standings'
         indexes = [
@@ -263,6 +277,12 @@ class Player(models.Model):
     """
     # IDs and identification
     external_id = models.CharField(max_length=50, unique=True, help_text="TheSportsDB Player ID")
+    football_data_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        unique=True,
+        help_text="football-data.org person ID, set for players known from team squads"
+    )
     name = models.CharField(max_length=200, help_text="Player full name")
     short_name = models.CharField(max_length=100, blank=True, help_text="Player short name")
     
@@ -346,16 +366,21 @@ class Player(models.Model):
         team_name = self.team.name if self.team else "No Team"
         return f"{self.name} ({team_name})"
     
-    @property
-    def age_calculated(self):
-        """Calculate age from date of birth"""
-        if self.date_of_birth:
+    @staticmethod
+    def calculate_age(date_of_birth):
+        """Calculate today's age for a date of birth"""
+        if date_of_birth:
             today = timezone.now().date()
-            return today.year - self.date_of_birth.year - (
-                (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
+            return today.year - date_of_birth.year - (
+                (today.month, today.day) < (date_of_birth.month, date_of_birth.day)
             )
         return None
     
+    @property
+    def age_calculated(self):
+        """Calculate age from date of birth"""
+        return self.calculate_age(self.date_of_birth)
+    
     def update_age(self):
         """Update age field based on date of birth"""
         if self.date_of_birth:
@@ -518,3 +543,92 @@ class PlayerTransfer(models.Model):
         from_name = self.from_team.name if self.from_team else "Unknown"
         to_name = self.to_team.name if self.to_team else "Unknown"
         return f"{self.player.name}: {from_name} → {to_name} ({self.transfer_date})"
+
+
+class SyncFingerprint(models.Model):
+    """
+    Hash of the last API payload synced for an entity
+
+    Lets collectors skip parsing and writing data that has not changed
+    since the previous sync.
+    """
+    source = models.CharField(max_length=30, help_text="API the payload came from")
+    entity_type = models.CharField(max_length=30, help_text="Kind of payload, e.g. team_roster or player")
+    entity_key = models.CharField(max_length=200, help_text="Identifier of the entity at the source")
+    payload_hash = models.CharField(max_length=64, help_text="SHA-256 of the normalized payload")
+    last_seen = models.DateTimeField(help_text="When this payload was last processed")
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'sync_fingerprints'
+        unique_together = ['source', 'entity_type', 'entity_key']
+        indexes = [
+            models.Index(fields=['last_seen']),
+        ]
+    
+    def __str__(self):
+        return f"{self.source} {self.entity_type} {self.entity_key}"
+
+
+class CollectionRun(models.Model):
+    """
+    Checkpoint of a long collection run
+
+    Items are processed in a fixed order; the cursor is the last item of the
+    completed prefix, so an interrupted run can continue where it stopped
+    instead of spending the API quota again.
+    """
+    
+    RUN_STATUS = [
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    kind = models.CharField(max_length=30, help_text="Collection performed, e.g. team_players or comprehensive")
+    status = models.CharField(max_length=20, choices=RUN_STATUS, default='running')
+    cursor = models.CharField(max_length=100, blank=True, help_text="Last item of the completed prefix")
+    completed_ahead = models.JSONField(default=list, blank=True, help_text="Items completed past the cursor")
+    processed_items = models.IntegerField(default=0)
+    total_items = models.IntegerField(default=0)
+    stats = models.JSONField(default=dict, blank=True, help_text="Cumulative collection statistics")
+    error_message = models.TextField(blank=True)
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'collection_runs'
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['kind', 'status']),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} run {self.id} ({self.status}, {self.processed_items}/{self.total_items})"
+
+
+class PlayerWatchlistEntry(models.Model):
+    """
+    Player refreshed daily by sync_popular_players
+
+    The name is searched once to resolve the TheSportsDB ID; refreshes then
+    look the player up by that ID.
+    """
+    name = models.CharField(max_length=200, unique=True, help_text="Player name searched to resolve the ID")
+    external_id = models.CharField(max_length=50, blank=True, help_text="Resolved TheSportsDB Player ID")
+    is_active = models.BooleanField(default=True, help_text="Refreshed by the daily sync")
+    resolved_at = models.DateTimeField(null=True, blank=True)
+    last_refreshed = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'player_watchlist'
+        ordering = ['name']
+        indexes = [
+            models.Index(fields=['is_active']),
+        ]
+    
+    def __str__(self):
+        return f"{self.name} ({self.external_id or 'unresolved'})"
@@ -0,0 +1,156 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from django.utils import timezone
+
+from core.models import CollectionRun
+
+logger = logging.getLogger('mark_foot')
+
+
+def _add_stats(total: Dict, stats: Dict):
+    """Add collection statistics into a running total, nested per data type"""
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            _add_stats(total.setdefault(key, {}), value)
+        elif isinstance(value, int):
+            total[key] = total.get(key, 0) + value
+
+
+class RunCheckpoint:
+    """
+    Persist the progress of a collection run in a CollectionRun row
+
+    Items are given in a fixed order but may complete out of order when they
+    are fetched concurrently. The cursor only moves over the completed
+    prefix; items completed past it are stored too, so a resumed run skips
+    exactly the items already written and counts their stats once. Failed
+    items are never completed: the run ends as failed and resuming it
+    retries them.
+
+    Usage:
+        checkpoint = RunCheckpoint.start('team_players', resume=True)
+        for key in checkpoint.remaining(keys):
+            ...
+            checkpoint.complete([key], stats)  # or checkpoint.fail([key], stats)
+        checkpoint.finish()
+    """
+
+    def __init__(self, run: CollectionRun):
+        self.run = run
+        self._order: List[str] = []
+        self._position = 0
+        self._done = set(run.completed_ahead or [])
+        self._failed = set()
+
+    @classmethod
+    def start(cls, kind: str, resume: bool = False) -> 'RunCheckpoint':
+        """
+        Start a run, or continue the last unfinished run of the same kind
+
+        Args:
+            kind: Collection performed, e.g. team_players or comprehensive
+            resume: Continue from the last checkpoint if there is one
+        """
+        run = None
+        if resume:
+            run = CollectionRun.objects.filter(kind=kind).exclude(status='completed').first()
+            if run is not None:
+                logger.info(
+                    f"⏩ Resuming {kind} run {run.id} after '{run.cursor}' "
+                    f"({run.processed_items}/{run.total_items} items done)"
+                )
+            else:
+                logger.info(f"No unfinished {kind} run to resume, starting a new one")
+
+        if run is None:
+            run = CollectionRun.objects.create(kind=kind)
+        else:
+            run.status = 'running'
+            run.error_message = ''
+            run.finished_at = None
+            run.save(update_fields=['status', 'error_message', 'finished_at', 'updated_at'])
+
+        return cls(run)
+
+    def remaining(self, keys: Iterable) -> List[str]:
+        """
+        Get the items still to process, in order
+
+        Args:
+            keys: Every item of the run, always in the same order
+
+        Returns:
+            The keys after the cursor that were not completed yet
+        """
+        keys = [str(key) for key in keys]
+        start = 0
+        if self.run.cursor:
+            if self.run.cursor in keys:
+                start = keys.index(self.run.cursor) + 1
+            else:
+                logger.warning(f"Checkpoint '{self.run.cursor}' no longer exists, processing every pending item")
+
+        # The cursor moves over items completed ahead of it by an earlier attempt too
+        self._order = keys[start:]
+        self._position = 0
+        self._done.intersection_update(self._order)
+        remaining = [key for key in self._order if key not in self._done]
+
+        self.run.total_items = self.run.processed_items + len(remaining)
+        self.run.save(update_fields=['total_items', 'updated_at'])
+        return remaining
+
+    def complete(self, keys: Iterable, stats: Optional[Dict] = None):
+        """
+        Record items as written, with the statistics they produced
+
+        Call it in the transaction that wrote the items so the checkpoint
+        never runs ahead of the data.
+        """
+        keys = [str(key) for key in keys]
+        self._done.update(keys)
+
+        fields = ['completed_ahead', 'processed_items', 'stats', 'updated_at']
+        while self._position < len(self._order) and self._order[self._position] in self._done:
+            self._done.discard(self._order[self._position])
+            self.run.cursor = self._order[self._position]
+            self._position += 1
+            if 'cursor' not in fields:
+                fields.append('cursor')
+
+        self.run.completed_ahead = sorted(self._done)
+        self.run.processed_items += len(keys)
+        _add_stats(self.run.stats, stats or {})
+        self.run.save(update_fields=fields)
+
+    def fail(self, keys: Iterable, stats: Optional[Dict] = None):
+        """
+        Record items whose write failed, keeping them pending
+
+        The cursor stops before them, so a resumed run retries them.
+        """
+        keys = [str(key) for key in keys]
+        self._failed.update(keys)
+        _add_stats(self.run.stats, stats or {})
+        self.run.save(update_fields=['stats', 'updated_at'])
+
+    def finish(self, error: Optional[BaseException] = None):
+        """Mark the run completed, or failed so that it can be resumed"""
+        if error is None and self._failed:
+            error = f"{len(self._failed)} items failed, resume the run to retry them"
+
+        self.run.status = 'failed' if error else 'completed'
+        self.run.error_message = str(error) if error else ''
+        self.run.finished_at = timezone.now()
+        self.run.save(update_fields=['status', 'error_message', 'finished_at', 'updated_at'])
+
+    def summary(self) -> Dict:
+        """Describe the run for task results and command output"""
+        return {
+            'id': self.run.id,
+            'status': self.run.status,
+            'processed_items': self.run.processed_items,
+            'total_items': self.run.total_items,
+            'stats': self.run.stats,
+        }
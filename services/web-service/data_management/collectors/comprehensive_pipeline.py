@@ -0,0 +1,282 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from core.models import Player
+from api_integration.rate_limiter import RateLimitExceeded
+from data_management.collectors.checkpoints import RunCheckpoint
+
+logger = logging.getLogger('mark_foot')
+
+# Marks the end of a stage's input
+_DONE = object()
+
+# Seconds a blocked stage waits before checking whether the run was stopped
+_POLL_INTERVAL = 0.5
+
+DATA_TYPES = ('transfers', 'statistics', 'career')
+
+
+def _empty_stats() -> Dict[str, Dict[str, int]]:
+    return {
+        data_type: {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        for data_type in DATA_TYPES
+    }
+
+
+class ComprehensiveCollectionPipeline:
+    """
+    Collect transfers, statistics and career data for many players
+
+    Three stages run concurrently, connected by bounded queues:
+      - fetch: worker threads calling the API, paced only by the client's
+        shared rate limiter
+      - parse: one thread normalizing the payloads (no database access)
+      - write: the calling thread, saving players in batches, one
+        transaction per batch
+
+    The bounded queues keep memory flat: when writing falls behind,
+    fetching pauses instead of piling up payloads.
+
+    Usage:
+        pipeline = ComprehensiveCollectionPipeline(collector)
+        results = pipeline.run(Player.objects.values_list('external_id', flat=True))
+    """
+
+    def __init__(self, collector, fetch_workers: Optional[int] = None, batch_size: int = 50,
+                 queue_size: Optional[int] = None):
+        """
+        Args:
+            collector: PlayerDataCollector providing the API client and the parse/write helpers
+            fetch_workers: Concurrent fetch threads (defaults to PLAYER_COLLECTION_CONCURRENCY)
+            batch_size: Players written per transaction
+            queue_size: Capacity of each queue between stages
+        """
+        self.collector = collector
+        self.client = collector.client
+        self.fetch_workers = fetch_workers or settings.PLAYER_COLLECTION_CONCURRENCY
+        self.batch_size = batch_size
+        self.queue_size = queue_size or self.fetch_workers * 4
+
+    def run(self, external_ids: Iterable[str],
+            on_batch: Optional[Callable[[int, Dict], None]] = None,
+            checkpoint: Optional[RunCheckpoint] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Run the pipeline over a set of players
+
+        Args:
+            external_ids: TheSportsDB player IDs
+            on_batch: Called with (players written so far, results) after each batch
+            checkpoint: Run checkpoint updated with every batch written
+
+        Returns:
+            Dictionary with collection statistics for each data type
+
+        Raises:
+            RateLimitExceeded: if the client gives up waiting for a rate limit slot
+        """
+        self._ids = queue.Queue(maxsize=self.queue_size)
+        self._fetched = queue.Queue(maxsize=self.queue_size)
+        self._parsed = queue.Queue(maxsize=self.queue_size)
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._checkpoint = checkpoint
+
+        results = _empty_stats()
+        written = 0
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=self._feed, args=(external_ids,), name='comprehensive-feed', daemon=True)]
+        threads += [
+            threading.Thread(target=self._fetch, name=f'comprehensive-fetch-{i}', daemon=True)
+            for i in range(self.fetch_workers)
+        ]
+        threads.append(threading.Thread(target=self._parse, name='comprehensive-parse', daemon=True))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            batch = []
+            while True:
+                item = self._get(self._parsed)
+                if item is None or item is _DONE:
+                    break
+
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    written += self._write(batch, results)
+                    batch = []
+                    if on_batch:
+                        on_batch(written, results)
+
+            if batch and not self._errors:
+                written += self._write(batch, results)
+                if on_batch:
+                    on_batch(written, results)
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        if self._errors:
+            raise self._errors[0]
+
+        logger.info(
+            f"✅ Comprehensive collection completed for {written} players "
+            f"in {time.monotonic() - start:.1f}s: {results}"
+        )
+        return results
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        """Put an item, giving up if the run was stopped"""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        """Get an item, or None if the run was stopped"""
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _fail(self, error: BaseException):
+        """Stop every stage because of an error that ends the run"""
+        self._errors.append(error)
+        self._stop.set()
+
+    def _feed(self, external_ids: Iterable[str]):
+        """Queue the players to collect, then one end marker per fetch worker"""
+        try:
+            for external_id in external_ids:
+                if not self._put(self._ids, str(external_id)):
+                    return
+            for _ in range(self.fetch_workers):
+                self._put(self._ids, _DONE)
+        except Exception as e:
+            self._fail(e)
+
+    def _fetch(self):
+        """Fetch stage: download every payload of a player"""
+        try:
+            while True:
+                external_id = self._get(self._ids)
+                if external_id is None:
+                    return
+                if external_id is _DONE:
+                    self._put(self._fetched, _DONE)
+                    return
+
+                payloads = {
+                    'transfers': self.client.get_player_transfers(external_id),
+                    'statistics': self.client.get_player_stats_by_season(external_id),
+                    'career': self.client.get_player_career(external_id),
+                }
+                if not self._put(self._fetched, (external_id, payloads)):
+                    return
+        except RateLimitExceeded as e:
+            self._fail(e)
+        except Exception as e:
+            logger.error(f"❌ Comprehensive fetch stage failed: {str(e)}")
+            self._fail(e)
+
+    def _parse(self):
+        """Parse stage: normalize the payloads of each player"""
+        finished_workers = 0
+        try:
+            while finished_workers < self.fetch_workers:
+                item = self._get(self._fetched)
+                if item is None:
+                    return
+                if item is _DONE:
+                    finished_workers += 1
+                    continue
+
+                external_id, payloads = item
+                parsed = {'failed': {data_type: 0 for data_type in DATA_TYPES}, 'fetch_failed': False}
+
+                for data_type, parse in (('transfers', self.collector._parse_transfer),
+                                         ('statistics', self.collector._parse_statistic)):
+                    records = []
+                    if payloads[data_type] is None:
+                        # The API call itself failed
+                        parsed['failed'][data_type] += 1
+                        parsed['fetch_failed'] = True
+                    for record in payloads[data_type] or []:
+                        try:
+                            records.append(parse(record))
+                        except Exception as e:
+                            logger.error(f"Error parsing {data_type} for player {external_id}: {str(e)}")
+                            parsed['failed'][data_type] += 1
+                    parsed[data_type] = records
+
+                if payloads['career'] is None:
+                    parsed['failed']['career'] += 1
+                    parsed['fetch_failed'] = True
+                parsed['career'] = len(payloads['career'] or [])
+
+                if not self._put(self._parsed, (external_id, parsed)):
+                    return
+
+            self._put(self._parsed, _DONE)
+        except Exception as e:
+            logger.error(f"❌ Comprehensive parse stage failed: {str(e)}")
+            self._fail(e)
+
+    def _write(self, batch: List, results: Dict[str, Dict[str, int]]) -> int:
+        """
+        Write stage: save a batch of players in one transaction
+
+        The checkpoint is updated in the same transaction, so it never
+        records players whose data was not written. Players with a failed
+        API call stay pending, so resuming the run fetches them again.
+
+        Returns:
+            Number of players in the batch
+        """
+        external_ids = [external_id for external_id, _ in batch]
+        players = Player.objects.in_bulk(external_ids, field_name='external_id')
+        batch_results = _empty_stats()
+        records = []
+
+        for external_id, parsed in batch:
+            for data_type in DATA_TYPES:
+                batch_results[data_type]['failed'] += parsed['failed'][data_type]
+
+            player = players.get(external_id)
+            if player is None:
+                logger.warning(f"Player with external_id {external_id} not found")
+                for data_type in DATA_TYPES:
+                    batch_results[data_type]['skipped'] += 1
+                continue
+
+            records.append((player, parsed))
+
+        with transaction.atomic():
+            self.collector._write_player_records(records, batch_results)
+            if self._checkpoint is not None:
+                failed_ids = [external_id for external_id, parsed in batch if parsed['fetch_failed']]
+                if failed_ids:
+                    self._checkpoint.fail(failed_ids)
+                self._checkpoint.complete(
+                    [external_id for external_id, parsed in batch if not parsed['fetch_failed']],
+                    batch_results
+                )
+
+        for data_type, stats in batch_results.items():
+            for key, value in stats.items():
+                results[data_type][key] += value
+
+        return len(batch)
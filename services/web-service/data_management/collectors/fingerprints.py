@@ -0,0 +1,62 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Dict, Iterable
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.bulk import bulk_upsert
+from core.models import SyncFingerprint
+
+
+def payload_hash(payload: Any) -> str:
+    """Get a stable SHA-256 of an API payload, independent of key order"""
+    raw = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def load_fingerprints(entity_type: str, keys: Iterable[str], source: str = 'thesportsdb') -> Dict[str, str]:
+    """
+    Get the hashes stored for a set of entities
+
+    Fingerprints older than SYNC_FINGERPRINT_MAX_AGE_DAYS are ignored so that
+    every entity is fully processed again now and then (e.g. to pick up a
+    team that was added after the player was first synced).
+
+    Returns:
+        Mapping of entity key to payload hash
+    """
+    keys = [str(key) for key in keys]
+    if not keys:
+        return {}
+
+    cutoff = timezone.now() - timedelta(days=settings.SYNC_FINGERPRINT_MAX_AGE_DAYS)
+    return dict(
+        SyncFingerprint.objects.filter(
+            source=source,
+            entity_type=entity_type,
+            entity_key__in=keys,
+            last_seen__gte=cutoff
+        ).values_list('entity_key', 'payload_hash')
+    )
+
+
+def save_fingerprints(entity_type: str, hashes: Dict[str, str], source: str = 'thesportsdb') -> int:
+    """Store the hashes of entities that were just processed"""
+    now = timezone.now()
+    return bulk_upsert(
+        SyncFingerprint,
+        [
+            SyncFingerprint(
+                source=source,
+                entity_type=entity_type,
+                entity_key=str(key),
+                payload_hash=value,
+                last_seen=now
+            )
+            for key, value in hashes.items()
+        ],
+        unique_fields=['source', 'entity_type', 'entity_key'],
+        update_fields=['payload_hash', 'last_seen']
+    )
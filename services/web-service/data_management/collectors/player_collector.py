@@ -1,13 +1,23 @@
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple
+from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
-from django.db.models import Q
 
-from core.models import Player, Team, PlayerStatistics, PlayerTransfer, ApiSyncLog
+from core.models import (
+    Competition, Player, Season, Team, PlayerStatistics, PlayerTransfer, PlayerWatchlistEntry, ApiSyncLog
+)
 from api_integration.thesportsdb_client import TheSportsDBClient
+from api_integration.rate_limiter import RateLimitExceeded
+from data_management.collectors.checkpoints import RunCheckpoint
+from data_management.collectors.comprehensive_pipeline import ComprehensiveCollectionPipeline
+from data_management.collectors.fingerprints import load_fingerprints, payload_hash, save_fingerprints
+from data_management.collectors.squad_ingestion import SQUAD_EXTERNAL_ID_PREFIX, SQUAD_FIELDS, player_name_key
+from data_management.collectors.team_resolver import get_team_resolver, normalize_team_name
 
 logger = logging.getLogger('mark_foot')
 
@@ -17,8 +27,9 @@ class PlayerDataCollector:
     Collector for player data from TheSportsDB API
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.client = TheSportsDBClient(api_key)
+    def __init__(self, api_key: Optional[str] = None, max_wait: Optional[float] = None):
+        self.client = TheSportsDBClient(api_key, max_wait=max_wait)
+        self.team_resolver = get_team_resolver()
         self.stats = {
             'processed': 0,
             'created': 0,
@@ -27,16 +38,6 @@ class PlayerDataCollector:
             'skipped': 0
         }
     
-    def test_api_connection(self):
-        """Test API connection and return status"""
-        try:
-            # Try to search for a common player
-            result = self.client.search_players("Ronaldo")
-            return bool(result)
-        except Exception as e:
-            logger.error(f"API connection test failed: {str(e)}")
-            return False
-
     def collect_player_transfers(self, external_id: str) -> Dict[str, int]:
         """
         Collect transfer history for a specific player
@@ -69,21 +70,18 @@ class PlayerDataCollector:
                 logger.info(f"No transfer data available for player {player.name}")
                 return stats
             
+            parsed = []
             for transfer_data in transfers_data:
                 try:
-                    transfer, status = self._create_or_update_transfer(transfer_data, player)
-                    
-                    if transfer:
-                        stats[status] += 1
-                    else:
-                        stats['skipped'] += 1
-                    
-                    stats['processed'] += 1
-                    
+                    parsed.append(self._parse_transfer(transfer_data))
                 except Exception as e:
                     logger.error(f"Error processing transfer: {str(e)}")
+                    stats['processed'] += 1
                     stats['failed'] += 1
             
+            for key, value in self._save_transfers([(player, parsed)]).items():
+                stats[key] += value
+            
             logger.info(f"✅ Transfer collection completed for {player.name}: {stats}")
             return stats
             
@@ -125,21 +123,18 @@ class PlayerDataCollector:
                 logger.info(f"No statistics data available for player {player.name}")
                 return stats
             
+            parsed = []
             for stat_data in stats_data:
                 try:
-                    statistic, status = self._create_or_update_statistic(stat_data, player)
-                    
-                    if statistic:
-                        stats[status] += 1
-                    else:
-                        stats['skipped'] += 1
-                    
-                    stats['processed'] += 1
-                    
+                    parsed.append(self._parse_statistic(stat_data))
                 except Exception as e:
                     logger.error(f"Error processing statistic: {str(e)}")
+                    stats['processed'] += 1
                     stats['failed'] += 1
             
+            for key, value in self._save_statistics([(player, parsed)]).items():
+                stats[key] += value
+            
             logger.info(f"✅ Statistics collection completed for {player.name}: {stats}")
             return stats
             
@@ -166,135 +161,415 @@ class PlayerDataCollector:
             'career': {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
         }
         
-        # Collect transfers
-        time.sleep(1)  # Rate limiting
+        if str(external_id).startswith(SQUAD_EXTERNAL_ID_PREFIX):
+            logger.info(f"⏭️ Player {external_id} is squad-only, no TheSportsDB data to collect")
+            for stats in results.values():
+                stats['skipped'] = 1
+            return results
+        
+        # Collect transfers (pacing comes from the client's rate limiter)
         results['transfers'] = self.collect_player_transfers(external_id)
         
         # Collect statistics
-        time.sleep(1)  # Rate limiting
         results['statistics'] = self.collect_player_statistics(external_id)
         
         # Collect career data (via transfers if available)
-        time.sleep(1)  # Rate limiting
         career_stats = self._collect_career_data(external_id)
         results['career'] = career_stats
         
         logger.info(f"✅ Comprehensive collection completed for player {external_id}")
         return results
 
-    def _create_or_update_transfer(self, transfer_data: Dict, player: Player) -> Tuple[Optional[PlayerTransfer], str]:
+    def collect_comprehensive_data_for_players(self, external_ids, fetch_workers: Optional[int] = None,
+                                               on_batch=None, resume: bool = False) -> Dict[str, Dict]:
         """
-        Create or update player transfer record
+        Collect transfers, statistics and career data for many players
+        
+        Runs a fetch -> parse -> batched write pipeline, so the run takes as
+        long as the API rate limit requires and no longer. Progress is
+        checkpointed after every batch.
         
         Args:
-            transfer_data: Transfer data from API
-            player: Player instance
+            external_ids: TheSportsDB player IDs, always in the same order; squad-only
+                          players (football-data IDs) are skipped
+            fetch_workers: Concurrent fetch threads (defaults to PLAYER_COLLECTION_CONCURRENCY)
+            on_batch: Called with (players written so far, results) after each batch
+            resume: Continue the last interrupted run instead of starting over
             
         Returns:
-            Tuple of (PlayerTransfer instance, status)
+            Dictionary with collection statistics for each data type and the run checkpoint
         """
+        external_ids = [
+            external_id for external_id in external_ids
+            if not str(external_id).startswith(SQUAD_EXTERNAL_ID_PREFIX)
+        ]
+        checkpoint = RunCheckpoint.start('comprehensive', resume=resume)
+        pipeline = ComprehensiveCollectionPipeline(self, fetch_workers=fetch_workers)
+        
         try:
-            # Extract transfer information
-            from_team_name = transfer_data.get('strTeamFrom', '').strip()
-            to_team_name = transfer_data.get('strTeamTo', '').strip()
-            transfer_date = self._parse_date(transfer_data.get('strDate', ''))
-            season = transfer_data.get('strSeason', '').strip()
-            fee = transfer_data.get('strFee', '').strip()
-            transfer_type = transfer_data.get('strType', 'Transfer').strip()
-            
-            # Find or create teams
-            from_team = self._find_or_create_team(from_team_name) if from_team_name else None
-            to_team = self._find_or_create_team(to_team_name) if to_team_name else None
-            
-            # Create unique identifier for this transfer
-            transfer_key = f"{player.external_id}_{from_team_name}_{to_team_name}_{season}"
-            
-            # Get or create transfer
-            transfer, created = PlayerTransfer.objects.get_or_create(
-                player=player,
-                from_team=from_team,
-                to_team=to_team,
-                season=season,
-                defaults={
-                    'transfer_date': transfer_date,
-                    'fee': fee,
-                    'transfer_type': transfer_type,
-                    'source': 'thesportsdb',
-                    'last_sync': timezone.now()
-                }
-            )
+            results = pipeline.run(checkpoint.remaining(external_ids), on_batch=on_batch, checkpoint=checkpoint)
+        except BaseException as e:
+            # Keep the checkpoint so the run can be resumed
+            checkpoint.finish(error=e)
+            raise
+        
+        checkpoint.finish()
+        results['run'] = checkpoint.summary()
+        return results
+
+    def _write_player_records(self, records: List[Tuple[Player, Dict]], results: Dict[str, Dict[str, int]]):
+        """
+        Save the parsed transfers, statistics and career counts of a batch of players
+        
+        Args:
+            records: (Player, parsed records keyed by data type) pairs, as built by the pipeline
+            results: Collection statistics for each data type, updated in place
+        """
+        for data_type, save in (('transfers', self._save_transfers),
+                                ('statistics', self._save_statistics)):
+            stats = save([(player, parsed[data_type]) for player, parsed in records])
+            for key, value in stats.items():
+                results[data_type][key] += value
+        
+        # Career data is only counted for now (see _collect_career_data)
+        for _, parsed in records:
+            results['career']['processed'] += parsed['career']
+            results['career']['created'] += parsed['career']
+
+    # TheSportsDB transfer types mapped to PlayerTransfer.transfer_type choices
+    TRANSFER_TYPES = {
+        'loan': 'Loan',
+        'free': 'Free',
+        'contract': 'Contract',
+        'release': 'Release',
+    }
+
+    def _parse_transfer(self, transfer_data: Dict) -> Dict:
+        """
+        Normalize a transfer record from the API
+        
+        Args:
+            transfer_data: Transfer data from API
             
-            # Update existing transfer
-            if not created:
-                transfer.transfer_date = transfer_date or transfer.transfer_date
-                transfer.fee = fee or transfer.fee
-                transfer.transfer_type = transfer_type or transfer.transfer_type
-                transfer.last_sync = timezone.now()
-                transfer.save()
+        Returns:
+            Dictionary of transfer values
+        """
+        raw_type = (transfer_data.get('strType') or '').strip().lower()
+        transfer_type = next(
+            (choice for word, choice in self.TRANSFER_TYPES.items() if word in raw_type),
+            'Permanent'
+        )
+        
+        return {
+            'from_team_name': (transfer_data.get('strTeamFrom') or '').strip(),
+            'to_team_name': (transfer_data.get('strTeamTo') or '').strip(),
+            'transfer_date': self._parse_date(transfer_data.get('strDate') or ''),
+            'transfer_type': transfer_type,
+            'transfer_fee': (transfer_data.get('strFee') or '').strip()[:50],
+        }
+
+    def _save_transfers(self, records: List[Tuple[Player, List[Dict]]]) -> Dict[str, int]:
+        """
+        Create or update the transfers of a batch of players
+        
+        Existing transfers are loaded in one query and keyed by
+        (player, from team, to team, transfer date); every club name is
+        resolved once through the team name index. New transfers are written
+        with one bulk_create and changed ones with one bulk_update.
+        
+        Args:
+            records: (Player, transfer values from _parse_transfer) pairs
             
-            return transfer, 'created' if created else 'updated'
+        Returns:
+            Dictionary with collection statistics
+        """
+        stats = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        
+        teams = self._resolve_team_names(
+            name
+            for _, transfers in records
+            for transfer in transfers
+            for name in (transfer['from_team_name'], transfer['to_team_name'])
+        )
+        
+        existing = {
+            (transfer.player_id, transfer.from_team_id, transfer.to_team_id, transfer.transfer_date): transfer
+            for transfer in PlayerTransfer.objects.filter(player__in=[player for player, _ in records])
+        }
+        
+        now = timezone.now()
+        new_transfers = []
+        changed_transfers = {}
+        changed_fields = set()
+        missing_dates = 0
+        
+        for player, transfers in records:
+            for values in transfers:
+                stats['processed'] += 1
+                
+                if values['transfer_date'] is None:
+                    missing_dates += 1
+                    stats['skipped'] += 1
+                    continue
+                
+                from_team = teams.get(values['from_team_name'])
+                to_team = teams.get(values['to_team_name'])
+                key = (
+                    player.id,
+                    from_team.id if from_team else None,
+                    to_team.id if to_team else None,
+                    values['transfer_date']
+                )
+                
+                transfer = existing.get(key)
+                if transfer is None:
+                    transfer = PlayerTransfer(
+                        player=player,
+                        from_team=from_team,
+                        to_team=to_team,
+                        transfer_date=values['transfer_date'],
+                        transfer_type=values['transfer_type'],
+                        transfer_fee=values['transfer_fee']
+                    )
+                    # Later duplicates in the payload update this one
+                    existing[key] = transfer
+                    new_transfers.append(transfer)
+                    continue
+                
+                fields = []
+                if transfer.transfer_type != values['transfer_type']:
+                    transfer.transfer_type = values['transfer_type']
+                    fields.append('transfer_type')
+                if values['transfer_fee'] and transfer.transfer_fee != values['transfer_fee']:
+                    transfer.transfer_fee = values['transfer_fee']
+                    fields.append('transfer_fee')
+                
+                if not fields or transfer.pk is None:
+                    # Unchanged, or repeated in the payload before being created
+                    stats['skipped'] += 1
+                    continue
+                
+                transfer.updated_at = now
+                changed_transfers[key] = transfer
+                changed_fields.update(fields)
+        
+        with transaction.atomic():
+            if new_transfers:
+                PlayerTransfer.objects.bulk_create(new_transfers, batch_size=500)
+            if changed_transfers:
+                PlayerTransfer.objects.bulk_update(
+                    list(changed_transfers.values()),
+                    sorted(changed_fields) + ['updated_at'],
+                    batch_size=500
+                )
+        
+        stats['created'] += len(new_transfers)
+        stats['updated'] += len(changed_transfers)
+        
+        if missing_dates:
+            logger.warning(f"Skipped {missing_dates} transfers without a date")
+        if new_transfers or changed_transfers:
+            logger.info(
+                f"✅ Transfers saved for {len(records)} players: "
+                f"{len(new_transfers)} created, {len(changed_transfers)} updated"
+            )
+        
+        return stats
+
+    def _resolve_team_names(self, team_names) -> Dict[str, Optional[Team]]:
+        """
+        Resolve club names to teams, each distinct name once
+        
+        Clubs we do not track resolve to None: teams are keyed by their
+        football-data ID, so no placeholder can be created for them.
+        
+        Args:
+            team_names: Club names as given by the API (may repeat or be empty)
             
-        except Exception as e:
-            logger.error(f"Error creating/updating transfer: {str(e)}")
-            return None, 'failed'
+        Returns:
+            Dictionary mapping each name to its Team or None
+        """
+        teams = {}
+        
+        for team_name in set(filter(None, team_names)):
+            teams[team_name], _ = self.team_resolver.resolve(team_name)
+        
+        unresolved = sorted(name for name, team in teams.items() if team is None)
+        if unresolved:
+            logger.info(f"No matching team for {len(unresolved)} clubs: {', '.join(unresolved[:10])}")
+        
+        return teams
+
+    # PlayerStatistics fields filled from the API
+    STATISTIC_FIELDS = ['appearances', 'goals', 'assists', 'yellow_cards', 'red_cards', 'minutes_played']
 
-    def _create_or_update_statistic(self, stat_data: Dict, player: Player) -> Tuple[Optional[PlayerStatistics], str]:
+    def _parse_statistic(self, stat_data: Dict) -> Dict:
         """
-        Create or update player statistics record
+        Normalize a statistics record from the API
         
         Args:
             stat_data: Statistics data from API
-            player: Player instance
             
         Returns:
-            Tuple of (PlayerStatistics instance, status)
+            Dictionary of statistics values
         """
-        try:
-            # Extract statistics information
-            season = stat_data.get('strSeason', '').strip()
-            competition = stat_data.get('strCompetition', '').strip()
-            
-            # Numeric statistics
-            appearances = self._parse_int(stat_data.get('intAppearances'))
-            goals = self._parse_int(stat_data.get('intGoals'))
-            assists = self._parse_int(stat_data.get('intAssists'))
-            yellow_cards = self._parse_int(stat_data.get('intYellow'))
-            red_cards = self._parse_int(stat_data.get('intRed'))
-            minutes_played = self._parse_int(stat_data.get('intMinutes'))
-            
-            # Get or create statistics
-            statistic, created = PlayerStatistics.objects.get_or_create(
-                player=player,
-                season=season,
-                competition=competition,
-                defaults={
-                    'appearances': appearances,
-                    'goals': goals,
-                    'assists': assists,
-                    'yellow_cards': yellow_cards,
-                    'red_cards': red_cards,
-                    'minutes_played': minutes_played,
-                    'source': 'thesportsdb',
-                    'last_sync': timezone.now()
-                }
-            )
-            
-            # Update existing statistics
-            if not created:
-                statistic.appearances = appearances or statistic.appearances
-                statistic.goals = goals or statistic.goals
-                statistic.assists = assists or statistic.assists
-                statistic.yellow_cards = yellow_cards or statistic.yellow_cards
-                statistic.red_cards = red_cards or statistic.red_cards
-                statistic.minutes_played = minutes_played or statistic.minutes_played
-                statistic.last_sync = timezone.now()
-                statistic.save()
+        return {
+            'season': (stat_data.get('strSeason') or '').strip(),
+            'competition': (stat_data.get('strCompetition') or '').strip(),
+            'appearances': self._parse_int(stat_data.get('intAppearances')),
+            'goals': self._parse_int(stat_data.get('intGoals')),
+            'assists': self._parse_int(stat_data.get('intAssists')),
+            'yellow_cards': self._parse_int(stat_data.get('intYellow')),
+            'red_cards': self._parse_int(stat_data.get('intRed')),
+            'minutes_played': self._parse_int(stat_data.get('intMinutes')),
+        }
+
+    def _save_statistics(self, records: List[Tuple[Player, List[Dict]]]) -> Dict[str, int]:
+        """
+        Create or update the statistics of a batch of players
+        
+        Competitions and seasons are resolved with one query each, existing
+        statistics are loaded in one query and keyed by (player, season,
+        competition). New rows are written with one bulk_create and changed
+        ones with one bulk_update. Statistics whose season is not in our
+        database are skipped, since PlayerStatistics requires one.
+        
+        Args:
+            records: (Player, statistics values from _parse_statistic) pairs
             
-            return statistic, 'created' if created else 'updated'
+        Returns:
+            Dictionary with collection statistics
+        """
+        stats = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        
+        seasons = self._resolve_seasons(
+            (values['competition'], values['season'])
+            for _, statistics in records
+            for values in statistics
+        )
+        
+        existing = {
+            (statistic.player_id, statistic.season_id, statistic.competition_id): statistic
+            for statistic in PlayerStatistics.objects.filter(player__in=[player for player, _ in records])
+        }
+        
+        now = timezone.now()
+        new_statistics = []
+        changed_statistics = {}
+        changed_fields = set()
+        unknown_seasons = 0
+        
+        for player, statistics in records:
+            for values in statistics:
+                stats['processed'] += 1
+                
+                season = seasons.get((values['competition'], values['season']))
+                if season is None:
+                    unknown_seasons += 1
+                    stats['skipped'] += 1
+                    continue
+                
+                key = (player.id, season.id, season.competition_id)
+                statistic = existing.get(key)
+                
+                if statistic is None:
+                    statistic = PlayerStatistics(
+                        player=player,
+                        season=season,
+                        competition_id=season.competition_id,
+                        **{field: values[field] or 0 for field in self.STATISTIC_FIELDS}
+                    )
+                    existing[key] = statistic
+                    new_statistics.append(statistic)
+                    continue
+                
+                # Missing or zero values from the API keep what we have
+                fields = [
+                    field for field in self.STATISTIC_FIELDS
+                    if values[field] and getattr(statistic, field) != values[field]
+                ]
+                for field in fields:
+                    setattr(statistic, field, values[field])
+                
+                if not fields or statistic.pk is None:
+                    # Unchanged, or repeated in the payload before being created
+                    stats['skipped'] += 1
+                    continue
+                
+                statistic.updated_at = now
+                changed_statistics[key] = statistic
+                changed_fields.update(fields)
+        
+        with transaction.atomic():
+            if new_statistics:
+                PlayerStatistics.objects.bulk_create(new_statistics, batch_size=500)
+            if changed_statistics:
+                PlayerStatistics.objects.bulk_update(
+                    list(changed_statistics.values()),
+                    sorted(changed_fields) + ['updated_at'],
+                    batch_size=500
+                )
+        
+        stats['created'] += len(new_statistics)
+        stats['updated'] += len(changed_statistics)
+        
+        if unknown_seasons:
+            logger.warning(f"Skipped {unknown_seasons} statistics without a matching season")
+        if new_statistics or changed_statistics:
+            logger.info(
+                f"✅ Statistics saved for {len(records)} players: "
+                f"{len(new_statistics)} created, {len(changed_statistics)} updated"
+            )
+        
+        return stats
+
+    def _resolve_seasons(self, season_keys) -> Dict[Tuple[str, str], Season]:
+        """
+        Resolve (competition name, season label) pairs to seasons
+        
+        The competition is matched by normalized name and the season by the
+        first year of its label ("2023-2024" starts in 2023).
+        
+        Args:
+            season_keys: (competition name, season label) pairs as given by the API
             
-        except Exception as e:
-            logger.error(f"Error creating/updating statistic: {str(e)}")
-            return None, 'failed'
+        Returns:
+            Dictionary mapping each resolvable pair to its Season
+        """
+        season_keys = {
+            (competition_name, label) for competition_name, label in season_keys
+            if competition_name and label
+        }
+        if not season_keys:
+            return {}
+        
+        competitions = {
+            normalize_team_name(competition.name): competition.id
+            for competition in Competition.objects.only('id', 'name')
+        }
+        
+        wanted = {}
+        for competition_name, label in season_keys:
+            competition_id = competitions.get(normalize_team_name(competition_name))
+            year = re.search(r'\d{4}', label)
+            if competition_id is not None and year:
+                wanted[(competition_name, label)] = (competition_id, int(year.group()))
+        
+        if not wanted:
+            return {}
+        
+        seasons = {
+            (season.competition_id, season.start_date.year): season
+            for season in Season.objects.filter(
+                competition_id__in={competition_id for competition_id, _ in wanted.values()},
+                start_date__year__in={year for _, year in wanted.values()}
+            )
+        }
+        
+        return {
+            key: seasons[season_key]
+            for key, season_key in wanted.items() if season_key in seasons
+        }
 
     def _collect_career_data(self, external_id: str) -> Dict[str, int]:
         """
@@ -323,38 +598,6 @@ class PlayerDataCollector:
             stats['failed'] += 1
             return stats
 
-    def _find_or_create_team(self, team_name: str) -> Optional[Team]:
-        """
-        Find existing team or create placeholder
-        
-        Args:
-            team_name: Name of the team
-            
-        Returns:
-            Team instance or None
-        """
-        if not team_name:
-            return None
-        
-        # Try to find existing team
-        team = self._find_matching_team(team_name)
-        
-        if not team:
-            # Create placeholder team for transfer history
-            team, created = Team.objects.get_or_create(
-                name=team_name,
-                defaults={
-                    'short_name': team_name[:10],
-                    'source': 'placeholder_thesportsdb',
-                    'last_sync': timezone.now()
-                }
-            )
-            
-            if created:
-                logger.info(f"Created placeholder team: {team_name}")
-        
-        return team
-
     def _parse_int(self, value: str) -> Optional[int]:
         """
         Parse integer value from string
@@ -373,37 +616,6 @@ class PlayerDataCollector:
         except (ValueError, TypeError):
             return None
 
-    def collect_players_for_existing_teams(self):
-        """Collect players for all teams in the database"""
-        stats = {
-            'processed': 0,
-            'created': 0,
-            'updated': 0,
-            'failed': 0,
-            'skipped': 0
-        }
-        
-        teams = Team.objects.all()
-        
-        for team in teams:
-            logger.info(f"Collecting players for team: {team.name}")
-            
-            try:
-                team_stats = self.collect_team_players(team.name)
-                
-                # Aggregate stats
-                for key in stats:
-                    stats[key] += team_stats.get(key, 0)
-                    
-                # Add delay between team requests
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error collecting players for team {team.name}: {str(e)}")
-                stats['failed'] += 1
-        
-        return stats
-
     def _parse_date(self, date_string: str) -> Optional[date]:
         """Parse date string from API"""
         if not date_string:
@@ -466,137 +678,275 @@ class PlayerDataCollector:
         if not team_name:
             return None
         
-        # Try exact match first
-        team = Team.objects.filter(name__iexact=team_name).first()
-        if team:
-            return team
-        
-        # Try short name match
-        team = Team.objects.filter(short_name__iexact=team_name).first()
-        if team:
-            return team
+        team, confidence = self.team_resolver.resolve(team_name)
         
-        # Try partial match
-        team = Team.objects.filter(
-            Q(name__icontains=team_name) | Q(short_name__icontains=team_name)
-        ).first()
+        if team is None:
+            logger.warning(f"No matching team found for: '{team_name}'")
+        elif confidence < 1.0:
+            logger.info(f"Found partial team match: '{team_name}' -> '{team.name}' ({confidence:.2f})")
         
-        if team:
-            logger.info(f"Found partial team match: '{team_name}' -> '{team.name}'")
-            return team
-        
-        logger.warning(f"No matching team found for: '{team_name}'")
-        return None
+        return team
     
-    def _create_or_update_player(self, player_data: Dict) -> Tuple[Player, bool]:
+    # Fields compared against the API data when a player already exists
+    PLAYER_SYNC_FIELDS = [
+        'name', 'team', 'nationality', 'date_of_birth', 'position',
+        'position_category', 'status', 'photo_url', 'cutout_url', 'age'
+    ]
+    
+    def _parse_player_data(self, player_data: Dict, team_cache: Optional[Dict] = None) -> Dict:
         """
-        Create or update player from API data
+        Parse API data into Player field values
         
+        Args:
+            player_data: Player data from API
+            team_cache: Team lookups already done for this batch, keyed by team name
+            
         Returns:
-            Tuple of (Player instance, created_flag)
+            Dictionary of field values, including external_id
         """
         external_id = player_data.get('idPlayer')
         if not external_id:
             raise ValueError("Player data missing idPlayer")
         
-        # Parse player data
-        name = player_data.get('strPlayer', '').strip()
+        name = (player_data.get('strPlayer') or '').strip()
         if not name:
             raise ValueError("Player data missing name")
         
-        team_name = player_data.get('strTeam', '').strip()
-        team = self._find_matching_team(team_name) if team_name else None
-        
-        nationality = player_data.get('strNationality', '').strip()
-        date_of_birth = self._parse_date(player_data.get('dateBorn', ''))
-        gender = player_data.get('strGender', 'Male').strip()
-        position = player_data.get('strPosition', '').strip()
-        position_category = self._determine_position_category(position)
-        status = player_data.get('strStatus', 'Active').strip()
-        
-        # Media URLs
-        photo_url = player_data.get('strThumb', '').strip()
-        cutout_url = player_data.get('strCutout', '').strip()
-        
-        # Additional info
-        description = player_data.get('strDescription', '').strip()
-        height = player_data.get('strHeight', '').strip()
-        weight = player_data.get('strWeight', '').strip()
-        wage = player_data.get('strWage', '').strip()
-        
-        # Try to get or create player
-        player, created = Player.objects.get_or_create(
-            external_id=external_id,
-            defaults={
-                'name': name,
-                'team': team,
-                'nationality': nationality,
-                'date_of_birth': date_of_birth,
-                'gender': gender,
-                'position': position,
-                'position_category': position_category,
-                'status': status,
-                'photo_url': photo_url,
-                'cutout_url': cutout_url,
-                'description': description,
-                'height': height,
-                'weight': weight,
-                'wage': wage,
-                'last_sync': timezone.now()
-            }
-        )
+        team_name = (player_data.get('strTeam') or '').strip()
+        if team_cache is None:
+            team = self._find_matching_team(team_name) if team_name else None
+        else:
+            if team_name not in team_cache:
+                team_cache[team_name] = self._find_matching_team(team_name) if team_name else None
+            team = team_cache[team_name]
         
-        # Update existing player if not created
-        if not created:
-            updated_fields = []
-            
-            if player.name != name:
-                player.name = name
-                updated_fields.append('name')
-            
-            if player.team != team:
-                player.team = team
-                updated_fields.append('team')
-            
-            if player.nationality != nationality:
-                player.nationality = nationality
-                updated_fields.append('nationality')
+        date_of_birth = self._parse_date(player_data.get('dateBorn') or '')
+        position = (player_data.get('strPosition') or '').strip()
+        
+        return {
+            'external_id': str(external_id),
+            'name': name,
+            'team': team,
+            'nationality': (player_data.get('strNationality') or '').strip(),
+            'date_of_birth': date_of_birth,
+            'age': Player.calculate_age(date_of_birth),
+            'gender': (player_data.get('strGender') or 'Male').strip(),
+            'position': position,
+            'position_category': self._determine_position_category(position),
+            'status': (player_data.get('strStatus') or 'Active').strip(),
+            'photo_url': (player_data.get('strThumb') or '').strip(),
+            'cutout_url': (player_data.get('strCutout') or '').strip(),
+            'description': (player_data.get('strDescription') or '').strip(),
+            'height': (player_data.get('strHeight') or '').strip(),
+            'weight': (player_data.get('strWeight') or '').strip(),
+            'wage': (player_data.get('strWage') or '').strip(),
+        }
+    
+    def _create_or_update_player(self, player_data: Dict) -> Tuple[Player, bool]:
+        """
+        Create or update player from API data
+        
+        Returns:
+            Tuple of (Player instance, created_flag)
+        """
+        values = self._parse_player_data(player_data)
+        external_id = values.pop('external_id')
+        
+        player = Player.objects.filter(external_id=external_id).first()
+        updated_fields = []
+        
+        if player is None:
+            # A player known from a football-data squad is enriched, not duplicated
+            player = self._match_squad_players({external_id: values}).get(external_id)
+            if player is None:
+                player = Player.objects.create(external_id=external_id, last_sync=timezone.now(), **values)
+                return player, True
+            updated_fields = self._adopt_squad_player(player, external_id, values)
+        
+        updated_fields += self._apply_player_values(player, values)
+        
+        if updated_fields:
+            updated_fields.extend(['last_sync', 'updated_at'])
+            player.last_sync = timezone.now()
+            player.save(update_fields=updated_fields)
+            logger.info(f"Updated player: {player.name} (fields: {', '.join(updated_fields)})")
+        
+        return player, False
+    
+    def _apply_player_values(self, player: Player, values: Dict) -> List[str]:
+        """
+        Copy parsed API values onto an existing player
+        
+        Players known from a football-data squad keep the squad's team,
+        birth date, nationality and position; TheSportsDB only enriches them.
+        
+        Returns:
+            Names of the fields whose value changed
+        """
+        updated_fields = []
+        sync_fields = self.PLAYER_SYNC_FIELDS
+        if player.football_data_id:
+            sync_fields = [field for field in sync_fields if field not in SQUAD_FIELDS]
+        
+        for field in sync_fields:
+            if field == 'team':
+                changed = player.team_id != (values['team'].id if values['team'] else None)
+            else:
+                changed = getattr(player, field) != values[field]
             
-            if player.date_of_birth != date_of_birth:
-                player.date_of_birth = date_of_birth
-                updated_fields.append('date_of_birth')
+            if changed:
+                setattr(player, field, values[field])
+                updated_fields.append(field)
+        
+        return updated_fields
+    
+    # Fields only TheSportsDB provides, filled when a squad player is first enriched
+    ENRICHMENT_FIELDS = ['gender', 'description', 'height', 'weight', 'wage']
+    
+    def _match_squad_players(self, parsed: Dict[str, Dict]) -> Dict[str, Player]:
+        """
+        Find the squad-only players some TheSportsDB players correspond to
+        
+        Args:
+            parsed: Parsed values of players not found by external_id, keyed by external_id
             
-            if player.position != position:
-                player.position = position
-                updated_fields.append('position')
+        Returns:
+            Matching squad-only players keyed by TheSportsDB external_id
+        """
+        team_ids = {values['team'].id for values in parsed.values() if values['team']}
+        if not team_ids:
+            return {}
+        
+        squad_players = {
+            player_name_key(player.team_id, player.name): player
+            for player in Player.objects.filter(
+                team_id__in=team_ids,
+                external_id__startswith=SQUAD_EXTERNAL_ID_PREFIX
+            )
+        }
+        
+        matches = {}
+        for external_id, values in parsed.items():
+            if values['team']:
+                player = squad_players.pop(player_name_key(values['team'].id, values['name']), None)
+                if player is not None:
+                    matches[external_id] = player
+        
+        return matches
+    
+    def _adopt_squad_player(self, player: Player, external_id: str, values: Dict) -> List[str]:
+        """
+        Give a squad-only player its TheSportsDB ID and the fields only TheSportsDB has
+        
+        Returns:
+            Names of the fields set
+        """
+        player.external_id = external_id
+        updated_fields = ['external_id']
+        
+        for field in self.ENRICHMENT_FIELDS:
+            if values[field] and getattr(player, field) != values[field]:
+                setattr(player, field, values[field])
+                updated_fields.append(field)
+        
+        return updated_fields
+    
+    def _upsert_players_batch(self, players_data: List[Dict], use_fingerprints: bool = True,
+                              fingerprint_type: str = 'player') -> Dict[str, int]:
+        """
+        Create or update a whole roster or search result at once
+        
+        Players whose payload hash matches the previous sync are skipped
+        without parsing. The others are loaded in one query and diffed in
+        memory; new players are written with one bulk_create and changed
+        players with one bulk_update, age included. Players already known
+        from a football-data squad are enriched instead of duplicated.
+        
+        Args:
+            players_data: Player data from API
+            use_fingerprints: Skip players whose payload did not change
+            fingerprint_type: Fingerprint kind, one per endpoint since payloads differ between them
             
-            if player.position_category != position_category:
-                player.position_category = position_category
-                updated_fields.append('position_category')
+        Returns:
+            Dictionary with collection statistics (unchanged players count as skipped)
+        """
+        stats = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        team_cache = {}
+        parsed = {}
+        
+        hashes = {
+            str(player_data['idPlayer']): payload_hash(player_data)
+            for player_data in players_data if player_data.get('idPlayer')
+        }
+        known_hashes = load_fingerprints(fingerprint_type, hashes) if use_fingerprints else {}
+        
+        for player_data in players_data:
+            stats['processed'] += 1
             
-            if player.status != status:
-                player.status = status
-                updated_fields.append('status')
+            external_id = str(player_data.get('idPlayer') or '')
+            if external_id and known_hashes.get(external_id) == hashes[external_id]:
+                stats['skipped'] += 1
+                continue
             
-            if player.photo_url != photo_url:
-                player.photo_url = photo_url
-                updated_fields.append('photo_url')
+            try:
+                values = self._parse_player_data(player_data, team_cache)
+                parsed[values['external_id']] = values
+            except Exception as e:
+                stats['failed'] += 1
+                logger.error(f"❌ Error processing player: {str(e)}")
+        
+        if not parsed:
+            return stats
+        
+        now = timezone.now()
+        existing = Player.objects.in_bulk(list(parsed), field_name='external_id')
+        squad_players = self._match_squad_players({
+            external_id: values for external_id, values in parsed.items() if external_id not in existing
+        })
+        new_players = []
+        changed_players = []
+        changed_fields = set()
+        
+        for external_id, values in parsed.items():
+            player = existing.get(external_id)
+            fields = []
             
-            if player.cutout_url != cutout_url:
-                player.cutout_url = cutout_url
-                updated_fields.append('cutout_url')
+            if player is None:
+                player = squad_players.get(external_id)
+                if player is None:
+                    new_players.append(Player(**values, last_sync=now))
+                    continue
+                fields = self._adopt_squad_player(player, external_id, values)
             
-            if updated_fields:
-                updated_fields.extend(['last_sync', 'updated_at'])
-                player.last_sync = timezone.now()
-                player.save(update_fields=updated_fields)
-                logger.info(f"Updated player: {name} (fields: {', '.join(updated_fields)})")
+            fields += self._apply_player_values(player, values)
+            if fields:
+                player.last_sync = now
+                player.updated_at = now
+                changed_players.append(player)
+                changed_fields.update(fields)
+            else:
+                stats['skipped'] += 1
+        
+        with transaction.atomic():
+            if new_players:
+                Player.objects.bulk_create(new_players, batch_size=500)
+            if changed_players:
+                Player.objects.bulk_update(
+                    changed_players,
+                    sorted(changed_fields) + ['last_sync', 'updated_at'],
+                    batch_size=500
+                )
+            save_fingerprints(fingerprint_type, {external_id: hashes[external_id] for external_id in parsed})
+        
+        stats['created'] += len(new_players)
+        stats['updated'] += len(changed_players)
         
-        # Update calculated age
-        if player.date_of_birth:
-            player.update_age()
+        if new_players:
+            logger.info(f"✅ Created {len(new_players)} players")
+        if changed_players:
+            logger.info(f"🔄 Updated {len(changed_players)} players (fields: {', '.join(sorted(changed_fields))})")
         
-        return player, created
+        return stats
     
     def collect_players_by_search(self, search_term: str) -> Dict:
         """
@@ -621,25 +971,8 @@ class PlayerDataCollector:
                 logger.info(f"No players found for search term: '{search_term}'")
                 return self.stats
             
-            # Process each player
-            with transaction.atomic():
-                for player_data in players_data:
-                    try:
-                        self.stats['processed'] += 1
-                        
-                        player, created = self._create_or_update_player(player_data)
-                        
-                        if created:
-                            self.stats['created'] += 1
-                            logger.info(f"✅ Created player: {player.name}")
-                        else:
-                            self.stats['updated'] += 1
-                            logger.info(f"🔄 Updated player: {player.name}")
-                    
-                    except Exception as e:
-                        self.stats['failed'] += 1
-                        logger.error(f"❌ Error processing player: {str(e)}")
-                        continue
+            # Process all players in one batch
+            self.stats = self._upsert_players_batch(players_data)
             
             # Log the operation
             execution_time = int((timezone.now() - start_time).total_seconds() * 1000)
@@ -658,6 +991,8 @@ class PlayerDataCollector:
             logger.info(f"✅ Player search completed: {self.stats}")
             return self.stats
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error in player search for '{search_term}': {str(e)}")
             self.stats['failed'] += 1
@@ -686,25 +1021,8 @@ class PlayerDataCollector:
                 logger.info(f"No players found for team: '{team_name}'")
                 return self.stats
             
-            # Process each player
-            with transaction.atomic():
-                for player_data in players_data:
-                    try:
-                        self.stats['processed'] += 1
-                        
-                        player, created = self._create_or_update_player(player_data)
-                        
-                        if created:
-                            self.stats['created'] += 1
-                            logger.info(f"✅ Created player: {player.name}")
-                        else:
-                            self.stats['updated'] += 1
-                            logger.info(f"🔄 Updated player: {player.name}")
-                    
-                    except Exception as e:
-                        self.stats['failed'] += 1
-                        logger.error(f"❌ Error processing player: {str(e)}")
-                        continue
+            # Process all players in one batch
+            self.stats = self._upsert_players_batch(players_data)
             
             # Log the operation
             execution_time = int((timezone.now() - start_time).total_seconds() * 1000)
@@ -723,50 +1041,187 @@ class PlayerDataCollector:
             logger.info(f"✅ Team players collection completed: {self.stats}")
             return self.stats
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Error collecting team players for '{team_name}': {str(e)}")
             self.stats['failed'] += 1
             return self.stats
     
-    def collect_players_for_existing_teams(self) -> Dict:
+    def collect_league_players(self, league_name: str, max_teams: Optional[int] = None,
+                               max_workers: Optional[int] = None, force: bool = False) -> Dict:
         """
-        Collect players for all teams we have in our database
+        Collect the players of every team in a league
+        
+        Rosters are written as the crawl streams them in, one transaction
+        per team, so the first teams are saved while the rest are still
+        being fetched. Rosters whose payload hash matches the previous sync
+        are skipped.
+        
+        Args:
+            league_name: Name of the league as TheSportsDB knows it
+            max_teams: Collect only the first teams of the league (None = every team)
+            max_workers: Concurrent roster fetches (defaults to PLAYER_COLLECTION_CONCURRENCY)
+            force: Process every roster and player even if unchanged
         
         Returns:
             Dictionary with collection statistics
         """
+        logger.info(f"🏆 Collecting players for league: '{league_name}'")
+        
+        start_time = timezone.now()
+        total_stats = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        teams_count = 0
+        unchanged_teams = 0
+        
+        teams = [team for team in self.client.get_league_teams(league_name) if team.get('strTeam')]
+        if max_teams is not None:
+            teams = teams[:max_teams]
+        roster_hashes = {} if force else load_fingerprints('team_roster', [team['strTeam'] for team in teams])
+        
+        for team, players_data in self.client.iter_team_rosters(teams, max_workers=max_workers):
+            team_name = team['strTeam']
+            teams_count += 1
+            
+            try:
+                with transaction.atomic():
+                    team_stats, unchanged = self._write_roster(
+                        team_name, players_data, roster_hashes.get(team_name), force
+                    )
+                unchanged_teams += unchanged
+            except Exception as e:
+                logger.error(f"❌ Error processing team '{team_name}': {str(e)}")
+                total_stats['failed'] += 1
+                continue
+            
+            for key in total_stats:
+                total_stats[key] += team_stats[key]
+            
+            logger.info(f"Team {teams_count} {team_name} written: {team_stats}")
+        
+        execution_time = int((timezone.now() - start_time).total_seconds() * 1000)
+        
+        ApiSyncLog.objects.create(
+            endpoint=f"TheSportsDB - League Players: {league_name}",
+            http_status=200,
+            records_processed=total_stats['processed'],
+            records_inserted=total_stats['created'],
+            records_updated=total_stats['updated'],
+            records_failed=total_stats['failed'],
+            execution_time_ms=execution_time,
+            sync_date=start_time
+        )
+        
+        total_stats['teams_processed'] = teams_count
+        total_stats['unchanged_teams'] = unchanged_teams
+        
+        logger.info(f"✅ League players collection completed for {teams_count} teams: {total_stats}")
+        return total_stats
+    
+    def collect_players_for_existing_teams(self, max_workers: Optional[int] = None, force: bool = False,
+                                           resume: bool = False) -> Dict:
+        """
+        Collect players for all teams we have in our database
+        
+        Rosters are fetched by a pool of worker threads while this thread
+        writes the ones already fetched. Pacing comes from the client's
+        shared rate limiter, so adding workers overlaps latency and DB
+        writes without exceeding the API limit. Rosters and players whose
+        payload hash matches the previous sync are skipped, and so are teams
+        whose football-data squad is already fully enriched. Progress is
+        checkpointed after every team, in the transaction that wrote it.
+        
+        Args:
+            max_workers: Concurrent roster fetches (defaults to PLAYER_COLLECTION_CONCURRENCY)
+            force: Process every roster and player even if unchanged
+            resume: Continue the last interrupted run instead of starting over
+        
+        Returns:
+            Dictionary with collection statistics, per-team timings and the run checkpoint
+        """
         logger.info("🏆 Collecting players for all existing teams...")
         
         start_time = timezone.now()
         total_stats = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        team_timings = []
+        unchanged_teams = 0
+        
+        # Get all teams from our database, in a fixed order for checkpoints
+        checkpoint = RunCheckpoint.start('team_players', resume=resume)
+        teams = {str(team_id): name for team_id, name in Team.objects.order_by('id').values_list('id', 'name')}
+        team_ids = checkpoint.remaining(teams)
+        
+        # Squads from football-data already give these teams their players
+        covered_teams = set() if force else self._get_enriched_squad_teams()
+        covered_ids = [team_id for team_id in team_ids if team_id in covered_teams]
+        if covered_ids:
+            checkpoint.complete(covered_ids)
+            team_ids = [team_id for team_id in team_ids if team_id not in covered_teams]
+            logger.info(f"Skipping {len(covered_ids)} teams covered by football-data squads")
         
-        # Get all teams from our database
-        teams = Team.objects.all()
-        teams_count = teams.count()
+        teams_count = len(team_ids)
+        roster_hashes = {} if force else load_fingerprints('team_roster', [teams[team_id] for team_id in team_ids])
+        max_workers = max_workers or settings.PLAYER_COLLECTION_CONCURRENCY
         
-        logger.info(f"Found {teams_count} teams to process")
+        logger.info(f"Found {teams_count} teams to process with {max_workers} workers")
         
-        for i, team in enumerate(teams, 1):
-            logger.info(f"Processing team {i}/{teams_count}: {team.name}")
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='player-collector')
+        try:
+            futures = {
+                executor.submit(self._fetch_team_players, teams[team_id]): team_id
+                for team_id in team_ids
+            }
             
-            try:
-                # Collect players for this team
-                team_stats = self.collect_team_players(team.name)
+            for i, future in enumerate(as_completed(futures), 1):
+                team_id = futures[future]
+                team_name = teams[team_id]
+                
+                try:
+                    players_data, fetch_ms = future.result()
+                    
+                    write_start = time.monotonic()
+                    
+                    with transaction.atomic():
+                        team_stats, unchanged = self._write_roster(
+                            team_name, players_data, roster_hashes.get(team_name), force
+                        )
+                        unchanged_teams += unchanged
+                        checkpoint.complete([team_id], team_stats)
+                    
+                    write_ms = int((time.monotonic() - write_start) * 1000)
+                    
+                except RateLimitExceeded:
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ Error processing team '{team_name}': {str(e)}")
+                    total_stats['failed'] += 1
+                    # Left pending so that resuming the run retries the team
+                    checkpoint.fail([team_id], {'failed': 1})
+                    continue
                 
                 # Aggregate stats
                 for key in total_stats:
                     total_stats[key] += team_stats[key]
                 
-                logger.info(f"Team {team.name} completed: {team_stats}")
-                
-                # Small delay to be respectful to the API
-                import time
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"❌ Error processing team '{team.name}': {str(e)}")
-                total_stats['failed'] += 1
-                continue
+                team_timings.append({
+                    'team': team_name,
+                    'players': len(players_data),
+                    'fetch_ms': fetch_ms,
+                    'write_ms': write_ms,
+                })
+                logger.info(
+                    f"Team {i}/{teams_count} {team_name} completed in {fetch_ms}ms fetch + "
+                    f"{write_ms}ms write: {team_stats}"
+                )
+        except BaseException as e:
+            # Keep the checkpoint so the run can be resumed
+            checkpoint.finish(error=e)
+            raise
+        finally:
+            # Stop fetching rosters nobody will write after a failure
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        checkpoint.finish()
         
         # Log the overall operation
         execution_time = int((timezone.now() - start_time).total_seconds() * 1000)
@@ -782,9 +1237,160 @@ class PlayerDataCollector:
             sync_date=start_time
         )
         
-        logger.info(f"✅ All teams players collection completed: {total_stats}")
+        logger.info(f"✅ All teams players collection completed: {total_stats} ({unchanged_teams} unchanged teams)")
+        total_stats['unchanged_teams'] = unchanged_teams
+        total_stats['covered_teams'] = len(covered_ids)
+        total_stats['teams'] = team_timings
+        total_stats['run'] = checkpoint.summary()
         return total_stats
     
+    def collect_watchlist_players(self, force: bool = False) -> Dict:
+        """
+        Refresh the players on the watchlist
+        
+        Entries without a TheSportsDB ID (none, or a squad-only football-data
+        ID) are resolved once by searching their name and keeping only the
+        best match. Every refresh then looks the players up
+        by ID (lookupplayer.php, served through the response cache) and skips
+        those whose payload did not change.
+        
+        Args:
+            force: Process every player even if its payload is unchanged
+        
+        Returns:
+            Dictionary with collection statistics and the resolved and unresolved entries
+        """
+        entries = list(PlayerWatchlistEntry.objects.filter(is_active=True))
+        logger.info(f"⭐ Refreshing {len(entries)} watchlist players")
+        
+        now = timezone.now()
+        resolved = []
+        unresolved = []
+        refreshed = []
+        payloads = []
+        
+        try:
+            for entry in entries:
+                if not entry.external_id or entry.external_id.startswith(SQUAD_EXTERNAL_ID_PREFIX):
+                    player_data = self._resolve_watchlist_entry(entry.name)
+                    if player_data is None:
+                        unresolved.append(entry.name)
+                        continue
+                    
+                    entry.external_id = str(player_data['idPlayer'])
+                    entry.resolved_at = now
+                    resolved.append(entry)
+                
+                player_data = self.client.get_player_by_id(entry.external_id)
+                if player_data:
+                    payloads.append(player_data)
+                    refreshed.append(entry.id)
+        finally:
+            # Keep the IDs resolved so far even if the API budget ran out
+            if resolved:
+                PlayerWatchlistEntry.objects.bulk_update(resolved, ['external_id', 'resolved_at'])
+        
+        stats = self._upsert_players_batch(payloads, use_fingerprints=not force, fingerprint_type='player_lookup')
+        stats['failed'] += len(entries) - len(unresolved) - len(payloads)
+        PlayerWatchlistEntry.objects.filter(id__in=refreshed).update(last_refreshed=now)
+        
+        if unresolved:
+            logger.warning(f"No TheSportsDB player found for watchlist entries: {', '.join(unresolved)}")
+        logger.info(f"✅ Watchlist refresh completed: {stats} ({len(resolved)} newly resolved)")
+        
+        stats['resolved'] = [entry.name for entry in resolved]
+        stats['unresolved'] = unresolved
+        return stats
+    
+    def _resolve_watchlist_entry(self, name: str) -> Optional[Dict]:
+        """
+        Pick the player a watchlist name refers to among the search results
+        
+        Exact name matches beat partial ones, and active players with a club
+        beat retired namesakes.
+        """
+        candidates = [
+            player_data for player_data in self.client.search_players(name)
+            if player_data.get('idPlayer') and (player_data.get('strSport') or 'Soccer') == 'Soccer'
+        ]
+        
+        target = normalize_team_name(name)
+        exact = [p for p in candidates if normalize_team_name(p.get('strPlayer') or '') == target]
+        candidates = exact or candidates
+        if not candidates:
+            return None
+        
+        def is_retired(player_data: Dict) -> bool:
+            # TheSportsDB files retired players under teams like "_Retired Soccer"
+            team = player_data.get('strTeam') or ''
+            return (player_data.get('strStatus') or '').lower() == 'retired' or not team or team.startswith('_')
+        
+        player_data = sorted(candidates, key=is_retired)[0]
+        logger.info(
+            f"Resolved watchlist entry '{name}' to {player_data.get('strPlayer')} "
+            f"({player_data['idPlayer']}, {player_data.get('strTeam')}) among {len(candidates)} candidates"
+        )
+        return player_data
+    
+    def _get_enriched_squad_teams(self) -> set:
+        """
+        Get the teams whose football-data squad players were all found on TheSportsDB
+        
+        Returns:
+            Team IDs as strings, like the checkpoint keys
+        """
+        squad_teams = set(
+            Player.objects.filter(football_data_id__isnull=False).values_list('team_id', flat=True).distinct()
+        )
+        pending_teams = set(
+            Player.objects.filter(
+                external_id__startswith=SQUAD_EXTERNAL_ID_PREFIX
+            ).values_list('team_id', flat=True).distinct()
+        )
+        return {str(team_id) for team_id in squad_teams - pending_teams if team_id is not None}
+    
+    def _write_roster(self, team_name: str, players_data: List[Dict], known_hash: Optional[str],
+                      force: bool = False) -> Tuple[Dict[str, int], bool]:
+        """
+        Write one team's roster unless it is unchanged since the last sync
+        
+        Call it inside a transaction, so the roster fingerprint is only
+        saved together with its players.
+        
+        Args:
+            team_name: Team the roster was fetched for
+            players_data: Player data from API
+            known_hash: Roster fingerprint of the previous sync
+            force: Process the roster and its players even if unchanged
+        
+        Returns:
+            Tuple of (collection statistics, whether the roster was unchanged)
+        """
+        roster_hash = payload_hash(sorted(players_data, key=lambda p: str(p.get('idPlayer'))))
+        
+        if not force and known_hash == roster_hash:
+            # Nothing changed in this roster since the last sync
+            return {
+                'processed': len(players_data), 'created': 0, 'updated': 0,
+                'failed': 0, 'skipped': len(players_data)
+            }, True
+        
+        team_stats = self._upsert_players_batch(players_data, use_fingerprints=not force)
+        if players_data and not team_stats['failed']:
+            save_fingerprints('team_roster', {team_name: roster_hash})
+        return team_stats, False
+    
+    def _fetch_team_players(self, team_name: str) -> Tuple[List[Dict], int]:
+        """
+        Fetch one roster, run from a worker thread
+        
+        Returns:
+            Tuple of (players data, fetch time in ms)
+        """
+        fetch_start = time.monotonic()
+        players_data = self.client.get_team_players(team_name) or []
+        return players_data, int((time.monotonic() - fetch_start) * 1000)
+    
     def test_api_connection(self) -> bool:
         """Test API connection"""
         return self.client.test_connection()
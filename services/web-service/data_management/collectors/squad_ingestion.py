@@ -0,0 +1,207 @@
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Player
+from data_management.collectors.fingerprints import load_fingerprints, payload_hash, save_fingerprints
+from data_management.collectors.team_resolver import normalize_team_name
+
+logger = logging.getLogger('mark_foot')
+
+# external_id of players only known from a football-data squad, until
+# TheSportsDB enrichment replaces it with the real TheSportsDB ID
+SQUAD_EXTERNAL_ID_PREFIX = 'fd-'
+
+# Player fields owned by the squad data; TheSportsDB never overwrites them
+SQUAD_FIELDS = ['team', 'nationality', 'date_of_birth', 'age', 'position', 'position_category']
+
+
+def squad_external_id(football_data_id) -> str:
+    """Get the placeholder external_id of a squad-only player"""
+    return f"{SQUAD_EXTERNAL_ID_PREFIX}{football_data_id}"
+
+
+def is_squad_only(player: Player) -> bool:
+    """Whether a player has not been enriched from TheSportsDB yet"""
+    return player.external_id.startswith(SQUAD_EXTERNAL_ID_PREFIX)
+
+
+def player_name_key(team_id: Optional[int], name: str) -> Tuple[Optional[int], str]:
+    """Key matching the same person across providers within one team"""
+    return team_id, normalize_team_name(name)
+
+
+def squad_position_category(position: str) -> str:
+    """Map football-data positions ("Goalkeeper", "Centre-Back", "Offence", ...) to categories"""
+    position = (position or '').lower()
+
+    if 'goalkeeper' in position:
+        return 'GK'
+    if 'defence' in position or 'back' in position:
+        return 'DF'
+    if 'midfield' in position:
+        return 'MF'
+    if any(word in position for word in ('offence', 'forward', 'winger', 'striker')):
+        return 'FW'
+    return ''
+
+
+def _parse_squad_member(member: Dict, team_id: int) -> Dict:
+    """Parse a squad entry into Player field values"""
+    date_of_birth = None
+    if member.get('dateOfBirth'):
+        try:
+            date_of_birth = datetime.strptime(member['dateOfBirth'][:10], '%Y-%m-%d').date()
+        except ValueError:
+            logger.warning(f"Could not parse date of birth: {member['dateOfBirth']}")
+
+    position = (member.get('position') or '').strip()
+
+    return {
+        'football_data_id': int(member['id']),
+        'name': member['name'].strip(),
+        'team_id': team_id,
+        'nationality': (member.get('nationality') or '').strip(),
+        'date_of_birth': date_of_birth,
+        'age': Player.calculate_age(date_of_birth),
+        'position': position[:50],
+        'position_category': squad_position_category(position),
+    }
+
+
+def ingest_team_squads(teams_data: List[Dict], force: bool = False) -> Dict[str, int]:
+    """
+    Upsert the players embedded in football-data team payloads
+
+    competitions/{code}/teams already returns every team's squad, keyed to
+    the exact team ID, so these players need no TheSportsDB request and no
+    name matching to find their team. Squads whose payload did not change
+    since the last sync are skipped.
+
+    Players are matched by football_data_id, then by team and name against
+    players collected from TheSportsDB before, which are linked instead of
+    duplicated. New players get a placeholder external_id until TheSportsDB
+    enrichment finds them.
+
+    Args:
+        teams_data: The 'teams' list of a competitions/{code}/teams response
+        force: Process squads even if unchanged
+
+    Returns:
+        Dictionary with collection statistics
+    """
+    stats = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+
+    squads = {
+        str(team_data['id']): team_data.get('squad') or []
+        for team_data in teams_data if team_data.get('id') and team_data.get('squad')
+    }
+    if not squads:
+        return stats
+
+    hashes = {team_id: payload_hash(squad) for team_id, squad in squads.items()}
+    known_hashes = {} if force else load_fingerprints('squad', hashes, source='football_data')
+
+    parsed = {}
+    failed_teams = set()
+    for team_id, squad in squads.items():
+        if known_hashes.get(team_id) == hashes[team_id]:
+            stats['processed'] += len(squad)
+            stats['skipped'] += len(squad)
+            continue
+
+        for member in squad:
+            stats['processed'] += 1
+            try:
+                values = _parse_squad_member(member, int(team_id))
+                parsed[values['football_data_id']] = values
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                logger.error(f"Invalid squad entry for team {team_id}: {str(e)}")
+                stats['failed'] += 1
+                failed_teams.add(team_id)
+
+    if not parsed:
+        return stats
+
+    existing = Player.objects.in_bulk(list(parsed), field_name='football_data_id')
+
+    # Players collected from TheSportsDB before their squad was known
+    unlinked = {}
+    team_ids = {values['team_id'] for football_data_id, values in parsed.items() if football_data_id not in existing}
+    if team_ids:
+        for player in Player.objects.filter(team_id__in=team_ids, football_data_id__isnull=True):
+            unlinked.setdefault(player_name_key(player.team_id, player.name), player)
+
+    now = timezone.now()
+    new_players = []
+    changed_players = []
+    changed_fields = set()
+
+    for football_data_id, values in parsed.items():
+        player = existing.get(football_data_id)
+        fields = []
+
+        if player is None:
+            player = unlinked.pop(player_name_key(values['team_id'], values['name']), None)
+            if player is None:
+                new_players.append(Player(
+                    external_id=squad_external_id(football_data_id),
+                    last_sync=now,
+                    **values
+                ))
+                continue
+
+            player.football_data_id = football_data_id
+            fields.append('football_data_id')
+
+        for field in SQUAD_FIELDS:
+            attname = 'team_id' if field == 'team' else field
+            value = values[attname]
+            # Keep what TheSportsDB had when the squad leaves a value out
+            if value in (None, '') or getattr(player, attname) == value:
+                continue
+            setattr(player, attname, value)
+            fields.append(field)
+
+        if is_squad_only(player) and player.name != values['name']:
+            player.name = values['name']
+            fields.append('name')
+
+        if fields:
+            player.last_sync = now
+            player.updated_at = now
+            changed_players.append(player)
+            changed_fields.update(fields)
+        else:
+            stats['skipped'] += 1
+
+    with transaction.atomic():
+        if new_players:
+            Player.objects.bulk_create(new_players, batch_size=500)
+        if changed_players:
+            Player.objects.bulk_update(
+                changed_players,
+                sorted(changed_fields) + ['last_sync', 'updated_at'],
+                batch_size=500
+            )
+        # Squads with invalid entries are processed again on the next sync
+        save_fingerprints(
+            'squad',
+            {
+                team_id: value for team_id, value in hashes.items()
+                if known_hashes.get(team_id) != value and team_id not in failed_teams
+            },
+            source='football_data'
+        )
+
+    stats['created'] += len(new_players)
+    stats['updated'] += len(changed_players)
+
+    logger.info(
+        f"✅ Squads ingested for {len(squads)} teams: {len(new_players)} players created, "
+        f"{len(changed_players)} updated"
+    )
+    return stats
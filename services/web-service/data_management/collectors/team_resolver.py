@@ -0,0 +1,219 @@
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from core.models import Team
+
+logger = logging.getLogger('mark_foot')
+
+# Tokens that only describe the club type and differ between providers
+# ("Manchester United FC" vs "Manchester United", "Club Atlético de Madrid")
+FILLER_TOKENS = {
+    'fc', 'cf', 'afc', 'sc', 'ac', 'as', 'cd', 'sd', 'ud', 'ssc', 'sv', 'bv', 'vfb', 'vfl',
+    'club', 'football', 'calcio', 'de', 'del', 'la', 'the', 'and',
+}
+
+# Length of the token prefixes used for fuzzy candidates
+PREFIX_LENGTH = 4
+
+# Confidence of each way a name can be matched
+CONFIDENCE = {
+    'name': 1.0,
+    'short_name': 0.95,
+    'alias': 0.95,
+    'core_name': 0.9,
+    'tla': 0.85,
+}
+
+
+def normalize_team_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, and collapse whitespace"""
+    name = unicodedata.normalize('NFKD', name or '')
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    name = name.lower().replace('&', ' and ')
+    name = re.sub(r'[^a-z0-9]+', ' ', name)
+    return ' '.join(name.split())
+
+
+def name_tokens(name: str) -> List[str]:
+    """Get the distinctive tokens of a team name"""
+    tokens = normalize_team_name(name).split()
+    core = [token for token in tokens if token not in FILLER_TOKENS]
+    return core or tokens
+
+
+class TeamNameResolver:
+    """
+    Resolve team names from other providers to Team rows without queries
+
+    Names, short names, TLAs and configured aliases are loaded once into
+    normalized hash maps, plus a token and token-prefix index for names that
+    only partly match. The index is rebuilt when the teams table changes,
+    which is checked with one aggregate query at most every refresh_interval
+    seconds.
+    """
+
+    def __init__(self, min_confidence: float = 0.6, refresh_interval: float = 300,
+                 aliases: Optional[Dict[str, str]] = None):
+        self.min_confidence = min_confidence
+        self.refresh_interval = refresh_interval
+        self.aliases = aliases if aliases is not None else getattr(settings, 'TEAM_NAME_ALIASES', {})
+        self._lock = threading.Lock()
+        self._signature = None
+        self._checked_at = 0.0
+        self._index = None
+
+    def resolve(self, team_name: str) -> Tuple[Optional[Team], float]:
+        """
+        Find the team a name refers to
+
+        Args:
+            team_name: Team name as given by an API
+
+        Returns:
+            Tuple of (Team or None, confidence between 0 and 1)
+        """
+        if not team_name or not team_name.strip():
+            return None, 0.0
+
+        index = self._get_index()
+        normalized = normalize_team_name(team_name)
+
+        for method in ('name', 'short_name', 'alias'):
+            team_id = index[method].get(normalized)
+            if team_id is not None:
+                return index['teams'][team_id], CONFIDENCE[method]
+
+        tokens = name_tokens(team_name)
+        team_id = index['core_name'].get(' '.join(tokens))
+        if team_id is not None:
+            return index['teams'][team_id], CONFIDENCE['core_name']
+
+        stripped = team_name.strip()
+        if len(stripped) == 3 and stripped.isupper():
+            team_id = index['tla'].get(stripped)
+            if team_id is not None:
+                return index['teams'][team_id], CONFIDENCE['tla']
+
+        return self._fuzzy_match(index, tokens)
+
+    def invalidate(self):
+        """Rebuild the index on the next lookup"""
+        with self._lock:
+            self._index = None
+            self._signature = None
+
+    def _fuzzy_match(self, index: Dict, tokens: List[str]) -> Tuple[Optional[Team], float]:
+        """Score the teams sharing tokens or token prefixes with the name"""
+        scores: Dict[int, float] = defaultdict(float)
+
+        for token in tokens:
+            exact = index['tokens'].get(token, set())
+            for team_id in exact:
+                scores[team_id] += 1.0
+            for team_id in index['prefixes'].get(token[:PREFIX_LENGTH], set()) - exact:
+                scores[team_id] += 0.5
+
+        if not scores:
+            return None, 0.0
+
+        ranked = sorted(
+            (
+                (score / max(len(tokens), len(index['team_tokens'][team_id])), team_id)
+                for team_id, score in scores.items()
+            ),
+            reverse=True
+        )
+        best_score, best_id = ranked[0]
+
+        # Two teams matching equally well ("United") is no match at all
+        if len(ranked) > 1 and ranked[1][0] == best_score:
+            return None, 0.0
+
+        confidence = round(best_score * 0.8, 2)
+        if confidence < self.min_confidence:
+            return None, confidence
+
+        return index['teams'][best_id], confidence
+
+    def _get_index(self) -> Dict:
+        """Get the index, rebuilding it if the teams table changed"""
+        now = time.time()
+        if self._index is not None and now - self._checked_at < self.refresh_interval:
+            return self._index
+
+        with self._lock:
+            if self._index is not None and now - self._checked_at < self.refresh_interval:
+                return self._index
+
+            signature = tuple(Team.objects.aggregate(count=Count('id'), updated=Max('updated_at')).values())
+            if self._index is None or signature != self._signature:
+                self._index = self._build_index()
+                self._signature = signature
+
+            self._checked_at = now
+            return self._index
+
+    def _build_index(self) -> Dict:
+        """Load every team into the lookup maps"""
+        teams = {team.id: team for team in Team.objects.all()}
+        index = {
+            'teams': teams,
+            'name': {},
+            'short_name': {},
+            'alias': {},
+            'core_name': {},
+            'tla': {},
+            'tokens': defaultdict(set),
+            'prefixes': defaultdict(set),
+            'team_tokens': {},
+        }
+
+        for team in teams.values():
+            # The first team keeps a name shared by several teams
+            index['name'].setdefault(normalize_team_name(team.name), team.id)
+            index['core_name'].setdefault(' '.join(name_tokens(team.name)), team.id)
+
+            if team.short_name:
+                index['short_name'].setdefault(normalize_team_name(team.short_name), team.id)
+                index['core_name'].setdefault(' '.join(name_tokens(team.short_name)), team.id)
+
+            if team.tla:
+                index['tla'].setdefault(team.tla.upper(), team.id)
+
+            tokens: Set[str] = set(name_tokens(team.name))
+            index['team_tokens'][team.id] = tokens
+            for token in tokens | set(name_tokens(team.short_name or '')):
+                index['tokens'][token].add(team.id)
+                index['prefixes'][token[:PREFIX_LENGTH]].add(team.id)
+
+        for alias, canonical in self.aliases.items():
+            team_id = index['name'].get(normalize_team_name(canonical))
+            if team_id is None:
+                team_id = index['core_name'].get(' '.join(name_tokens(canonical)))
+            if team_id is not None:
+                index['alias'][normalize_team_name(alias)] = team_id
+
+        logger.info(f"Team name index built: {len(teams)} teams, {len(index['alias'])} aliases")
+        return index
+
+
+_resolver: Optional[TeamNameResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_team_resolver() -> TeamNameResolver:
+    """Get the process-wide team name resolver"""
+    global _resolver
+
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = TeamNameResolver()
+        return _resolver
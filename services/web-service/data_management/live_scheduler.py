@@ -0,0 +1,161 @@
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from core.models import Match, ApiSyncLog
+
+logger = logging.getLogger('mark_foot')
+
+# Statuses reported by football-data while a match is being played
+LIVE_STATUSES = ('LIVE', 'IN_PLAY', 'PAUSED')
+
+# Statuses after which a match will not change any more
+FINAL_STATUSES = ('FINISHED', 'AWARDED', 'POSTPONED', 'SUSPENDED', 'CANCELLED')
+
+
+class LiveMatchScheduler:
+    """
+    Plan live match polling from the fixture calendar
+
+    Every match that is not final gets a polling window from shortly before
+    kickoff until it can no longer be running. Overlapping windows are merged.
+    Inside a window matches are polled often; outside of them nothing is
+    polled, and once every match in the horizon is final polling stops.
+    """
+
+    def __init__(self, now=None):
+        self.now = now or timezone.now()
+        self.live_interval = timedelta(seconds=settings.LIVE_SYNC_LIVE_INTERVAL)
+        self.pre_match_interval = timedelta(seconds=settings.LIVE_SYNC_PRE_MATCH_INTERVAL)
+        self.pre_kickoff = timedelta(minutes=settings.LIVE_SYNC_PRE_KICKOFF_MINUTES)
+        self.match_window = timedelta(minutes=settings.LIVE_SYNC_MATCH_WINDOW_MINUTES)
+        self.horizon = timedelta(hours=settings.LIVE_SYNC_HORIZON_HOURS)
+
+    def get_tracked_matches(self) -> List[Match]:
+        """
+        Get the matches that are not final and may be running within the horizon
+
+        Matches still reported live are kept however long ago they kicked off
+        (delays, extra time, suspensions), so they get their final score.
+        """
+        return list(
+            Match.objects.filter(
+                Q(utc_date__gte=self.now - self.match_window) | Q(status__in=LIVE_STATUSES),
+                utc_date__lte=self.now + self.horizon
+            ).exclude(
+                status__in=FINAL_STATUSES
+            ).select_related('competition').order_by('utc_date')
+        )
+
+    def match_phase(self, match: Match) -> str:
+        """Classify a tracked match as 'live', 'pre_match' or 'upcoming'"""
+        if match.status in LIVE_STATUSES or match.utc_date <= self.now:
+            return 'live'
+        if match.utc_date - self.pre_kickoff <= self.now:
+            return 'pre_match'
+        return 'upcoming'
+
+    def build_windows(self, matches: List[Match]) -> List[Dict[str, Any]]:
+        """Merge the per-match polling windows into non-overlapping windows"""
+        windows = []
+
+        for match in matches:
+            start = match.utc_date - self.pre_kickoff
+            end = match.utc_date + self.match_window
+            if match.status in LIVE_STATUSES:
+                # Still reported live past the usual length (delays, extra time)
+                end = max(end, self.now + self.live_interval)
+
+            if windows and start <= windows[-1]['end']:
+                window = windows[-1]
+                window['end'] = max(window['end'], end)
+            else:
+                window = {'start': start, 'end': end, 'matches': [], 'competitions': set()}
+                windows.append(window)
+
+            window['matches'].append(match.id)
+            window['competitions'].add(match.competition.code)
+
+        return windows
+
+    def get_last_poll(self):
+        """Get when matches were last fetched from the API"""
+        return ApiSyncLog.objects.filter(
+            endpoint='matches'
+        ).order_by('-sync_date').values_list('sync_date', flat=True).first()
+
+    def get_plan(self, last_poll=None) -> Dict[str, Any]:
+        """
+        Compute the polling plan
+
+        Args:
+            last_poll: Time of the last poll (defaults to the last matches sync log)
+
+        Returns:
+            Dictionary with the mode, poll interval, whether a poll is due and
+            the polling windows within the horizon
+        """
+        matches = self.get_tracked_matches()
+        windows = self.build_windows(matches)
+        if last_poll is None:
+            last_poll = self.get_last_poll()
+
+        phases = {'live': [], 'pre_match': [], 'upcoming': []}
+        for match in matches:
+            phases[self.match_phase(match)].append(match)
+
+        active_window = next((w for w in windows if w['start'] <= self.now <= w['end']), None)
+        next_window = next((w for w in windows if w['start'] > self.now), None)
+
+        poll_interval: Optional[timedelta] = None
+        next_poll_at = None
+
+        if phases['live']:
+            mode = 'live'
+            poll_interval = self.live_interval
+        elif active_window is not None:
+            mode = 'pre_match'
+            poll_interval = self.pre_match_interval
+        elif next_window is not None:
+            mode = 'idle'
+            next_poll_at = next_window['start']
+        else:
+            mode = 'finished'
+
+        if poll_interval is not None:
+            next_poll_at = last_poll + poll_interval if last_poll else self.now
+
+        due = poll_interval is not None and next_poll_at <= self.now
+
+        # Date range the poll must fetch so windows crossing midnight are covered
+        polled_matches = phases['live'] + phases['pre_match']
+        date_from = min(m.utc_date for m in polled_matches).date() if polled_matches else self.now.date()
+        # A kickoff just after midnight is polled the evening before
+        date_to = max([self.now] + [m.utc_date for m in polled_matches]).date()
+
+        return {
+            'generated_at': self.now.isoformat(),
+            'mode': mode,
+            'due': due,
+            'poll_interval': int(poll_interval.total_seconds()) if poll_interval else None,
+            'last_poll_at': last_poll.isoformat() if last_poll else None,
+            'next_poll_at': next_poll_at.isoformat() if next_poll_at else None,
+            'date_from': date_from.isoformat(),
+            'date_to': date_to.isoformat(),
+            'live_matches': [m.id for m in phases['live']],
+            'pre_match_matches': [m.id for m in phases['pre_match']],
+            'upcoming_matches': len(phases['upcoming']),
+            'windows': [
+                {
+                    'start': w['start'].isoformat(),
+                    'end': w['end'].isoformat(),
+                    'matches': len(w['matches']),
+                    'competitions': sorted(w['competitions']),
+                }
+                for w in windows
+            ],
+        }
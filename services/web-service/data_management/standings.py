@@ -0,0 +1,102 @@
+import logging
+from typing import Dict, Set
+
+from core.bulk import bulk_upsert
+from core.models import Standing
+
+logger = logging.getLogger('mark_foot')
+
+
+STANDING_UPDATE_FIELDS = [
+    'group_name', 'position', 'played_games', 'form', 'won', 'draw', 'lost',
+    'points', 'goals_for', 'goals_against', 'goal_difference', 'updated_at'
+]
+
+
+def standings_team_ids(standings_data: Dict) -> Set[int]:
+    """Get the IDs of every team in a standings payload, to preload them in one query"""
+    return {
+        (table_entry.get('team') or {}).get('id')
+        for standing_group in standings_data.get('standings', [])
+        for table_entry in standing_group.get('table', [])
+    } - {None}
+
+
+def build_standings(competition, season, standings_data, teams, snapshot_date):
+    """
+    Validate a standings payload and build the Standing rows in memory
+    
+    Args:
+        teams: Mapping of team ID to Team, preloaded for every table
+    
+    Returns:
+        Tuple of (standings, number of invalid table entries)
+    """
+    standings = {}
+    errors = 0
+    
+    for standing_group in standings_data.get('standings', []):
+        standing_type = standing_group.get('type', 'TOTAL')
+        stage = standing_group.get('stage') or 'REGULAR_SEASON'
+        group = standing_group.get('group')
+        
+        for table_entry in standing_group.get('table', []):
+            team_id = (table_entry.get('team') or {}).get('id')
+            team = teams.get(team_id)
+            
+            if team is None:
+                logger.warning(f"Team {team_id} not found for standings")
+                continue
+            
+            if table_entry.get('position') is None:
+                logger.error(f"Invalid standing for team {team_id}: missing position")
+                errors += 1
+                continue
+            
+            # Keyed like the unique constraint so a row is only written once
+            standings[(team.id, standing_type, stage)] = Standing(
+                competition=competition,
+                season=season,
+                team=team,
+                type=standing_type,
+                stage=stage,
+                group_name=group,
+                position=table_entry['position'],
+                played_games=table_entry.get('playedGames') or 0,
+                form=table_entry.get('form'),
+                won=table_entry.get('won') or 0,
+                draw=table_entry.get('draw') or 0,
+                lost=table_entry.get('lost') or 0,
+                points=table_entry.get('points') or 0,
+                goals_for=table_entry.get('goalsFor') or 0,
+                goals_against=table_entry.get('goalsAgainst') or 0,
+                goal_difference=table_entry.get('goalDifference') or 0,
+                snapshot_date=snapshot_date
+            )
+    
+    return list(standings.values()), errors
+
+
+def save_standings(competition, season, standings, snapshot_date):
+    """
+    Upsert one competition's standings snapshot
+    
+    Returns:
+        Tuple of (created, updated) counts
+    """
+    existing = set(Standing.objects.filter(
+        competition=competition,
+        season=season,
+        snapshot_date=snapshot_date
+    ).values_list('team_id', 'type', 'stage'))
+    
+    updated_count = sum(1 for s in standings if (s.team_id, s.type, s.stage) in existing)
+    
+    bulk_upsert(
+        Standing,
+        standings,
+        unique_fields=['competition', 'season', 'team', 'type', 'stage', 'snapshot_date'],
+        update_fields=STANDING_UPDATE_FIELDS
+    )
+    
+    return len(standings) - updated_count, updated_count
@@ -1,5 +1,24 @@
 # Import all task modules to make them discoverable by Celery
 
+# Match tasks
+from .match_tasks import (
+    sync_live_matches,
+    schedule_live_matches
+)
+
+# Competition tasks
+from .competition_tasks import (
+    sync_all_standings,
+    sync_competition_standings,
+    sync_all_teams,
+    sync_competition_teams,
+    summarize_sync_results,
+    sync_full_data,
+    summarize_full_sync,
+    health_check,
+    sync_competition_data
+)
+
 # Player data tasks
 from .player_tasks import (
     sync_player_data,
@@ -11,9 +30,22 @@ from .player_tasks import (
 
 # Make tasks available for import
 __all__ = [
+    # Match tasks
+    'sync_live_matches',
+    'schedule_live_matches',
+    # Competition tasks
+    'sync_all_standings',
+    'sync_competition_standings',
+    'sync_all_teams',
+    'sync_competition_teams',
+    'summarize_sync_results',
+    'sync_full_data',
+    'summarize_full_sync',
+    'health_check',
+    'sync_competition_data',
     # Player tasks
     'sync_player_data',
-    'sync_specific_players', 
+    'sync_specific_players',
     'sync_team_players',
     'sync_popular_players',
     'cleanup_player_data',
@@ -0,0 +1,515 @@
+from celery import shared_task, chain, chord, group
+from django.conf import settings
+from django.utils import timezone
+import logging
+
+from core.models import Competition, Season, Team, ApiSyncLog
+from core.bulk import bulk_upsert
+from api_integration.football_data_client import FootballDataAPIClient
+from api_integration.async_clients import AsyncFootballDataAPIClient, run_async
+from api_integration.rate_limiter import RateLimitExceeded
+from data_management.collectors.squad_ingestion import ingest_team_squads
+from data_management.standings import build_standings, save_standings, standings_team_ids
+from data_management.tasks.match_tasks import sync_live_matches
+
+logger = logging.getLogger('mark_foot')
+
+
+async def _fetch_competition_standings(competitions):
+    """
+    Fetch standings for {competition code: season year} concurrently
+
+    A competition that gets no rate limit slot within API_RATE_LIMIT_MAX_WAIT
+    maps to its RateLimitExceeded, so the tables that did arrive are kept.
+    """
+    async with AsyncFootballDataAPIClient(max_wait=settings.API_RATE_LIMIT_MAX_WAIT) as client:
+        return await client.get_standings_for_competitions(competitions, return_exceptions=True)
+
+
+@shared_task(bind=True, name='data_management.tasks.sync_all_standings')
+def sync_all_standings(self):
+    """
+    Sync standings for all active competitions
+    """
+    logger.info("Starting daily standings sync task")
+    
+    try:
+        today = timezone.now().date()
+        
+        # Get competitions with active seasons
+        active_competitions = Competition.objects.filter(
+            season__start_date__lte=today,
+            season__end_date__gte=today
+        ).distinct()
+        
+        # Get current season of each competition
+        current_seasons = {}
+        for competition in active_competitions:
+            season = Season.objects.filter(
+                competition=competition,
+                start_date__lte=today,
+                end_date__gte=today
+            ).first()
+            
+            if season:
+                current_seasons[competition] = season
+        
+        # Fetch every table concurrently; wall time is bounded by the API quota
+        standings_responses = run_async(_fetch_competition_standings({
+            competition.code: str(season.start_date.year)
+            for competition, season in current_seasons.items()
+        }))
+        
+        # One query for every team referenced by any table
+        teams = Team.objects.in_bulk(set().union(*(
+            standings_team_ids(response['data'])
+            for response in standings_responses.values()
+            if isinstance(response, dict) and response.get('data')
+        )))
+        
+        total_updated = 0
+        total_created = 0
+        total_errors = 0
+        rescheduled = 0
+        
+        for competition, season in current_seasons.items():
+            try:
+                logger.info(f"Syncing standings for {competition.name}")
+                
+                standings_response = standings_responses.get(competition.code)
+                
+                if isinstance(standings_response, RateLimitExceeded):
+                    # Out of budget for this table only; fetch it on its own once the budget refills
+                    logger.info(f"Standings for {competition.name} rescheduled in {standings_response.countdown}s")
+                    sync_competition_standings.apply_async((competition.id,), countdown=standings_response.countdown)
+                    rescheduled += 1
+                    continue
+                
+                if isinstance(standings_response, Exception):
+                    raise standings_response
+                
+                if not standings_response or not standings_response.get('data'):
+                    continue
+                
+                created_count, updated_count, errors = _save_standings_response(
+                    competition, season, standings_response, teams, today
+                )
+                
+                total_created += created_count
+                total_updated += updated_count
+                total_errors += errors
+                
+            except Exception as e:
+                logger.error(f"Error syncing standings for {competition.name}: {str(e)}")
+                total_errors += 1
+                
+                ApiSyncLog.objects.create(
+                    endpoint=f'competitions/{competition.code}/standings',
+                    http_status=500,
+                    error_message=str(e),
+                    sync_date=timezone.now()
+                )
+        
+        logger.info(
+            f"Standings sync completed. Created: {total_created}, Updated: {total_updated}, "
+            f"Errors: {total_errors}, Rescheduled: {rescheduled}"
+        )
+        return {"created": total_created, "updated": total_updated, "errors": total_errors, "rescheduled": rescheduled}
+        
+    except Exception as e:
+        logger.error(f"Critical error in standings sync: {str(e)}")
+        raise self.retry(exc=e, countdown=600, max_retries=3)
+
+
+TEAM_UPDATE_FIELDS = [
+    'area', 'name', 'short_name', 'tla', 'crest_url', 'address', 'website',
+    'email', 'phone', 'founded', 'club_colors', 'venue', 'updated_at'
+]
+
+
+def _current_season(competition, today=None):
+    """Get the season of a competition covering today, or its latest known season"""
+    today = today or timezone.now().date()
+    seasons = Season.objects.filter(competition=competition)
+    return (
+        seasons.filter(start_date__lte=today, end_date__gte=today).first()
+        or seasons.order_by('-start_date').first()
+    )
+
+
+def _save_standings_response(competition, season, standings_response, teams, today):
+    """
+    Validate, upsert and log one competition's standings response
+    
+    Returns:
+        Tuple of (created, updated, errors) counts
+    """
+    standings_data = standings_response['data']
+    standings, errors = build_standings(competition, season, standings_data, teams, today)
+    
+    created_count, updated_count = save_standings(competition, season, standings, today)
+    logger.info(f"Standings for {competition.name}: Created {created_count}, Updated {updated_count}")
+    
+    # Log sync
+    ApiSyncLog.objects.create(
+        endpoint=f'competitions/{competition.code}/standings',
+        http_status=standings_response.get('status_code', 200),
+        records_processed=len([t for sg in standings_data.get('standings', []) for t in sg.get('table', [])]),
+        records_inserted=created_count,
+        records_updated=updated_count,
+        records_failed=errors,
+        execution_time_ms=standings_response.get('execution_time', 0),
+        sync_date=timezone.now()
+    )
+    
+    return created_count, updated_count, errors
+
+
+@shared_task(bind=True, name='data_management.tasks.sync_competition_standings')
+def sync_competition_standings(self, competition_id):
+    """
+    Sync the standings of one competition for its current season
+    """
+    competition = Competition.objects.filter(id=competition_id).first()
+    if competition is None:
+        logger.warning(f"Competition {competition_id} not found")
+        return {"competition": competition_id, "created": 0, "updated": 0, "errors": 1}
+    
+    today = timezone.now().date()
+    season = Season.objects.filter(
+        competition=competition,
+        start_date__lte=today,
+        end_date__gte=today
+    ).first()
+    
+    if season is None:
+        logger.info(f"No active season for {competition.name}, skipping standings")
+        return {"competition": competition.code, "created": 0, "updated": 0, "errors": 0}
+    
+    try:
+        self.update_state(state='PROGRESS', meta={'competition': competition.code, 'step': 'fetching standings'})
+        
+        api_client = FootballDataAPIClient(max_wait=settings.API_RATE_LIMIT_MAX_WAIT)
+        standings_response = api_client.get_competition_standings(
+            competition.code,
+            season=str(season.start_date.year)
+        )
+        
+        if not standings_response or not standings_response.get('data'):
+            return {"competition": competition.code, "created": 0, "updated": 0, "errors": 0}
+        
+        self.update_state(state='PROGRESS', meta={'competition': competition.code, 'step': 'saving standings'})
+        
+        teams = Team.objects.in_bulk(standings_team_ids(standings_response['data']))
+        
+        created_count, updated_count, errors = _save_standings_response(
+            competition, season, standings_response, teams, today
+        )
+        
+        return {"competition": competition.code, "created": created_count, "updated": updated_count, "errors": errors}
+        
+    except RateLimitExceeded as e:
+        if self.request.retries >= settings.API_RATE_LIMIT_MAX_RESCHEDULES:
+            logger.error(f"Giving up standings sync for {competition.name}: {str(e)}")
+            return {"competition": competition.code, "created": 0, "updated": 0, "errors": 1}
+        
+        # Free the worker slot while the shared API budget refills
+        logger.info(f"Standings sync for {competition.name} rescheduled in {e.countdown}s: {str(e)}")
+        raise self.retry(exc=e, countdown=e.countdown, max_retries=settings.API_RATE_LIMIT_MAX_RESCHEDULES)
+        
+    except Exception as e:
+        # Report the failure instead of raising so the chord callback still runs
+        logger.error(f"Error syncing standings for {competition.name}: {str(e)}")
+        
+        ApiSyncLog.objects.create(
+            endpoint=f'competitions/{competition.code}/standings',
+            http_status=500,
+            error_message=str(e),
+            sync_date=timezone.now()
+        )
+        return {"competition": competition.code, "created": 0, "updated": 0, "errors": 1}
+
+
+@shared_task(bind=True, name='data_management.tasks.sync_all_teams')
+def sync_all_teams(self):
+    """
+    Weekly sync of all teams for all competitions
+    
+    Runs one sync_competition_teams subtask per competition as a chord; the
+    subtasks share the API budget through the rate limiter and reschedule
+    themselves when it runs out, so they never hold a worker while waiting.
+    """
+    logger.info("Starting weekly teams sync task")
+    
+    competition_ids = list(Competition.objects.values_list('id', flat=True))
+    if not competition_ids:
+        logger.info("No competitions, nothing to sync")
+        return {"status": "completed", "competitions": 0}
+    
+    result = chord(
+        group(sync_competition_teams.s(competition_id) for competition_id in competition_ids)
+    )(summarize_sync_results.s('Teams sync'))
+    
+    logger.info(f"Teams sync dispatched for {len(competition_ids)} competitions")
+    return {"status": "dispatched", "competitions": len(competition_ids), "result_id": result.id}
+
+
+@shared_task(bind=True, name='data_management.tasks.sync_competition_teams')
+def sync_competition_teams(self, competition_id):
+    """
+    Sync the teams of one competition for its current season
+    """
+    competition = Competition.objects.filter(id=competition_id).first()
+    if competition is None:
+        logger.warning(f"Competition {competition_id} not found")
+        return {"competition": competition_id, "created": 0, "updated": 0, "errors": 1}
+    
+    logger.info(f"Syncing teams for {competition.name}")
+    
+    try:
+        self.update_state(state='PROGRESS', meta={'competition': competition.code, 'step': 'fetching teams'})
+        
+        api_client = FootballDataAPIClient(max_wait=settings.API_RATE_LIMIT_MAX_WAIT)
+        
+        # Without a known season the API returns the current one
+        season = _current_season(competition)
+        teams_response = api_client.get_competition_teams(
+            competition.code,
+            season=str(season.start_date.year) if season else None
+        )
+        
+        if not teams_response or not teams_response.get('data'):
+            return {"competition": competition.code, "created": 0, "updated": 0, "errors": 0}
+        
+        teams_data = teams_response['data']
+        teams = {}
+        errors = 0
+        
+        for team_data in teams_data.get('teams', []):
+            if not team_data.get('id') or not team_data.get('name'):
+                logger.error(f"Invalid team data for {competition.name}: {team_data.get('id')}")
+                errors += 1
+                continue
+            
+            teams[team_data['id']] = Team(
+                id=team_data['id'],
+                name=team_data['name'],
+                short_name=team_data.get('shortName', ''),
+                tla=team_data.get('tla', ''),
+                crest_url=team_data.get('crest', ''),
+                address=team_data.get('address', ''),
+                website=team_data.get('website', ''),
+                email=team_data.get('email', ''),
+                phone=team_data.get('phone', ''),
+                founded=team_data.get('founded'),
+                club_colors=team_data.get('clubColors', ''),
+                venue=team_data.get('venue', ''),
+                area_id=competition.area_id
+            )
+        
+        self.update_state(state='PROGRESS', meta={'competition': competition.code, 'step': 'saving teams'})
+        
+        updated_count = Team.objects.filter(id__in=list(teams)).count()
+        bulk_upsert(Team, list(teams.values()), unique_fields=['id'], update_fields=TEAM_UPDATE_FIELDS)
+        created_count = len(teams) - updated_count
+        
+        logger.info(f"Teams for {competition.name}: Created {created_count}, Updated {updated_count}")
+        
+        # The same payload carries every squad, so players need no extra request
+        self.update_state(state='PROGRESS', meta={'competition': competition.code, 'step': 'saving squads'})
+        try:
+            squad_stats = ingest_team_squads(list(teams_data.get('teams', [])))
+        except Exception as e:
+            logger.error(f"Error ingesting squads for {competition.name}: {str(e)}")
+            squad_stats = {'created': 0, 'updated': 0, 'failed': 1}
+        
+        # Log sync
+        ApiSyncLog.objects.create(
+            endpoint=f'competitions/{competition.code}/teams',
+            http_status=teams_response.get('status_code', 200),
+            records_processed=len(teams_data.get('teams', [])),
+            records_inserted=created_count,
+            records_updated=updated_count,
+            records_failed=errors,
+            execution_time_ms=teams_response.get('execution_time', 0),
+            sync_date=timezone.now()
+        )
+        
+        return {
+            "competition": competition.code,
+            "created": created_count,
+            "updated": updated_count,
+            "errors": errors + squad_stats['failed'],
+            "players_created": squad_stats['created'],
+            "players_updated": squad_stats['updated'],
+        }
+        
+    except RateLimitExceeded as e:
+        if self.request.retries >= settings.API_RATE_LIMIT_MAX_RESCHEDULES:
+            logger.error(f"Giving up teams sync for {competition.name}: {str(e)}")
+            return {"competition": competition.code, "created": 0, "updated": 0, "errors": 1}
+        
+        # Free the worker slot while the shared API budget refills
+        logger.info(f"Teams sync for {competition.name} rescheduled in {e.countdown}s: {str(e)}")
+        raise self.retry(exc=e, countdown=e.countdown, max_retries=settings.API_RATE_LIMIT_MAX_RESCHEDULES)
+        
+    except Exception as e:
+        # Report the failure instead of raising so the chord callback still runs
+        logger.error(f"Error syncing teams for {competition.name}: {str(e)}")
+        return {"competition": competition.code, "created": 0, "updated": 0, "errors": 1}
+
+
+@shared_task(name='data_management.tasks.summarize_sync_results')
+def summarize_sync_results(results, label="Sync"):
+    """
+    Chord callback adding up the results of per-competition subtasks
+    """
+    results = [result for result in results if isinstance(result, dict)]
+    totals = {
+        key: sum(result.get(key, 0) for result in results)
+        for key in ("created", "updated", "errors")
+    }
+    
+    logger.info(
+        f"{label} completed. Created: {totals['created']}, Updated: {totals['updated']}, "
+        f"Errors: {totals['errors']}"
+    )
+    return {**totals, "competitions": results}
+
+
+def _full_sync_canvas(competition_ids):
+    """
+    Chord of sync_full_data
+    
+    The callback only runs once every member has returned, so chord members
+    return an error result instead of raising once they run out of retries.
+    """
+    # Standings need the competition's teams, everything else is independent
+    branches = [
+        chain(
+            sync_competition_teams.si(competition_id),
+            sync_competition_standings.si(competition_id)
+        )
+        for competition_id in competition_ids
+    ]
+    branches.append(sync_live_matches.si())
+    
+    return chord(group(branches), summarize_full_sync.s())
+
+
+@shared_task(bind=True, name='data_management.tasks.sync_full_data')
+def sync_full_data(self):
+    """
+    Monthly full data synchronization
+    
+    Builds a canvas instead of waiting on subtasks from inside this task:
+    every competition gets a teams -> standings chain, the chains run in
+    parallel with the live matches sync, and summarize_full_sync collects
+    the results once the slowest branch is done.
+    """
+    logger.info("Starting monthly full data sync task")
+    
+    try:
+        competition_ids = list(Competition.objects.values_list('id', flat=True))
+        
+        result = _full_sync_canvas(competition_ids).apply_async()
+        
+        # Keep the header so progress can be followed with GroupResult.restore()
+        result.parent.save()
+        
+        logger.info(f"Monthly full sync dispatched: {len(competition_ids) + 1} branches")
+        return {
+            "status": "dispatched",
+            "competitions": len(competition_ids),
+            "group_id": result.parent.id,
+            "result_id": result.id
+        }
+        
+    except Exception as e:
+        logger.error(f"Critical error in full data sync: {str(e)}")
+        raise self.retry(exc=e, countdown=1800, max_retries=2)
+
+
+@shared_task(name='data_management.tasks.summarize_full_sync')
+def summarize_full_sync(results):
+    """
+    Chord callback of sync_full_data
+    
+    Each competition branch ends with its standings result; the live matches
+    branch reports updated matches.
+    """
+    standings_results = [result for result in results if isinstance(result, dict) and 'competition' in result]
+    matches_result = next(
+        (result for result in results if isinstance(result, dict) and 'competition' not in result), {}
+    )
+    
+    summary = summarize_sync_results(standings_results, 'Full sync standings')
+    
+    logger.info(
+        f"Monthly full sync completed. Competitions: {len(standings_results)}, "
+        f"Matches updated: {matches_result.get('updated', 0)}"
+    )
+    return {
+        "status": "completed",
+        "standings": summary,
+        "matches": matches_result
+    }
+
+
+@shared_task(name='data_management.tasks.health_check')
+def health_check():
+    """
+    Health check task to monitor system status
+    """
+    try:
+        # Check database connectivity
+        competition_count = Competition.objects.count()
+        
+        # Check API client
+        api_client = FootballDataAPIClient()
+        
+        # Check Redis connectivity (this task running proves Redis works)
+        
+        logger.info(f"Health check passed. {competition_count} competitions in database.")
+        
+        return {
+            "status": "healthy",
+            "timestamp": timezone.now().isoformat(),
+            "competitions": competition_count
+        }
+        
+    except Exception as e:
+        logger.error(f"Health check failed: {str(e)}")
+        return {
+            "status": "unhealthy",
+            "timestamp": timezone.now().isoformat(),
+            "error": str(e)
+        }
+
+
+@shared_task(bind=True, name='data_management.tasks.sync_competition_data')
+def sync_competition_data(self, competition_code, season_year="2024", sync_type="all"):
+    """
+    Manual task to sync specific competition data
+    """
+    logger.info(f"Starting manual sync for {competition_code} - {sync_type}")
+    
+    try:
+        from django.core.management import call_command
+        
+        if sync_type == "all":
+            # Use our existing management command
+            call_command('sync_competition', competition_code, season=season_year)
+        elif sync_type == "teams":
+            call_command('sync_competition', competition_code, season=season_year, skip_matches=True, skip_standings=True)
+        elif sync_type == "matches":
+            call_command('sync_competition', competition_code, season=season_year, skip_teams=True, skip_standings=True)
+        elif sync_type == "standings":
+            call_command('sync_competition', competition_code, season=season_year, skip_teams=True, skip_matches=True)
+        
+        logger.info(f"Manual sync completed for {competition_code}")
+        return {"status": "completed", "competition": competition_code, "type": sync_type}
+        
+    except Exception as e:
+        logger.error(f"Error in manual sync for {competition_code}: {str(e)}")
+        raise self.retry(exc=e, countdown=300, max_retries=2)
@@ -0,0 +1,207 @@
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+import logging
+
+from core.models import Competition, Match, ApiSyncLog
+from api_integration.football_data_client import FootballDataAPIClient
+from api_integration.rate_limiter import RateLimitExceeded
+from api_integration.redis_backend import get_redis_client
+from data_management.live_scheduler import LiveMatchScheduler
+
+logger = logging.getLogger('mark_foot')
+
+# Retries of a live matches sync after an unexpected error
+LIVE_SYNC_MAX_RETRIES = 3
+
+@shared_task(bind=True, name='data_management.tasks.sync_live_matches')
+def sync_live_matches(self, date_from=None, date_to=None):
+    """
+    Sync matches that are currently live or scheduled for today
+    
+    Args:
+        date_from: First match date to fetch (ISO format, defaults to today)
+        date_to: Last match date to fetch (ISO format, defaults to today)
+    """
+    logger.info("Starting live matches sync task")
+    
+    try:
+        api_client = FootballDataAPIClient(max_wait=settings.API_RATE_LIMIT_MAX_WAIT)
+        today = timezone.now().date()
+        date_from = date_from or today.isoformat()
+        date_to = date_to or today.isoformat()
+        
+        # Get competitions that have active seasons
+        active_competitions = {
+            competition.id: competition
+            for competition in Competition.objects.filter(
+                season__start_date__lte=today,
+                season__end_date__gte=today
+            ).distinct()
+        }
+        
+        if not active_competitions:
+            logger.info("No active competitions, nothing to sync")
+            return {"updated": 0, "errors": 0}
+        
+        # One request for the matches of every tracked competition
+        matches_response = api_client.get_matches(
+            competitions=','.join(str(competition_id) for competition_id in active_competitions),
+            dateFrom=date_from,
+            dateTo=date_to
+        )
+        
+        matches_data = matches_response.get('data') if matches_response else None
+        
+        ApiSyncLog.objects.create(
+            endpoint='matches',
+            http_status=matches_response.get('status_code') if matches_response else None,
+            records_processed=len(matches_data.get('matches', [])) if matches_data else 0,
+            execution_time_ms=matches_response.get('execution_time', 0) if matches_response else 0,
+            error_message=matches_response.get('error') if matches_response else None,
+            request_params={
+                'competitions': [competition.code for competition in active_competitions.values()],
+                'dateFrom': date_from,
+                'dateTo': date_to,
+            },
+            sync_date=timezone.now()
+        )
+        
+        if not matches_data:
+            logger.info("No matches data available for today")
+            return {"updated": 0, "errors": 0}
+        
+        payload_matches = [
+            match_data for match_data in matches_data.get('matches', [])
+            if (match_data.get('competition') or {}).get('id') in active_competitions
+        ]
+        
+        # One query for every match in the payload, then diff in memory
+        existing_matches = Match.objects.in_bulk([match_data['id'] for match_data in payload_matches])
+        
+        changed_matches = []
+        changed_fields = set()
+        unchanged_count = 0
+        missing_count = 0
+        total_errors = 0
+        now = timezone.now()
+        
+        for match_data in payload_matches:
+            match = existing_matches.get(match_data['id'])
+            if match is None:
+                logger.warning(f"Match {match_data['id']} not found in database")
+                missing_count += 1
+                continue
+            
+            try:
+                fields = _apply_live_match_data(match, match_data)
+            except Exception as e:
+                logger.error(f"Error updating match {match_data['id']}: {str(e)}")
+                total_errors += 1
+                continue
+            
+            if fields:
+                # bulk_update skips auto_now, so stamp the change explicitly
+                match.updated_at = now
+                match.last_updated = now
+                changed_matches.append(match)
+                changed_fields.update(fields)
+            else:
+                unchanged_count += 1
+        
+        if changed_matches:
+            Match.objects.bulk_update(
+                changed_matches, sorted(changed_fields) + ['last_updated', 'updated_at'], batch_size=500
+            )
+        
+        logger.info(
+            f"Live matches sync completed. Changed: {len(changed_matches)}, Unchanged: {unchanged_count}, "
+            f"Missing: {missing_count}, Errors: {total_errors}"
+        )
+        return {
+            "updated": len(changed_matches),
+            "unchanged": unchanged_count,
+            "missing": missing_count,
+            "errors": total_errors
+        }
+        
+    except RateLimitExceeded as e:
+        # Report instead of raising on the last attempt so the full sync chord callback still runs
+        if self.request.retries >= settings.API_RATE_LIMIT_MAX_RESCHEDULES:
+            logger.error(f"Giving up live matches sync: {str(e)}")
+            return {"updated": 0, "errors": 1}
+        
+        # Free the worker slot while the shared API budget refills
+        logger.info(f"Live matches sync rescheduled in {e.countdown}s: {str(e)}")
+        raise self.retry(exc=e, countdown=e.countdown, max_retries=settings.API_RATE_LIMIT_MAX_RESCHEDULES)
+        
+    except Exception as e:
+        logger.error(f"Critical error in live matches sync: {str(e)}")
+        if self.request.retries >= LIVE_SYNC_MAX_RETRIES:
+            return {"updated": 0, "errors": 1}
+        raise self.retry(exc=e, countdown=300, max_retries=LIVE_SYNC_MAX_RETRIES)
+
+
+def _apply_live_match_data(match, match_data):
+    """
+    Copy status, score and winner from an API payload onto a match
+    
+    Returns:
+        Names of the fields whose value changed
+    """
+    values = {'status': match_data.get('status', match.status)}
+    
+    full_time = (match_data.get('score') or {}).get('fullTime') or {}
+    if full_time.get('home') is not None:
+        values['home_team_score'] = full_time['home']
+        values['away_team_score'] = full_time.get('away')
+        values['winner'] = match_data['score'].get('winner')
+    
+    changed = []
+    for field, value in values.items():
+        if getattr(match, field) != value:
+            setattr(match, field, value)
+            changed.append(field)
+    return changed
+
+
+@shared_task(name='data_management.tasks.schedule_live_matches')
+def schedule_live_matches():
+    """
+    Dispatch a live matches sync when the fixture calendar calls for one
+    
+    Runs every minute from beat but only reads the database; the API is only
+    hit through sync_live_matches while matches are live or about to start.
+    """
+    plan = LiveMatchScheduler().get_plan()
+    
+    if plan['due'] and _claim_live_poll(plan['poll_interval']):
+        sync_live_matches.delay(date_from=plan['date_from'], date_to=plan['date_to'])
+        logger.info(
+            f"Live matches sync dispatched ({plan['mode']}, {len(plan['live_matches'])} live, "
+            f"every {plan['poll_interval']}s)"
+        )
+        plan['dispatched'] = True
+    else:
+        plan['dispatched'] = False
+    
+    return plan
+
+
+def _claim_live_poll(poll_interval):
+    """
+    Make sure only one sync is dispatched per poll interval
+    
+    The last poll time comes from the sync log, which is only written once the
+    dispatched sync has run; without this a queued or rescheduled sync would be
+    dispatched again every minute.
+    """
+    client = get_redis_client()
+    if client is None:
+        return True
+    
+    try:
+        return bool(client.set('mark_foot:live_matches:dispatched', '1', nx=True, ex=max(1, poll_interval - 5)))
+    except Exception as e:
+        logger.warning(f"Could not claim live matches poll: {str(e)}")
+        return True
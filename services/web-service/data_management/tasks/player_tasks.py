@@ -4,13 +4,14 @@ from django.conf import settings
 import logging
 
 from data_management.collectors.player_collector import PlayerDataCollector
+from api_integration.rate_limiter import RateLimitExceeded
 from core.models import ApiSyncLog, Team
 
 logger = logging.getLogger('mark_foot')
 
 
 @shared_task(bind=True, name='sync_player_data')
-def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
+def sync_player_data(self, search_terms=None, team_names=None, api_key=None, resume=False):
     """
     Celery task to synchronize player data from TheSportsDB API
     
@@ -18,6 +19,7 @@ def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
         search_terms (list): List of player names to search for
         team_names (list): List of team names to collect players for
         api_key (str): Optional API key for premium features
+        resume (bool): Continue the last interrupted all-teams run from its checkpoint
     """
     start_time = timezone.now()
     
@@ -32,7 +34,10 @@ def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
     
     try:
         # Initialize collector
-        collector = PlayerDataCollector(api_key=api_key)
+        collector = PlayerDataCollector(
+            api_key=api_key,
+            max_wait=settings.API_RATE_LIMIT_MAX_WAIT
+        )
         
         total_stats = {
             'processed': 0,
@@ -42,9 +47,9 @@ def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
             'skipped': 0
         }
         
-        # Test API connection
-        if not collector.test_api_connection():
-            raise Exception("Failed to connect to TheSportsDB API")
+        # Cached health from recent requests; the API is only probed when there were none
+        if not collector.client.is_available():
+            raise Exception("TheSportsDB API is unavailable")
         
         logger.info("🏆 Starting player data synchronization")
         
@@ -62,6 +67,8 @@ def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
                     
                     logger.info(f"✅ Search '{search_term}' completed: {stats}")
                     
+                except RateLimitExceeded:
+                    raise
                 except Exception as e:
                     logger.error(f"❌ Error searching for '{search_term}': {str(e)}")
                     total_stats['failed'] += 1
@@ -80,6 +87,8 @@ def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
                     
                     logger.info(f"✅ Team '{team_name}' completed: {stats}")
                     
+                except RateLimitExceeded:
+                    raise
                 except Exception as e:
                     logger.error(f"❌ Error collecting team '{team_name}': {str(e)}")
                     total_stats['failed'] += 1
@@ -89,13 +98,15 @@ def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
             logger.info("🏆 Syncing players for all existing teams")
             
             try:
-                stats = collector.collect_players_for_existing_teams()
+                stats = collector.collect_players_for_existing_teams(resume=resume)
                 
                 # Use team stats as total stats
                 total_stats = stats
                 
                 logger.info(f"✅ All teams sync completed: {stats}")
                 
+            except RateLimitExceeded:
+                raise
             except Exception as e:
                 logger.error(f"❌ Error syncing all teams: {str(e)}")
                 total_stats['failed'] += 1
@@ -140,6 +151,23 @@ def sync_player_data(self, search_terms=None, team_names=None, api_key=None):
             'success_rate': success_rate
         }
         
+    except RateLimitExceeded as e:
+        # Free the worker slot and run again once the API budget has refilled
+        sync_log.status = 'rescheduled'
+        sync_log.completed_at = timezone.now()
+        sync_log.duration_seconds = (timezone.now() - start_time).total_seconds()
+        sync_log.error_message = str(e)
+        sync_log.save()
+        
+        logger.info(f"⏳ Player sync rescheduled in {e.countdown}s: {str(e)}")
+        # The retry continues from the checkpoint instead of starting over
+        raise self.retry(
+            exc=e,
+            countdown=e.countdown,
+            max_retries=settings.API_RATE_LIMIT_MAX_RESCHEDULES,
+            kwargs={**(self.request.kwargs or {}), 'resume': True}
+        )
+        
     except Exception as e:
         # Update sync log with error
         sync_log.status = 'failed'
@@ -171,7 +199,7 @@ def sync_specific_players(self, player_names, api_key=None):
 
 
 @shared_task(bind=True, name='sync_team_players')
-def sync_team_players(self, team_names=None, api_key=None):
+def sync_team_players(self, team_names=None, api_key=None, resume=False):
     """
     Celery task to sync players for specific teams
     
@@ -179,46 +207,47 @@ def sync_team_players(self, team_names=None, api_key=None):
         team_names (list): List of team names to collect players for.
                           If None, syncs for all teams in database
         api_key (str): Optional API key for premium features
+        resume (bool): Continue the last interrupted all-teams run from its checkpoint
     """
     logger.info(f"🏆 Starting team players sync for: {team_names or 'all teams'}")
     
     return sync_player_data.apply_async(
-        args=[None, team_names, api_key]
+        args=[None, team_names, api_key],
+        kwargs={'resume': resume}
     )
 
 
 @shared_task(bind=True, name='sync_popular_players')
-def sync_popular_players(self, api_key=None):
+def sync_popular_players(self, api_key=None, force=False):
     """
-    Celery task to sync popular/famous players
+    Celery task to refresh the players on the watchlist
+    
+    Names are resolved to TheSportsDB IDs once; refreshes look players up
+    by ID and skip unchanged payloads. Manage the list with the admin or
+    the player_manager watchlist actions.
     
     Args:
         api_key (str): Optional API key for premium features
+        force (bool): Process every player even if its payload is unchanged
     """
-    # List of popular players to sync
-    popular_players = [
-        "Lionel Messi",
-        "Cristiano Ronaldo", 
-        "Kylian Mbappe",
-        "Neymar",
-        "Erling Haaland",
-        "Kevin De Bruyne",
-        "Mohamed Salah",
-        "Robert Lewandowski",
-        "Luka Modric",
-        "Virgil van Dijk",
-        "Sadio Mane",
-        "Harry Kane",
-        "Sergio Ramos",
-        "Karim Benzema",
-        "N'Golo Kante"
-    ]
+    logger.info("⭐ Starting popular players sync from the watchlist")
     
-    logger.info(f"⭐ Starting popular players sync: {len(popular_players)} players")
+    try:
+        collector = PlayerDataCollector(
+            api_key=api_key,
+            max_wait=settings.API_RATE_LIMIT_MAX_WAIT
+        )
+        stats = collector.collect_watchlist_players(force=force)
+        
+    except RateLimitExceeded as e:
+        # Entries resolved so far are kept, so the retry only looks players up
+        logger.info(f"⏳ Popular players sync rescheduled in {e.countdown}s: {str(e)}")
+        raise self.retry(exc=e, countdown=e.countdown, max_retries=settings.API_RATE_LIMIT_MAX_RESCHEDULES)
     
-    return sync_player_data.apply_async(
-        args=[popular_players, None, api_key]
-    )
+    return {
+        'status': 'success',
+        'stats': stats
+    }
 
 
 @shared_task(bind=True, name='cleanup_player_data')
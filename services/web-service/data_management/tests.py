@@ -1,3 +1,77 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from api_integration.rate_limiter import RateLimitExceeded
+from core.models import Competition, Season
+from data_management.tasks import sync_competition_standings, sync_competition_teams, sync_live_matches
+from data_management.tasks.competition_tasks import _full_sync_canvas
+from mark_foot_backend.celery import app
+
+
+class TaskRegistrationTests(SimpleTestCase):
+    def setUp(self):
+        app.loader.import_default_modules()
+
+    def test_live_match_tasks_are_registered(self):
+        self.assertIn('data_management.tasks.schedule_live_matches', app.tasks)
+        self.assertIn('data_management.tasks.sync_live_matches', app.tasks)
+
+    def test_beat_schedule_tasks_are_registered(self):
+        for entry, options in app.conf.beat_schedule.items():
+            with self.subTest(entry=entry):
+                self.assertIn(options['task'], app.tasks)
+
+
+@override_settings(API_RATE_LIMIT_MAX_RESCHEDULES=0)
+class FullSyncCanvasTests(TestCase):
+    def setUp(self):
+        today = timezone.now().date()
+        self.competition = Competition.objects.create(id=2021, name='Premier League', code='PL', type='LEAGUE')
+        Season.objects.create(
+            competition=self.competition,
+            start_date=today - timedelta(days=30),
+            end_date=today + timedelta(days=30)
+        )
+
+        self.api_client = mock.Mock()
+        self.api_client.get_competition_teams.return_value = {'data': None}
+        self.api_client.get_competition_standings.return_value = {'data': None}
+        self.api_client.get_matches.return_value = {'data': None, 'status_code': 200}
+
+        for patcher in (
+            mock.patch('data_management.tasks.competition_tasks.FootballDataAPIClient', return_value=self.api_client),
+            mock.patch('data_management.tasks.match_tasks.FootballDataAPIClient', return_value=self.api_client),
+            # Eager runs have no result backend to report progress to
+            mock.patch.object(sync_competition_teams, 'update_state'),
+            mock.patch.object(sync_competition_standings, 'update_state'),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_callback_runs_when_standings_give_up(self):
+        self.api_client.get_competition_standings.side_effect = RateLimitExceeded('football_data', 30)
+
+        summary = _full_sync_canvas([self.competition.id]).apply().get()
+
+        self.assertEqual(summary['status'], 'completed')
+        self.assertEqual(summary['standings']['errors'], 1)
+        self.assertEqual(summary['matches']['errors'], 0)
+
+    def test_callback_runs_when_live_sync_gives_up(self):
+        self.api_client.get_matches.side_effect = RateLimitExceeded('football_data', 30)
+
+        summary = _full_sync_canvas([self.competition.id]).apply().get()
+
+        self.assertEqual(summary['status'], 'completed')
+        self.assertEqual(summary['standings']['errors'], 0)
+        self.assertEqual(summary['matches']['errors'], 1)
+
+    def test_live_sync_gives_up_instead_of_raising(self):
+        self.api_client.get_matches.side_effect = RateLimitExceeded('football_data', 30)
+
+        result = sync_live_matches.apply().get()
+
+        self.assertEqual(result, {'updated': 0, 'errors': 1})
@@ -17,10 +17,11 @@ app.autodiscover_tasks()
 
 # Celery Beat configuration
 app.conf.beat_schedule = {
-    # Sync matches every 30 minutes during match days
-    'sync-live-matches': {
-        'task': 'data_management.tasks.sync_live_matches',
-        'schedule': 30.0 * 60,  # 30 minutes
+    # Check the fixture calendar every minute; live matches are only
+    # fetched while they are being played or about to kick off
+    'schedule-live-matches': {
+        'task': 'data_management.tasks.schedule_live_matches',
+        'schedule': 60.0,  # 1 minute
     },
     # Sync standings daily at 2 AM
     'sync-daily-standings': {
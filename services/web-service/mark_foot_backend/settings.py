@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 from pathlib import Path
 import os
-from decouple import config
+from decouple import Choices, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -218,6 +218,97 @@ FOOTBALL_DATA_API_KEY = config('FOOTBALL_DATA_API_KEY', default='e87bfe5dea1746a
 FOOTBALL_DATA_BASE_URL = config('FOOTBALL_DATA_BASE_URL', default='https://api.football-data.org/v4')
 FOOTBALL_DATA_RATE_LIMIT = config('FOOTBALL_DATA_RATE_LIMIT', default=10, cast=int)
 
+# TheSportsDB Settings - without a key the shared free tier is used
+THESPORTSDB_API_KEY = config('THESPORTSDB_API_KEY', default='')
+# Requests per minute, spaced evenly, for every client in every worker; raise the premium one to your plan
+THESPORTSDB_FREE_RATE_LIMIT = config('THESPORTSDB_FREE_RATE_LIMIT', default=120, cast=int)
+THESPORTSDB_PREMIUM_RATE_LIMIT = config('THESPORTSDB_PREMIUM_RATE_LIMIT', default=120, cast=int)
+# Image downloads and checks against TheSportsDB's media server
+THESPORTSDB_MEDIA_RATE_LIMIT = config('THESPORTSDB_MEDIA_RATE_LIMIT', default=120, cast=int)
+
+# Shared API state (rate limit windows) - 'redis' shares it across workers, 'local' keeps it in-process
+API_STATE_BACKEND = config('API_STATE_BACKEND', default='redis', cast=Choices(['redis', 'local']))
+API_STATE_REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
+
+# Celery tasks sleep at most this long for a rate limit slot, otherwise they are re-queued
+API_RATE_LIMIT_MAX_WAIT = config('API_RATE_LIMIT_MAX_WAIT', default=5, cast=float)
+API_RATE_LIMIT_MAX_RESCHEDULES = config('API_RATE_LIMIT_MAX_RESCHEDULES', default=20, cast=int)
+
+# Let concurrent identical GETs in different workers share one upstream request (needs Redis)
+API_SINGLE_FLIGHT_CROSS_PROCESS = config('API_SINGLE_FLIGHT_CROSS_PROCESS', default=True, cast=bool)
+
+# Concurrent requests per async API client (pacing still comes from the shared limiter)
+API_ASYNC_MAX_CONCURRENCY = config('API_ASYNC_MAX_CONCURRENCY', default=4, cast=int)
+
+# API health comes from real requests: outcomes older than the TTL (seconds) are ignored,
+# and this many failures in a row make the API unhealthy despite an earlier success
+API_HEALTH_TTL = config('API_HEALTH_TTL', default=300, cast=int)
+API_HEALTH_FAILURE_THRESHOLD = config('API_HEALTH_FAILURE_THRESHOLD', default=3, cast=int)
+
+# Concurrent roster fetches when collecting players for every team
+PLAYER_COLLECTION_CONCURRENCY = config('PLAYER_COLLECTION_CONCURRENCY', default=4, cast=int)
+
+# Unchanged API payloads are skipped, but fully processed again after this many days
+SYNC_FINGERPRINT_MAX_AGE_DAYS = config('SYNC_FINGERPRINT_MAX_AGE_DAYS', default=30, cast=int)
+
+# Team names used by other providers that normalization alone does not match,
+# mapped to the football-data team name
+TEAM_NAME_ALIASES = {
+    'Inter Milan': 'FC Internazionale Milano',
+    'Inter': 'FC Internazionale Milano',
+    'Bayern Munich': 'FC Bayern München',
+    'Paris SG': 'Paris Saint-Germain FC',
+    'PSG': 'Paris Saint-Germain FC',
+    'Spurs': 'Tottenham Hotspur FC',
+    'Tottenham': 'Tottenham Hotspur FC',
+    'Wolves': 'Wolverhampton Wanderers FC',
+    'Man United': 'Manchester United FC',
+    'Man City': 'Manchester City FC',
+    'Atletico Madrid': 'Club Atlético de Madrid',
+    'Athletic Bilbao': 'Athletic Club',
+    'Juventus': 'Juventus FC',
+    'Napoli': 'SSC Napoli',
+    'Roma': 'AS Roma',
+}
+
+# Live match polling, planned from the fixture calendar
+LIVE_SYNC_LIVE_INTERVAL = config('LIVE_SYNC_LIVE_INTERVAL', default=120, cast=int)  # Seconds between polls while matches are live
+LIVE_SYNC_PRE_MATCH_INTERVAL = config('LIVE_SYNC_PRE_MATCH_INTERVAL', default=600, cast=int)  # Seconds between polls before kickoff
+LIVE_SYNC_PRE_KICKOFF_MINUTES = 15  # Start polling this long before kickoff
+LIVE_SYNC_MATCH_WINDOW_MINUTES = 180  # Poll an unfinished match for this long after kickoff
+LIVE_SYNC_HORIZON_HOURS = 24  # How far ahead the plan looks
+
+# API response cache - 'file', 'redis' or 'none'
+API_CACHE_BACKEND = config('API_CACHE_BACKEND', default='file')
+API_CACHE_DIR = os.path.join(BASE_DIR, 'storage', 'api_cache')
+API_CACHE_DEFAULT_TTL = 0  # Seconds; 0 always revalidates with a conditional request
+API_CACHE_MAX_AGE = 7 * 24 * 3600  # Keep entries this long for revalidation
+
+# Per-endpoint TTLs in seconds, first matching pattern wins
+API_CACHE_TTLS = {
+    'football_data': {
+        'areas': 7 * 24 * 3600,
+        'areas/*': 7 * 24 * 3600,
+        'competitions': 24 * 3600,
+        'competitions/*/teams': 24 * 3600,
+        'competitions/*/standings': 15 * 60,
+        'competitions/*/matches': 0,
+        'competitions/*': 24 * 3600,
+        'teams/*/matches': 0,
+        'teams/*': 24 * 3600,
+        'matches*': 0,
+    },
+    'thesportsdb': {
+        'lookupplayer.php': 12 * 3600,  # Shorter than the daily watchlist refresh
+        'lookuptransfers.php': 24 * 3600,
+        'lookupcareer.php': 7 * 24 * 3600,
+        'lookupmilestones.php': 7 * 24 * 3600,
+        'lookupstats.php': 24 * 3600,
+        'searchplayers.php': 6 * 3600,
+        'searchteams.php': 24 * 3600,
+    },
+}
+
 # Logging
 LOGGING = {
     'version': 1,